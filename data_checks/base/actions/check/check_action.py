@@ -21,6 +21,14 @@ class CheckAction(ActionBase):
         """
         return
 
+    @staticmethod
+    def skips(check: CheckBase, context: ExecutionContext) -> bool:
+        """
+        Whether before would skip the rule, without executing before. Rules sharing
+        work with other rules use it to leave out the rules that will not run
+        """
+        return False
+
     @staticmethod
     def on_success(check: CheckBase, context: ExecutionContext) -> None:
         """
@@ -13,7 +13,10 @@ from data_checks.database.managers import (
 )
 
 """
-Action that deals with creating the rows related to the execution of check and rules in the database
+Action that deals with creating the rows related to the execution of check and rules in the database.
+An execution is stored as running when the rule starts and updated with its final status and logs.
+Failures identical to one already seen in the run do not store their traceback again, they are
+counted in their failure group instead (see FailureGroupsDatabaseAction).
 """
 
 
@@ -24,26 +27,13 @@ class ExecutionDatabaseAction(CheckAction):
 
     @staticmethod
     def before(check, context):
-        rule = context.get_sys("rule")
-        params = context.get_sys("params")
-
-        rule = RuleManager.latest(
-            suite_name=None
-            if check._internal["suite_model"] is None
-            else check._internal["suite_model"].name,
-            check_name=check.name,
-            name=rule,
-            params=json.dumps(params, default=str),
-        )
+        rule = ExecutionDatabaseAction._get_rule_model(check, context)
 
         if not rule:
             return
 
-        rule_config = json.loads(rule.config) if rule.config else {}
-        silenced_until = rule_config.get("silenced_until", None)
-        if silenced_until and pd.to_datetime(silenced_until) > datetime.now(
-            tz=timezone.utc
-        ):
+        silenced_until = ExecutionDatabaseAction._get_silenced_until(rule)
+        if silenced_until:
             raise SkipExecutionException(
                 f"Rule {rule.name} is silenced until {silenced_until}"
             )
@@ -53,7 +43,7 @@ class ExecutionDatabaseAction(CheckAction):
         new_rule_execution = RuleExecutionManager.create_execution(
             rule=rule,
             status="running",
-            params=json.dumps(params, default=str),
+            params=json.dumps(context.get_sys("params"), default=str),
         )
 
         rule_output = StringIO()
@@ -62,6 +52,16 @@ class ExecutionDatabaseAction(CheckAction):
         sys.stdout = rule_output
         context.set_sys("exec_id", new_rule_execution.id)
 
+    @staticmethod
+    def skips(check, context) -> bool:
+        """
+        Silenced rules are skipped
+        """
+        rule = ExecutionDatabaseAction._get_rule_model(check, context)
+        return (
+            bool(rule) and ExecutionDatabaseAction._get_silenced_until(rule) is not None
+        )
+
     @staticmethod
     def on_success(check, context):
         """
@@ -69,12 +69,13 @@ class ExecutionDatabaseAction(CheckAction):
         """
         if "exec_id" not in context["sys"]:
             return
-        exec_id = context.get_sys("exec_id")
         RuleExecutionManager.update_execution(
-            execution_id=exec_id,
+            execution_id=context.get_sys("exec_id"),
+            finished_at=datetime.now(),
             status="success",
-            logs="",
+            logs=context.get_sys("output").getvalue(),
         )
+        context.set_sys("execution_status", "success")
 
     @staticmethod
     def on_failure(check, context):
@@ -83,35 +84,69 @@ class ExecutionDatabaseAction(CheckAction):
         """
         if "exec_id" not in context["sys"]:
             return
-        exec_id = context.get_sys("exec_id")
         exception: DataCheckException = context.get_sys("exception")
+        if context.get_sys("duplicate_failure"):
+            # The full traceback is only stored once per group of identical failures
+            traceback_text = f"Identical to failure {context.get_sys('fingerprint')}"
+        elif exception.exception:
+            traceback_text = "\n".join(
+                traceback.format_tb(exception.exception.__traceback__)
+            )
+        else:
+            traceback_text = None
         RuleExecutionManager.update_execution(
-            execution_id=exec_id,
+            execution_id=context.get_sys("exec_id"),
+            finished_at=datetime.now(),
             status="failure",
-            logs="",
-            traceback="\n".join(traceback.format_tb(exception.exception.__traceback__))
-            if exception.exception
-            else None,
+            logs=context.get_sys("output").getvalue(),
+            traceback=traceback_text,
             exception=exception.toJSON(),
         )
+        context.set_sys("execution_status", "failure")
 
     @staticmethod
     def after(check, context):
         """
-        Executes after each child run
+        Executes after each child run, including the runs skipped by a later action
         """
         sys.stdout = sys.__stdout__
         if "exec_id" not in context["sys"]:
             return
-        exec_id = context.get_sys("exec_id")
-
-        logs = ""
-        if exec_id and "output" in context["sys"]:
-            logs = context.get_sys("output").getvalue()
-            if logs.strip() != "":
-                print(logs)
+        if "execution_status" not in context["sys"]:
+            # Skipped by another action after the execution was stored
+            RuleExecutionManager.update_execution(
+                execution_id=context.get_sys("exec_id"),
+                finished_at=datetime.now(),
+                status="skipped",
+            )
+        # The logs are stored with the execution
+        logs = context.get_sys("output").getvalue()
+        if logs.strip() != "":
+            print(logs)
 
-        RuleExecutionManager.update_execution(
-            execution_id=exec_id,
-            logs=logs,
+    @staticmethod
+    def _get_rule_model(check, context):
+        """
+        Internal: Latest version of the rule of the context in the database
+        """
+        return RuleManager.latest(
+            suite_name=None
+            if check._internal["suite_model"] is None
+            else check._internal["suite_model"].name,
+            check_name=check.name,
+            name=context.get_sys("rule"),
+            params=json.dumps(context.get_sys("params"), default=str),
         )
+
+    @staticmethod
+    def _get_silenced_until(rule):
+        """
+        Internal: End of the silence of the rule, None if it is not silenced
+        """
+        rule_config = json.loads(rule.config) if rule.config else {}
+        silenced_until = rule_config.get("silenced_until", None)
+        if silenced_until and pd.to_datetime(silenced_until) > datetime.now(
+            tz=timezone.utc
+        ):
+            return silenced_until
+        return None
@@ -28,6 +28,10 @@ class RuleAlertingAction(CheckAction):
 
     @staticmethod
     def on_failure(check: CheckBase, context) -> None:
+        if context.get_sys("duplicate_failure"):
+            # Only alert once per group of identical failures in a run
+            return
+
         rule_execution_id = None
         if "exec_id" in context["sys"]:
             rule_execution_id = context.get_sys("exec_id")
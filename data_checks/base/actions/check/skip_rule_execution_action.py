@@ -12,3 +12,7 @@ class SkipRuleExecutionAction(CheckAction):
     @staticmethod
     def before(check: CheckBase, context) -> None:
         raise SkipExecutionException("Skipping rule execution")
+
+    @staticmethod
+    def skips(check: CheckBase, context) -> bool:
+        return True
@@ -10,3 +10,6 @@ from data_checks.base.actions.suite.find_suite_model_action import FindSuiteMode
 from data_checks.base.actions.suite.update_check_from_internals_action import (
     UpdateCheckFromInternalsAction,
 )
+from data_checks.base.actions.suite.failure_groups_database_action import (
+    FailureGroupsDatabaseAction,
+)
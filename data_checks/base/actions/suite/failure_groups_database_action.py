@@ -0,0 +1,29 @@
+"""
+Action that stores the groups of identical rule failures of a suite run in the database
+"""
+import json
+from data_checks.base.actions.suite.suite_action import SuiteAction
+from data_checks.base.suite_types import SuiteBase
+from data_checks.database.managers import FailureGroupManager
+
+
+class FailureGroupsDatabaseAction(SuiteAction):
+    @staticmethod
+    def teardown(suite: SuiteBase) -> None:
+        suite_id = (
+            None
+            if suite._internal["suite_model"] is None
+            else suite._internal["suite_model"].id
+        )
+        for failure_group in suite._internal["failure_groups"].values():
+            FailureGroupManager.create_failure_group(
+                fingerprint=failure_group["fingerprint"],
+                rule_name=failure_group["rule"],
+                count=failure_group["count"],
+                suite_id=suite_id,
+                exception_type=failure_group["exception_type"],
+                message=failure_group["message"],
+                exception=failure_group["exception"],
+                traceback=failure_group["traceback"],
+                sample_keys=json.dumps(failure_group["sample_keys"], default=str),
+            )
@@ -1,16 +1,25 @@
 """
 Check class
 """
+import json
 import time
-from typing import Iterable, Optional, Callable
+from typing import Any, Iterable, Optional, Callable, TYPE_CHECKING
 from multiprocessing import Process
 from data_checks.base.exceptions import DataCheckException, SkipExecutionException
-from data_checks.base.check_types import FunctionArgs, CheckBase
+from data_checks.base.check_types import FunctionArgs, CheckBase, RuleResult
 from data_checks.base.suite_helper_types import SuiteInternal
 from data_checks.base.mixins.action_mixin import ActionMixin
-from data_checks.utils import class_utils, check_utils
+from data_checks.base.failure_groups import FailureGroups, shared_failure_groups
+from data_checks.base.fixture import fixture_scopes
+from data_checks.base.soft_assertions import SoftAssertions
+from data_checks.conf.settings import settings
+from data_checks.utils import class_utils, check_utils, failure_utils
 from data_checks.base.actions.check import CheckAction
 from data_checks.base.actions.execution_context import ExecutionContext
+from data_checks.database.managers import RuleManager
+
+if TYPE_CHECKING:
+    from hamcrest.core.matcher import Matcher
 
 
 class Check(CheckBase, ActionMixin):
@@ -36,6 +45,12 @@ class Check(CheckBase, ActionMixin):
         self._internal = {
             "suite_model": None,
             "check_model": None,
+            "failure_groups": FailureGroups(),
+            "current_rule": None,
+            "suite_config": {},
+            "soft_assertions": None,
+            "rule_success_callbacks": [],
+            "rule_cache": {},
         }
         self._actions: list[type[CheckAction]] = actions
         self.rules = dict()
@@ -97,14 +112,13 @@ class Check(CheckBase, ActionMixin):
             [rule for rule in self.rules.keys() if rule not in self.excluded_rules]
         )
 
-    def run(self, rule: str):
+    def run(self, rule: str) -> list[RuleResult]:
         """
         Runs a rule once with one set of params or multiple times with multiple sets of params
         """
         rule_func = self.rules[rule]
         rules_params = self._get_rules_params(rule)
-        for params in rules_params:
-            self._exec_rule(rule, rule_func, params)
+        return [self._exec_rule(rule, rule_func, params) for params in rules_params]
 
     def run_async(self, rule: str, wait_for_completion=True) -> list[Process]:
         """
@@ -126,84 +140,258 @@ class Check(CheckBase, ActionMixin):
         else:
             return running_rule_processes
 
-    def run_all(self):
+    def run_all(self) -> list[RuleResult]:
         """
         Run all the rules in the check
         """
-        self.setup()
+        self._internal["rule_cache"] = {}
+        try:
+            self.setup()
 
-        rules_to_run = self.get_rules_to_run()
+            rules_to_run = self.get_rules_to_run()
 
-        for index, rule in enumerate(rules_to_run):
-            print(f"\t[{index + 1}/{len(rules_to_run)} Rules] {rule}")
-            self.run(rule)
+            results: list[RuleResult] = []
+            for index, rule in enumerate(rules_to_run):
+                print(f"\t[{index + 1}/{len(rules_to_run)} Rules] {rule}")
+                results += self.run(rule)
 
-        self.teardown()
+            self.teardown()
+        finally:
+            fixture_scopes.release("check")
+        return results
 
     def run_all_async(self):
         """
         Run all the rules in the check asynchronously. Note that order of execution is not guaranteed (aside from setup and teardown).
         """
+        self._internal["rule_cache"] = {}
+        try:
+            self.setup()
+            rules_to_run = self.get_rules_to_run()
+            self.prepare_async(rules_to_run)
+            running_rule_processes: list[tuple[str, list[Process]]] = []
+            with shared_failure_groups(self._internal):
+                for index, rule in enumerate(rules_to_run):
+                    print(f"\t[{index + 1}/{len(rules_to_run)} Rules] ASYNC RUN {rule}")
+                    running_rule_processes.append(
+                        (rule, self.run_async(rule, wait_for_completion=False))
+                    )
+
+                for rule, processes in running_rule_processes:
+                    for process in processes:
+                        process.join()
+            self.teardown()
+        finally:
+            fixture_scopes.release("check")
+
+    def prepare_async(self, rules_to_run: set[str]):
+        """
+        Called by run_all_async before forking a process per rule. Compute here the
+        values shared by several rules so that every rule process inherits them
+        instead of computing them again. By default, calls the `prepare` function
+        attached to the rules to run, if any (see data_checks.rules.record_rule).
+        A preparation that fails is left to the rules to report.
+        """
+        for rule in rules_to_run:
+            prepare = getattr(self.rules[rule], "prepare", None)
+            if prepare is None:
+                continue
+            try:
+                prepare(self)
+            except Exception as e:
+                print(f"\tCould not prepare {rule}: {e}")
+
+    def current_rule_hash(self) -> str:
+        """
+        Hash of the rule being executed, as stored in the database. Use it to key
+        state that a rule keeps between runs (see data_checks.base.rule_state).
+        """
+        if self._internal["current_rule"] is None:
+            raise RuntimeError("No rule is being executed")
+        rule, params = self._internal["current_rule"]
+        suite_model = self._internal["suite_model"]
+        return RuleManager.generate_hash(
+            name=rule,
+            check_name=self.name,
+            suite_name=None if suite_model is None else suite_model.name,
+            params=json.dumps(params, default=str),
+        )
 
-        self.setup()
-        rules_to_run = self.get_rules_to_run()
-        running_rule_processes: list[tuple[str, list[Process]]] = []
-        for index, rule in enumerate(rules_to_run):
-            print(f"\t[{index + 1}/{len(rules_to_run)} Rules] ASYNC RUN {rule}")
-            running_rule_processes.append(
-                (rule, self.run_async(rule, wait_for_completion=False))
-            )
+    def after_rule_success(self, callback: Callable[[], Any]):
+        """
+        Call callback once the rule being executed has succeeded, i.e. returned
+        without any soft assertion failure. Use it to commit state that must only
+        advance when the rule passes (see data_checks.rules.watermark_rule).
+        """
+        if self._internal["current_rule"] is None:
+            raise RuntimeError("No rule is being executed")
+        self._internal["rule_success_callbacks"].append(callback)
 
-        for rule, processes in running_rule_processes:
-            for process in processes:
-                process.join()
-        self.teardown()
+    def will_skip(self, rule: str, params: Optional[FunctionArgs] = None) -> bool:
+        """
+        Whether the before actions would skip the rule, as far as they can tell
+        without running (see CheckAction.skips). params default to no params.
+        """
+        return self.skips(
+            self._get_rule_context(rule, params or {"args": tuple(), "kwargs": dict()})
+        )
+
+    def expect(self, condition: Any, message: str | Callable[[], str], *args) -> bool:
+        """
+        Soft assertion: record a failure if condition is falsy and keep running the rule.
+        The message is formatted with args (`message.format(*args)`) only on failure.
+        The rule fails at the end with all the recorded failures, up to max_soft_failures
+        (check_config or rules_config option, MAX_SOFT_FAILURES by default).
+        """
+        return self._get_soft_assertions().expect(condition, message, *args)
+
+    def expect_that(
+        self,
+        actual: Any,
+        matcher: "Matcher",
+        message: str | Callable[[], str] = "",
+        *args,
+    ) -> bool:
+        """
+        Soft assertion with a hamcrest matcher (requires PyHamcrest), see expect
+        """
+        return self._get_soft_assertions().expect_that(actual, matcher, message, *args)
 
     def __str__(self):
         return self.name
 
     def _exec_rule(
         self, rule: str, rule_func: Callable[..., None], params: FunctionArgs
-    ):
+    ) -> RuleResult:
         """
         Execute a rule
         """
         rule_metadata = {"rule": rule, "params": params}
-        context = ExecutionContext()
-        context.set_sys("rule", rule)
-        context.set_sys("params", params)
+        context = self._get_rule_context(rule, params)
+        rule_result: RuleResult = {
+            "rule": rule,
+            "status": "skipped",
+            "duration": 0.0,
+            "exception": None,
+            "exception_type": None,
+            "fingerprint": None,
+        }
 
         try:
             self.before(context)
         except SkipExecutionException as e:
-            return
-
+            # The actions that ran before the skip clean up, e.g. restore stdout
+            self.after(context)
+            return rule_result
+
+        start_time = time.time()
+        self._internal["current_rule"] = (rule, params)
+        self._internal["soft_assertions"] = SoftAssertions(
+            self._get_max_soft_failures(rule)
+        )
+        self._internal["rule_success_callbacks"] = []
         try:
-            start_time = time.time()
             result = rule_func(*params["args"], **params["kwargs"])
+            soft_assertions_error = self._internal["soft_assertions"].error()
+            if soft_assertions_error is not None:
+                # Reported as the failure of the rule, nothing left to merge
+                self._internal["soft_assertions"] = None
+                raise soft_assertions_error
+            for callback in self._internal["rule_success_callbacks"]:
+                callback()
             context.set_sys("result", result)
             print(f"\t\t{rule} took {time.time() - start_time} seconds")
+            rule_result["status"] = "success"
             self.on_success(context)
         except AssertionError as e:
             print(e)
-            context.set_sys(
-                "exception",
-                DataCheckException.from_assertion_exception(e, metadata=rule_metadata),
-            )
-            self.on_failure(
+            self._fail_rule(
                 context,
+                rule_result,
+                self._with_soft_failures(
+                    DataCheckException.from_assertion_exception(
+                        e, metadata=rule_metadata
+                    )
+                ),
             )
         except DataCheckException as e:
             print(e)
-            context.set_sys("exception", e)
-            self.on_failure(context)
+            self._fail_rule(context, rule_result, self._with_soft_failures(e))
         except Exception as e:
             print(e)
-            context.set_sys("exception", DataCheckException.from_exception(e))
-            self.on_failure(
+            self._fail_rule(
                 context,
+                rule_result,
+                self._with_soft_failures(DataCheckException.from_exception(e)),
             )
-        self.after(context)
+        finally:
+            self._internal["current_rule"] = None
+            self._internal["soft_assertions"] = None
+            self._internal["rule_success_callbacks"] = []
+            rule_result["duration"] = time.time() - start_time
+            self.after(context)
+        return rule_result
+
+    def _fail_rule(
+        self,
+        context: ExecutionContext,
+        rule_result: RuleResult,
+        exception: DataCheckException,
+    ):
+        """
+        Internal: Record a failed rule and run the failure actions. Failures identical to
+        one already seen in the run are flagged as duplicates so that actions can skip them.
+        """
+        fingerprint = failure_utils.fingerprint(exception)
+        is_new_failure = self._internal["failure_groups"].add(
+            fingerprint, rule_result["rule"], self.name, exception
+        )
+        context.set_sys("exception", exception)
+        context.set_sys("fingerprint", fingerprint)
+        context.set_sys("duplicate_failure", not is_new_failure)
+
+        rule_result["status"] = "failure"
+        rule_result["exception"] = str(exception)
+        rule_result["exception_type"] = failure_utils.exception_type(exception)
+        rule_result["fingerprint"] = fingerprint
+        self.on_failure(context)
+
+    def _with_soft_failures(self, exception: DataCheckException) -> DataCheckException:
+        """
+        Internal: Add the soft assertion failures recorded before a rule raised to
+        the metadata of its exception, so that they are reported with it
+        """
+        soft_assertions = self._internal["soft_assertions"]
+        soft_assertions_error = (
+            None if soft_assertions is None else soft_assertions.error()
+        )
+        if soft_assertions_error is not None:
+            print(soft_assertions_error)
+            exception.metadata = {
+                **exception.metadata,
+                "soft_assertions": str(soft_assertions_error),
+            }
+        return exception
+
+    def _get_soft_assertions(self) -> SoftAssertions:
+        """
+        Internal: Soft assertions of the rule being executed
+        """
+        if self._internal["soft_assertions"] is None:
+            raise RuntimeError("Soft assertions can only be used within a rule")
+        return self._internal["soft_assertions"]
+
+    def _get_max_soft_failures(self, rule: str) -> Optional[int]:
+        """
+        Internal: rules_config takes precedence over check_config, which takes
+        precedence over the MAX_SOFT_FAILURES setting
+        """
+        config = self.check_config()
+        rule_config = config.get("rules_config", {}).get(rule, {})
+        return rule_config.get(
+            "max_soft_failures",
+            config.get("max_soft_failures", settings["MAX_SOFT_FAILURES"]),
+        )
 
     def _set_rules(self, rule_methods: list[str]):
         """
@@ -219,6 +407,17 @@ class Check(CheckBase, ActionMixin):
         Internal: Set the suite model for the check
         """
         self._internal["suite_model"] = suite_internals["suite_model"]
+        self._internal["failure_groups"] = suite_internals["failure_groups"]
+        self._internal["suite_config"] = suite_internals["suite_config"]
+
+    def _get_rule_context(self, rule: str, params: FunctionArgs) -> ExecutionContext:
+        """
+        Context of an execution of a rule
+        """
+        context = ExecutionContext()
+        context.set_sys("rule", rule)
+        context.set_sys("params", params)
+        return context
 
     def _get_rules_params(self, rule: str) -> list[FunctionArgs]:
         """
@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import TypedDict, Dict, Callable, Optional, Union
+from typing import Any, TypedDict, Dict, Callable, Optional, Union, TYPE_CHECKING
 from data_checks.base.actions.action_types import ActionBase
 from data_checks.database.managers import models
 
+if TYPE_CHECKING:
+    from data_checks.base.failure_groups import FailureGroups
+    from data_checks.base.soft_assertions import SoftAssertions
+
 # Function positional and keyword arguments
 class FunctionArgs(TypedDict):
     """
@@ -13,6 +17,95 @@ class FunctionArgs(TypedDict):
     kwargs: dict
 
 
+class RuleResult(TypedDict):
+    """
+    Outcome of a single rule execution
+    """
+
+    rule: str
+    status: str  # "success", "failure" or "skipped"
+    duration: float
+    exception: Optional[str]
+    exception_type: Optional[str]
+    fingerprint: Optional[str]  # identifies identical failures, see failure_utils
+
+
+class GroupedFailure(TypedDict):
+    """
+    Identical rule failures collapsed into one record
+    """
+
+    fingerprint: str
+    rule: str
+    exception_type: Optional[str]
+    message: str  # message template
+    exception: Optional[str]  # first exception of the group
+    traceback: Optional[str]  # traceback of the first exception of the group
+    count: int
+    sample_keys: list[str]
+
+
+class ColumnAssertionResult(TypedDict):
+    """
+    Outcome of a vectorized assertion on a column, see data_checks.rules.column_assertions
+    """
+
+    assertion: str
+    mask: Any  # boolean numpy array, True for the failing rows
+    failures: int
+    total: int
+    sample: list[tuple[Any, Any]]  # (index, value) of the first failing rows
+
+
+class OutlierResult(TypedDict):
+    """
+    Outliers found in a series, see data_checks.rules.outlier_rules
+    """
+
+    method: str
+    mask: Any  # boolean numpy array, True for the outliers
+    indices: list  # index labels of the outliers
+    scores: Any  # numpy array of the scores of the outliers
+    failures: int
+    total: int
+
+
+class DriftResult(TypedDict):
+    """
+    Comparison of a column with its baseline, see data_checks.rules.drift_rules
+    """
+
+    name: str
+    method: str  # "psi", "ks" or "chi2"
+    statistic: Optional[float]  # None when there is no baseline yet
+    p_value: Optional[float]
+    threshold: float
+    baseline_runs: int
+
+
+class AnomalyResult(TypedDict):
+    """
+    New points scored by a streaming detector, see data_checks.rules.anomaly_detectors
+    """
+
+    name: str
+    detector: str
+    points: int  # new points scored in the run
+    anomalies: list[tuple[Any, Any, float]]  # (index, value, score) of the anomalies
+    threshold: float
+
+
+class RecordRuleOutcome(TypedDict):
+    """
+    Outcome of a record rule, see data_checks.rules.record_rule
+    """
+
+    failures: int
+    total: int
+    sample: list  # first failing records
+    error: Optional[Exception]  # exception raised while checking a record
+
+
 class CheckInternal(TypedDict):
     """
     Internal check data
@@ -20,6 +113,26 @@ class CheckInternal(TypedDict):
 
     suite_model: Optional[models.Suite]
     check_model: Optional[models.Check]
+    failure_groups: "FailureGroups"
+    current_rule: Optional[tuple[str, FunctionArgs]]  # rule being executed and its params
+    suite_config: dict  # config of the suite running the check
+    soft_assertions: Optional["SoftAssertions"]  # soft assertions of the rule being executed
+    rule_success_callbacks: list[Callable[[], Any]]  # called once the rule being executed succeeds
+    rule_cache: dict  # values shared by the rules of one run of the check
+
+
+class SampleResult(TypedDict):
+    """
+    Failure rate of a rule estimated on a sample
+    """
+
+    sample_size: int
+    population_size: int
+    failures: int
+    failure_rate: float
+    lower_bound: float  # bounds of the confidence interval of the failure rate
+    upper_bound: float
+    confidence: float
 
 
 class CheckBase(ABC):
@@ -0,0 +1,137 @@
+"""
+Collector that groups identical rule failures of a run by their fingerprint
+"""
+import contextlib
+import traceback
+from multiprocessing import Manager
+from multiprocessing.managers import SyncManager
+from typing import Optional
+from data_checks.conf.settings import settings
+from data_checks.base.check_types import GroupedFailure, RuleResult
+from data_checks.base.exceptions import DataCheckException
+from data_checks.utils import failure_utils
+
+
+class FailureGroups:
+    def __init__(
+        self, sample_size: Optional[int] = None, manager: Optional[SyncManager] = None
+    ):
+        """
+        Groups are kept in a dict of the process, or in a dict of manager to share
+        them with the processes forked during an asynchronous run
+        """
+        self.sample_size = (
+            settings["FAILURE_SAMPLE_SIZE"] if sample_size is None else sample_size
+        )
+        self.groups: dict[str, GroupedFailure] = {} if manager is None else manager.dict()
+        self._lock = None if manager is None else manager.Lock()
+
+    @property
+    def is_shared(self) -> bool:
+        return self._lock is not None
+
+    def shared(self, manager: SyncManager) -> "FailureGroups":
+        """
+        Copy of the groups shared through manager
+        """
+        failure_groups = FailureGroups(self.sample_size, manager)
+        failure_groups.groups.update(self.groups)
+        return failure_groups
+
+
+    def add(
+        self, fingerprint: str, rule: str, key: str, exception: DataCheckException
+    ) -> bool:
+        """
+        Add a failure to its group. Returns True if it is the first failure of the group.
+        """
+        raised_exception = failure_utils.unwrap_exception(exception)
+        with self._locked():
+            if fingerprint in self.groups:
+                self._add_to_group(fingerprint, key)
+                return False
+            self.groups[fingerprint] = {
+                "fingerprint": fingerprint,
+                "rule": rule,
+                "exception_type": failure_utils.exception_type(exception),
+                "message": failure_utils.message_template(str(raised_exception)),
+                "exception": exception.toJSON(),
+                "traceback": "\n".join(
+                    traceback.format_tb(raised_exception.__traceback__)
+                ),
+                "count": 1,
+                "sample_keys": [key],
+            }
+            return True
+
+    def add_rule_result(self, rule_result: RuleResult, key: str) -> bool:
+        """
+        Add a failed rule result (e.g. returned by a worker process) to its group
+        """
+        fingerprint = rule_result["fingerprint"]
+        if fingerprint is None:
+            return False
+        with self._locked():
+            if fingerprint in self.groups:
+                self._add_to_group(fingerprint, key)
+                return False
+            self.groups[fingerprint] = {
+                "fingerprint": fingerprint,
+                "rule": rule_result["rule"],
+                "exception_type": rule_result["exception_type"],
+                "message": failure_utils.message_template(
+                    rule_result["exception"] or ""
+                ),
+                "exception": rule_result["exception"],
+                "traceback": None,
+                "count": 1,
+                "sample_keys": [key],
+            }
+            return True
+
+    def add_occurrence(self, fingerprint: str, key: str):
+        """
+        Count another occurrence of a grouped failure, e.g. on a deduplicated element
+        """
+        with self._locked():
+            self._add_to_group(fingerprint, key)
+
+    def values(self) -> list[GroupedFailure]:
+        return list(self.groups.values())
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return fingerprint in self.groups
+
+    def __len__(self):
+        return len(self.groups)
+
+    def _locked(self):
+        return contextlib.nullcontext() if self._lock is None else self._lock
+
+    def _add_to_group(self, fingerprint: str, key: str):
+        group = self.groups[fingerprint]
+        group["count"] += 1
+        if len(group["sample_keys"]) < self.sample_size:
+            group["sample_keys"].append(key)
+        # Shared groups hold copies, store the updated group back
+        self.groups[fingerprint] = group
+
+
+@contextlib.contextmanager
+def shared_failure_groups(internal: dict):
+    """
+    Share the failure groups of a suite or check internals with the processes
+    forked within the block, so that identical failures are only reported once
+    across processes. The groups are copied back to the original collector.
+    """
+    failure_groups: FailureGroups = internal["failure_groups"]
+    if failure_groups.is_shared:
+        yield
+        return
+    with Manager() as manager:
+        internal["failure_groups"] = failure_groups.shared(manager)
+        try:
+            yield
+        finally:
+            failure_groups.groups = dict(internal["failure_groups"].groups)
+            internal["failure_groups"] = failure_groups
@@ -0,0 +1,104 @@
+"""
+Fixtures that lazily load data once and share it within a run, a suite or a check.
+
+    @fixture(scope="run")
+    def users() -> pd.DataFrame:
+        return pd.read_csv("users.csv")
+
+A fixture is evaluated the first time it is used, either by calling it (`users()`)
+or by accessing it as an attribute of a check (`users = users` in the check class,
+then `self.users` in the rules). Every use within the same scope gets the same value
+and the value is released when the scope ends. Generator fixtures can clean up
+after the `yield` statement, which runs when the scope ends.
+"""
+import functools
+import inspect
+from typing import Any, Callable, Optional
+
+SCOPES = ["run", "suite", "check"]
+
+
+class Fixture:
+    def __init__(self, func: Callable[[], Any], scope: str = "check"):
+        if scope not in SCOPES:
+            raise ValueError(f"Invalid fixture scope {scope}. Options: {SCOPES}")
+        self.func = func
+        self.scope = scope
+        functools.update_wrapper(self, func)
+
+    def __call__(self) -> Any:
+        """
+        Get the value of the fixture in its current scope
+        """
+        return fixture_scopes.get(self)
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return self()
+
+    def __repr__(self) -> str:
+        return f"Fixture(name={self.func.__name__!r}, scope={self.scope!r})"
+
+
+class FixtureScopes:
+    """
+    Values and teardowns of the fixtures evaluated in each scope of the current process
+    """
+
+    def __init__(self):
+        self._values: dict[str, dict[Fixture, Any]] = {scope: {} for scope in SCOPES}
+        self._teardowns: dict[str, dict[Fixture, Any]] = {
+            scope: {} for scope in SCOPES
+        }
+
+    def get(self, fixture: Fixture) -> Any:
+        values = self._values[fixture.scope]
+        if fixture not in values:
+            value = fixture.func()
+            if inspect.isgenerator(value):
+                self._teardowns[fixture.scope][fixture] = value
+                value = next(value)
+            values[fixture] = value
+        return values[fixture]
+
+    def is_loaded(self, fixture: Fixture) -> bool:
+        return fixture in self._values[fixture.scope]
+
+    def release(self, scope: str):
+        """
+        Release the values of a scope, running the teardowns in reverse order
+        """
+        teardowns = self._teardowns[scope]
+        self._teardowns[scope] = {}
+        self._values[scope] = {}
+        for generator in reversed(teardowns.values()):
+            self._teardown(generator)
+
+    def discard(self, fixture: Fixture):
+        """
+        Release the value of a single fixture, running its teardown
+        """
+        self._values[fixture.scope].pop(fixture, None)
+        generator = self._teardowns[fixture.scope].pop(fixture, None)
+        if generator is not None:
+            self._teardown(generator)
+
+    @staticmethod
+    def _teardown(generator):
+        try:
+            next(generator)
+        except StopIteration:
+            pass
+
+
+fixture_scopes = FixtureScopes()
+
+
+def fixture(func: Optional[Callable[[], Any]] = None, *, scope: str = "check"):
+    """
+    Declare a fixture. Can be used as @fixture or @fixture(scope="run" | "suite" | "check")
+    """
+    if func is None:
+        return lambda func: Fixture(func, scope=scope)
+    return Fixture(func, scope=scope)
@@ -35,6 +35,15 @@ class ActionMixin:
         """
         self._exec_actions("before", context)
 
+    def skips(self, context: ExecutionContext) -> bool:
+        """
+        Whether the before actions would skip the rule of the context
+        """
+        return any(
+            getattr(action, "skips", lambda *args: False)(self, context)
+            for action in self.actions
+        )
+
     def after(self, context: ExecutionContext):
         """
         Runs after each rule
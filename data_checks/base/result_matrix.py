@@ -0,0 +1,178 @@
+"""
+Compact element x rule matrix of the results of a group suite run
+"""
+import os
+from typing import Optional
+import numpy as np
+from data_checks.base.suite_helper_types import CheckResult
+
+# Ordered so that the worst status wins when a rule runs with multiple params
+NOT_RUN = 0
+SKIPPED = 1
+SUCCESS = 2
+FAILURE = 3
+
+STATUS_CODES = {
+    "skipped": SKIPPED,
+    "success": SUCCESS,
+    "failure": FAILURE,
+}
+
+
+class ResultMatrix:
+    """
+    Status codes and durations of every rule on every element of a group.
+
+    Attributes:
+        keys -- element keys, one per row
+        rules -- rule labels ("CheckClass.rule_name"), one per column
+        status -- int8 array of status codes (NOT_RUN, SKIPPED, SUCCESS, FAILURE)
+        durations -- float32 array of the seconds spent on each rule
+    """
+
+    def __init__(
+        self,
+        keys: list[str],
+        rules: list[str],
+        status: Optional[np.ndarray] = None,
+        durations: Optional[np.ndarray] = None,
+    ):
+        self.keys = list(keys)
+        self.rules = list(rules)
+        self._rule_index = {rule: index for index, rule in enumerate(self.rules)}
+        shape = (len(self.keys), len(self.rules))
+        self.status = (
+            np.full(shape, NOT_RUN, dtype=np.int8) if status is None else status
+        )
+        self.durations = (
+            np.zeros(shape, dtype=np.float32) if durations is None else durations
+        )
+
+    @classmethod
+    def from_group_results(
+        cls, keys: list[str], group_results: dict[int, list[CheckResult]]
+    ) -> "ResultMatrix":
+        """
+        Build the matrix from the per-element results of a group suite run. A check
+        that failed before running its rules (e.g. in its setup) fails all the rules
+        of its type, or a "{check_type}.*" column when none of them ran elsewhere.
+        """
+        rules = {
+            cls.rule_label(check_result["check_type"], rule_result["rule"])
+            for check_results in group_results.values()
+            for check_result in check_results
+            for rule_result in check_result["rules"]
+        }
+        failed_check_types = {
+            check_result["check_type"]
+            for check_results in group_results.values()
+            for check_result in check_results
+            if cls._failed_without_rules(check_result)
+        }
+        for check_type in failed_check_types:
+            if not any(rule.startswith(f"{check_type}.") for rule in rules):
+                rules.add(cls.rule_label(check_type, "*"))
+        matrix = cls(keys, sorted(rules))
+        for element, check_results in group_results.items():
+            for check_result in check_results:
+                if cls._failed_without_rules(check_result):
+                    for rule in matrix.rules:
+                        if rule.startswith(f"{check_result['check_type']}."):
+                            matrix.record(element, rule, "failure", 0.0)
+                for rule_result in check_result["rules"]:
+                    matrix.record(
+                        element,
+                        cls.rule_label(check_result["check_type"], rule_result["rule"]),
+                        rule_result["status"],
+                        rule_result["duration"],
+                    )
+        return matrix
+
+    @staticmethod
+    def rule_label(check_type: str, rule: str) -> str:
+        return f"{check_type}.{rule}"
+
+    @staticmethod
+    def _failed_without_rules(check_result: CheckResult) -> bool:
+        return check_result["status"] == "failure" and not check_result["rules"]
+
+    def record(self, element: int, rule: str, status: str, duration: float):
+        """
+        Record the result of a rule on an element. If the rule ran multiple times
+        (multiple params) the worst status is kept and the durations are summed.
+        """
+        column = self._rule_index[rule]
+        self.status[element, column] = max(
+            self.status[element, column], STATUS_CODES[status]
+        )
+        self.durations[element, column] += duration
+
+    def failure_counts(self) -> dict[str, int]:
+        """
+        Number of failing elements per rule
+        """
+        counts = np.count_nonzero(self.status == FAILURE, axis=0)
+        return dict(zip(self.rules, counts.tolist()))
+
+    def failing_elements(self, rule: str) -> list[str]:
+        """
+        Keys of the elements that failed a rule
+        """
+        rows = np.flatnonzero(self.status[:, self._rule_index[rule]] == FAILURE)
+        return [self.keys[row] for row in rows]
+
+    def failing_rules(self, key: str) -> list[str]:
+        """
+        Rules that failed for an element, or for any of the elements sharing its key
+        """
+        rows = [row for row, row_key in enumerate(self.keys) if row_key == key]
+        if not rows:
+            raise ValueError(f"No element with key {key}")
+        columns = np.flatnonzero((self.status[rows] == FAILURE).any(axis=0))
+        return [self.rules[column] for column in columns]
+
+    def total_durations(self) -> dict[str, float]:
+        """
+        Seconds spent on each rule across all elements
+        """
+        return dict(zip(self.rules, self.durations.sum(axis=0).tolist()))
+
+    def summary(self) -> str:
+        failure_counts = self.failure_counts()
+        total_durations = self.total_durations()
+        lines = [f"{len(self.keys)} elements x {len(self.rules)} rules"]
+        for rule in self.rules:
+            lines.append(
+                f"\t{rule}: {failure_counts[rule]} failures, {total_durations[rule]:.3f} seconds"
+            )
+        return "\n".join(lines)
+
+    def save(self, path: str) -> str:
+        """
+        Persist the matrix as a single compressed .npz artifact
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as file:
+            np.savez_compressed(
+                file,
+                keys=np.array(self.keys, dtype=str),
+                rules=np.array(self.rules, dtype=str),
+                status=self.status,
+                durations=self.durations,
+            )
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> "ResultMatrix":
+        with np.load(path) as artifact:
+            return cls(
+                keys=artifact["keys"].tolist(),
+                rules=artifact["rules"].tolist(),
+                status=artifact["status"],
+                durations=artifact["durations"],
+            )
+
+    def __repr__(self) -> str:
+        return f"ResultMatrix(elements={len(self.keys)}, rules={len(self.rules)})"
@@ -0,0 +1,69 @@
+"""
+State that rules persist between runs, keyed by the hash of the rule and a kind
+(e.g. "watermark"). States are stored as JSON in the checks database, or in memory
+for the lifetime of the process when CHECKS_DATABASE_URL is not set.
+"""
+import datetime
+import hashlib
+import json
+from typing import Any
+import pandas as pd
+from data_checks.conf.settings import settings
+from data_checks.database.managers import RuleStateManager
+
+
+def dumps(state: Any) -> str:
+    """
+    Serialize a state to JSON, keeping the type of datetimes
+    """
+
+    def default(value):
+        if isinstance(value, (datetime.datetime, pd.Timestamp)):
+            return {"__datetime__": value.isoformat()}
+        if isinstance(value, datetime.date):
+            return {"__date__": value.isoformat()}
+        if hasattr(value, "item"):
+            # numpy scalars
+            return value.item()
+        raise TypeError(f"Cannot serialize {type(value).__name__} in a rule state")
+
+    return json.dumps(state, default=default)
+
+
+def loads(serialized_state: str) -> Any:
+    def object_hook(value: dict):
+        if "__datetime__" in value:
+            return pd.Timestamp(value["__datetime__"])
+        if "__date__" in value:
+            return datetime.date.fromisoformat(value["__date__"])
+        return value
+
+    return json.loads(serialized_state, object_hook=object_hook)
+
+
+class RuleStates:
+    def __init__(self):
+        self._memory: dict[str, str] = {}
+
+    @staticmethod
+    def key(rule_hash: str, kind: str) -> str:
+        return f"{kind}:{hashlib.sha1(rule_hash.encode()).hexdigest()}"
+
+    def get(self, rule_hash: str, kind: str, default: Any = None) -> Any:
+        key = self.key(rule_hash, kind)
+        if settings["CHECKS_DATABASE_URL"]:
+            rule_state = RuleStateManager.get(key)
+            serialized_state = None if rule_state is None else rule_state.state
+        else:
+            serialized_state = self._memory.get(key)
+        return default if serialized_state is None else loads(serialized_state)
+
+    def set(self, rule_hash: str, kind: str, state: Any):
+        key = self.key(rule_hash, kind)
+        if settings["CHECKS_DATABASE_URL"]:
+            RuleStateManager.set(key, kind, rule_hash, dumps(state))
+        else:
+            self._memory[key] = dumps(state)
+
+
+rule_states = RuleStates()
@@ -0,0 +1,81 @@
+"""
+Soft assertions collect the failures of a rule instead of stopping at the first one.
+Messages are only formatted when an assertion fails.
+"""
+from typing import Any, Callable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from hamcrest.core.matcher import Matcher
+
+
+class SoftAssertions:
+    """
+    Failures collected during the execution of a rule.
+
+    Attributes:
+        max_failures -- failures collected before the next ones are only counted, None for no limit
+        messages -- messages of the collected failures
+        failures -- number of failures, including the ones that were not collected
+    """
+
+    def __init__(self, max_failures: Optional[int] = None):
+        self.max_failures = max_failures
+        self.messages: list[str] = []
+        self.failures = 0
+
+    @property
+    def is_full(self) -> bool:
+        return self.max_failures is not None and len(self.messages) >= self.max_failures
+
+    def expect(self, condition: Any, message: str | Callable[[], str], *args) -> bool:
+        """
+        Record a failure if condition is falsy. message is formatted with args
+        (`message.format(*args)`) or called if it is a function, only on failure.
+        """
+        if condition:
+            return True
+        self.failures += 1
+        if not self.is_full:
+            self.messages.append(self._format(message, args))
+        return False
+
+    def expect_that(
+        self,
+        actual: Any,
+        matcher: "Matcher",
+        message: str | Callable[[], str] = "",
+        *args,
+    ) -> bool:
+        """
+        Record a failure if actual does not match the hamcrest matcher. Requires
+        PyHamcrest, which is only imported when this method is used.
+        """
+        from hamcrest import assert_that
+
+        if matcher.matches(actual):
+            return True
+        self.failures += 1
+        if not self.is_full:
+            try:
+                # Describe the mismatch the same way as assert_that
+                assert_that(actual, matcher, self._format(message, args))
+            except AssertionError as e:
+                self.messages.append(str(e).strip())
+        return False
+
+    def error(self) -> Optional[AssertionError]:
+        """
+        Aggregated error of the collected failures, None if there were none
+        """
+        if not self.failures:
+            return None
+        summary = f"{self.failures} soft assertion(s) failed"
+        if self.failures > len(self.messages):
+            summary += f", showing the first {len(self.messages)}"
+        return AssertionError("\n".join([summary, *self.messages]))
+
+    @staticmethod
+    def _format(message: str | Callable[[], str], args: tuple) -> str:
+        if callable(message):
+            return message()
+        return message.format(*args) if args else message
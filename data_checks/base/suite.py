@@ -1,10 +1,12 @@
-from typing import Optional, TypedDict
+from typing import Any, Callable, Optional, TypedDict
 import time
 from multiprocessing import Process
 from data_checks.conf.data_check_registry import data_check_registry
 from data_checks.base.check import Check
 from data_checks.base.suite_types import SuiteBase
 from data_checks.base.exceptions import SkipExecutionException
+from data_checks.base.failure_groups import FailureGroups, shared_failure_groups
+from data_checks.base.fixture import Fixture, fixture_scopes
 from data_checks.base.mixins.action_mixin import ActionMixin
 from data_checks.base.actions.execution_context import ExecutionContext
 from data_checks.base.actions.check import CheckAction
@@ -41,6 +43,8 @@ class Suite(SuiteBase, ActionMixin):
         }
         self._internal = {
             "suite_model": None,
+            "failure_groups": FailureGroups(),
+            "suite_config": self.suite_config() or {},
         }
 
     @property
@@ -72,10 +76,20 @@ class Suite(SuiteBase, ActionMixin):
         """
         raise NotImplementedError
 
-    def get_checks(self) -> list[Check]:
+    @classmethod
+    def prefetch(cls) -> list[Fixture | Callable[[], Any]]:
+        """
+        Fixtures and functions to warm before each scheduled run of the suite
+        """
+        return []
+
+    def get_checks(self, checks_to_get: Optional[list] = None) -> list[Check]:
+        """
+        Instantiate the checks (defaults to self.checks()) and apply the overrides
+        """
         checks: list[Check] = []
         checks_overrides = self.checks_overrides()
-        for check in self.checks():
+        for check in self.checks() if checks_to_get is None else checks_to_get:
             overrides = {}
             if checks_overrides is not None:
                 check_name: str
@@ -111,27 +125,30 @@ class Suite(SuiteBase, ActionMixin):
         self.check_actions = check_actions
 
     def run(self):
-        self.setup()
-        checks_to_run = self.get_checks()
-        for index, check in enumerate(checks_to_run):
-            print(f"[{index + 1}/{len(checks_to_run)} Checks] {check}")
-            context = ExecutionContext()
-            context.set_sys("check", check)
-            try:
-                self.before(context)
-            except SkipExecutionException as e:
-                return
-            try:
-                start_time = time.time()
-                check.run_all()
-                print(f"{check} finished in {time.time() - start_time} seconds")
-                self.on_success(context)
-            except Exception as e:
-                context.set_sys("exception", e)
-                self.on_failure(context)
-            self.after(context)
-
-        self.teardown()
+        try:
+            self.setup()
+            checks_to_run = self.get_checks()
+            for index, check in enumerate(checks_to_run):
+                print(f"[{index + 1}/{len(checks_to_run)} Checks] {check}")
+                context = ExecutionContext()
+                context.set_sys("check", check)
+                try:
+                    self.before(context)
+                except SkipExecutionException as e:
+                    return
+                try:
+                    start_time = time.time()
+                    check.run_all()
+                    print(f"{check} finished in {time.time() - start_time} seconds")
+                    self.on_success(context)
+                except Exception as e:
+                    context.set_sys("exception", e)
+                    self.on_failure(context)
+                self.after(context)
+
+            self.teardown()
+        finally:
+            fixture_scopes.release("suite")
 
     def run_async(self):
         """
@@ -139,18 +156,22 @@ class Suite(SuiteBase, ActionMixin):
         """
         checks = self.get_checks()
         running_check_processes = []
-        self.setup()
+        try:
+            self.setup()
 
-        for index, check in enumerate(checks):
-            print(f"[{index + 1}/{len(checks)} Checks] ASYNC RUN {check}")
-            process = Process(target=self._exec_async_check, args=(check,))
-            process.start()
-            running_check_processes.append(process)
+            with shared_failure_groups(self._internal):
+                for index, check in enumerate(checks):
+                    print(f"[{index + 1}/{len(checks)} Checks] ASYNC RUN {check}")
+                    process = Process(target=self._exec_async_check, args=(check,))
+                    process.start()
+                    running_check_processes.append(process)
 
-        for process in running_check_processes:
-            process.join()
+                for process in running_check_processes:
+                    process.join()
 
-        self.teardown()
+            self.teardown()
+        finally:
+            fixture_scopes.release("suite")
 
     def _exec_async_check(self, check: Check):
         """
@@ -1,5 +1,7 @@
 from typing import Optional, TypedDict
+from data_checks.base.failure_groups import FailureGroups
 from data_checks.database.managers import models
+from data_checks.base.check_types import RuleResult
 
 
 class SuiteInternal(TypedDict):
@@ -8,3 +10,17 @@ class SuiteInternal(TypedDict):
     """
 
     suite_model: Optional[models.Suite]
+    failure_groups: FailureGroups
+    suite_config: dict
+
+
+class CheckResult(TypedDict):
+    """
+    Outcome of a check run within a suite
+    """
+
+    check: str
+    check_type: str
+    status: str  # "success", "failure" or "skipped"
+    duration: float
+    rules: list[RuleResult]
@@ -0,0 +1,164 @@
+"""
+Columnar on-disk storage of dataframes: one .npy file per column plus a meta.json file.
+Numeric and datetime columns can be loaded back as memory-mapped arrays.
+"""
+import json
+import os
+import shutil
+import uuid
+from typing import Optional
+import numpy as np
+import pandas as pd
+
+META_FILE = "meta.json"
+
+
+def column_file(directory: str, position: int) -> str:
+    return os.path.join(directory, f"column_{position}.npy")
+
+
+def is_stored(directory: str) -> bool:
+    return os.path.isfile(os.path.join(directory, META_FILE))
+
+
+def write_frame(
+    df: pd.DataFrame, directory: str, extra_files: Optional[dict[str, str]] = None
+):
+    """
+    Store a dataframe in a directory, along with the text files of extra_files
+    (file name: contents). The directory is written aside and renamed into place,
+    so that readers never see a partially written frame or a frame without its
+    extra files. When several processes write the same directory, the last one wins.
+    """
+    temporary_directory = f"{directory}.{uuid.uuid4().hex}.tmp"
+    os.makedirs(temporary_directory)
+
+    columns = []
+    for position, (name, column) in enumerate(df.items()):
+        dtype = str(column.dtype)
+        timezone = None
+        if isinstance(column.dtype, pd.DatetimeTZDtype):
+            timezone = str(column.dt.tz)
+            values = column.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy()
+        elif column.dtype.kind in "biufcmM":
+            values = column.to_numpy()
+        else:
+            values = column.to_numpy(dtype=object)
+        np.save(column_file(temporary_directory, position), values, allow_pickle=True)
+        columns.append({"name": name, "dtype": dtype, "timezone": timezone})
+
+    index = None
+    if not isinstance(df.index, pd.RangeIndex):
+        index_values = df.index.to_numpy()
+        np.save(
+            os.path.join(temporary_directory, "index.npy"),
+            index_values,
+            allow_pickle=index_values.dtype == object,
+        )
+        index = {"name": df.index.name}
+
+    with open(os.path.join(temporary_directory, META_FILE), "w") as meta_file:
+        json.dump(
+            {
+                "columns": columns,
+                "index": index,
+                "range_index": None
+                if index is not None
+                else [df.index.start, df.index.stop, df.index.step],
+                "rows": len(df),
+            },
+            meta_file,
+            default=str,
+        )
+
+    for file_name, contents in (extra_files or {}).items():
+        with open(os.path.join(temporary_directory, file_name), "w") as extra_file:
+            extra_file.write(contents)
+
+    # A directory cannot be renamed over a non-empty one: move the previous frame
+    # aside first, it is only removed once the new frame is in place
+    previous_directory = f"{directory}.{uuid.uuid4().hex}.old"
+    try:
+        os.rename(directory, previous_directory)
+    except FileNotFoundError:
+        previous_directory = None
+    try:
+        os.rename(temporary_directory, directory)
+    except OSError:
+        # Another process stored its frame in the meantime
+        shutil.rmtree(temporary_directory, ignore_errors=True)
+    if previous_directory is not None:
+        shutil.rmtree(previous_directory, ignore_errors=True)
+
+
+def read_meta(directory: str) -> dict:
+    with open(os.path.join(directory, META_FILE)) as meta_file:
+        return json.load(meta_file)
+
+
+def read_frame(
+    directory: str, mmap: bool = False, columns: Optional[list] = None
+) -> pd.DataFrame:
+    """
+    Load a dataframe (or some of its columns) stored with write_frame. With mmap=True,
+    numeric and datetime columns are read-only memory-mapped arrays backed by the
+    OS page cache.
+    """
+    meta = read_meta(directory)
+
+    data = {}
+    for position, column in enumerate(meta["columns"]):
+        if columns is not None and column["name"] not in columns:
+            continue
+        values = read_column(directory, position, mmap=mmap)
+        if column["timezone"] is not None:
+            data[column["name"]] = (
+                pd.Series(values, copy=False)
+                .dt.tz_localize("UTC")
+                .dt.tz_convert(column["timezone"])
+            )
+        elif values.dtype == object and column["dtype"] != "object":
+            data[column["name"]] = pd.Series(values, copy=False).astype(column["dtype"])
+        else:
+            data[column["name"]] = values
+
+    if meta["index"] is not None:
+        index = pd.Index(
+            np.load(os.path.join(directory, "index.npy"), allow_pickle=True),
+            name=meta["index"]["name"],
+        )
+    else:
+        index = pd.RangeIndex(*meta["range_index"])
+
+    df = pd.DataFrame(data, copy=False)
+    df.index = index
+    return df
+
+
+def column_position(directory: str, name) -> int:
+    for position, column in enumerate(read_meta(directory)["columns"]):
+        if column["name"] == name:
+            return position
+    raise KeyError(f"Column {name} is not stored in {directory}")
+
+
+def read_column(directory: str, position: int, mmap: bool = False) -> np.ndarray:
+    """
+    Load a single stored column
+    """
+    path = column_file(directory, position)
+    if mmap:
+        try:
+            return np.load(path, mmap_mode="r")
+        except ValueError:
+            # Object columns are pickled and cannot be memory-mapped
+            pass
+    return np.load(path, allow_pickle=True)
+
+
+def directory_size(directory: str) -> int:
+    return sum(
+        os.path.getsize(os.path.join(root, file))
+        for root, _, files in os.walk(directory)
+        for file in files
+    )
@@ -0,0 +1,163 @@
+"""
+On-disk cache of the data loaded by checks and suites. Entries are keyed by a name and
+invalidated when the fingerprint of their source changes, so unchanged sources are
+loaded from the local columnar copy instead of being read and parsed again.
+"""
+import hashlib
+import json
+import os
+import shutil
+from typing import Callable, Optional
+import pandas as pd
+from data_checks.conf.settings import settings
+from data_checks.cache import column_store
+
+FINGERPRINT_FILE = "fingerprint"
+
+
+def file_fingerprint(path: str, hash_contents: bool = False) -> str:
+    """
+    Fingerprint of a file from its size and modification time, or from its contents
+    """
+    if hash_contents:
+        contents_hash = hashlib.sha1()
+        with open(path, "rb") as file:
+            for block in iter(lambda: file.read(1024 * 1024), b""):
+                contents_hash.update(block)
+        return contents_hash.hexdigest()
+    stat = os.stat(path)
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def query_fingerprint(connectable, query: str) -> str:
+    """
+    Fingerprint of a table from a version query, for example
+    "SELECT MAX(updated_at) FROM orders". Accepts an Engine or a Connection.
+    """
+    from sqlalchemy import text
+
+    if hasattr(connectable, "connect"):
+        with connectable.connect() as connection:
+            return str(connection.execute(text(query)).scalar())
+    return str(connectable.execute(text(query)).scalar())
+
+
+class DataCache:
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.directory = settings["DATA_CACHE_DIR"] if directory is None else directory
+        self.max_bytes = (
+            settings["DATA_CACHE_MAX_BYTES"] if max_bytes is None else max_bytes
+        )
+
+    def get_or_load(
+        self,
+        name: str,
+        fingerprint: str,
+        loader: Callable[[], pd.DataFrame],
+        mmap: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Get a dataframe from the cache or load it with loader() and cache it.
+        The cached copy is replaced when the fingerprint of the source changes.
+        """
+        entry = self.entry_path(name)
+        if self._is_fresh(entry, fingerprint):
+            # Entries are evicted by least recent use
+            os.utime(entry)
+            return column_store.read_frame(entry, mmap=mmap)
+
+        df = self._store(entry, fingerprint, loader)
+        return column_store.read_frame(entry, mmap=True) if mmap else df
+
+    def store(
+        self, name: str, fingerprint: str, loader: Callable[[], pd.DataFrame]
+    ) -> str:
+        """
+        Make sure an entry is cached and fresh without reading it. Returns the
+        directory of the entry.
+        """
+        entry = self.entry_path(name)
+        if self._is_fresh(entry, fingerprint):
+            os.utime(entry)
+        else:
+            self._store(entry, fingerprint, loader)
+        return entry
+
+    def read_csv(
+        self, path: str, hash_contents: bool = False, mmap: bool = False, **kwargs
+    ) -> pd.DataFrame:
+        """
+        pd.read_csv through the cache. The entry is invalidated when the file changes.
+        """
+        return self.get_or_load(
+            name=f"csv:{os.path.abspath(path)}:{json.dumps(kwargs, sort_keys=True, default=str)}",
+            fingerprint=file_fingerprint(path, hash_contents=hash_contents),
+            loader=lambda: pd.read_csv(path, **kwargs),
+            mmap=mmap,
+        )
+
+    def read_sql(
+        self, query: str, connectable, version_query: str, mmap: bool = False, **kwargs
+    ) -> pd.DataFrame:
+        """
+        pd.read_sql through the cache. The entry is invalidated when the result of
+        version_query changes.
+        """
+        return self.get_or_load(
+            name=f"sql:{connectable.engine.url!r}:{query}",
+            fingerprint=query_fingerprint(connectable, version_query),
+            loader=lambda: pd.read_sql(query, connectable, **kwargs),
+            mmap=mmap,
+        )
+
+    def entry_path(self, name: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(name.encode()).hexdigest())
+
+    def evict(self, keep: Optional[str] = None):
+        """
+        Remove the least recently used entries (other than keep) until the cache
+        fits in max_bytes
+        """
+        if not os.path.isdir(self.directory):
+            return
+        # Frames being written or replaced have a suffix and are left alone
+        entries = [
+            os.path.join(self.directory, entry)
+            for entry in os.listdir(self.directory)
+            if "." not in entry
+            and column_store.is_stored(os.path.join(self.directory, entry))
+            and os.path.join(self.directory, entry) != keep
+        ]
+        sizes = {entry: column_store.directory_size(entry) for entry in entries}
+        total_size = sum(sizes.values()) + (
+            column_store.directory_size(keep) if keep else 0
+        )
+        for entry in sorted(entries, key=os.path.getmtime):
+            if total_size <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total_size -= sizes[entry]
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _store(
+        self, entry: str, fingerprint: str, loader: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        df = loader()
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError(f"Only dataframes can be cached, got {type(df).__name__}")
+        # The fingerprint is published along with the frame, never after it
+        column_store.write_frame(df, entry, extra_files={FINGERPRINT_FILE: fingerprint})
+        self.evict(keep=entry)
+        return df
+
+    def _is_fresh(self, entry: str, fingerprint: str) -> bool:
+        fingerprint_path = os.path.join(entry, FINGERPRINT_FILE)
+        if not column_store.is_stored(entry) or not os.path.isfile(fingerprint_path):
+            return False
+        with open(fingerprint_path) as fingerprint_file:
+            return fingerprint_file.read() == fingerprint
+
+
+data_cache = DataCache()
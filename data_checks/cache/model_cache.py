@@ -0,0 +1,195 @@
+"""
+On-disk cache of the models fitted by rules, such as anomaly detectors. Entries are
+keyed by a name (the rule hash) and store the fingerprint of the training data and
+the hash of the code of the rule, so that most runs only load the fitted model:
+
+    def rule_no_outliers(self):
+        X = self.metrics[["value"]]
+        model = rule_model(self, lambda: IForest().fit(X), training_data=X)
+        scores = model.decision_function(X)
+
+A model is refit when the code changes, or when the training data changes and the
+model is older than refit_seconds (MODEL_REFIT_SECONDS, a day by default). Data that
+grows at every run changes at every run: with refit_seconds=0 the model would be
+refit every time and the cache would be of no use.
+"""
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import time
+from typing import Any, Callable, Optional
+import pandas as pd
+from data_checks.conf.settings import settings
+from data_checks.utils import class_utils
+
+MODEL_FILE = "model.pkl"
+METADATA_FILE = "metadata.json"
+
+
+def frame_fingerprint(data: pd.DataFrame | pd.Series) -> str:
+    """
+    Fingerprint of the contents of a dataframe or series
+    """
+    data_hash = hashlib.sha1(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+    if isinstance(data, pd.DataFrame):
+        data_hash.update(json.dumps(list(map(str, data.columns))).encode())
+    return data_hash.hexdigest()
+
+
+class ModelCache:
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        refit_seconds: Optional[float] = None,
+    ):
+        self.directory = settings["MODEL_CACHE_DIR"] if directory is None else directory
+        self.max_bytes = (
+            settings["MODEL_CACHE_MAX_BYTES"] if max_bytes is None else max_bytes
+        )
+        self.refit_seconds = (
+            settings["MODEL_REFIT_SECONDS"] if refit_seconds is None else refit_seconds
+        )
+
+    def get_or_fit(
+        self,
+        name: str,
+        fingerprint: str,
+        fit: Callable[[], Any],
+        code_hash: str = "",
+        refit_seconds: Optional[float] = None,
+    ) -> Any:
+        """
+        Get a model from the cache or fit it with fit() and cache it
+        """
+        refit_seconds = self.refit_seconds if refit_seconds is None else refit_seconds
+        entry = self.entry_path(name)
+        metadata = self._read_metadata(entry)
+        if metadata is not None and metadata["code_hash"] == code_hash and (
+            metadata["fingerprint"] == fingerprint
+            or (
+                refit_seconds is not None
+                and time.time() - metadata["fitted_at"] < refit_seconds
+            )
+        ):
+            try:
+                with open(os.path.join(entry, MODEL_FILE), "rb") as model_file:
+                    model_bytes = model_file.read()
+                # A model that is not the one of the metadata is being replaced
+                if hashlib.sha1(model_bytes).hexdigest() == metadata.get("model_hash"):
+                    model = pickle.loads(model_bytes)
+                    # Entries are evicted by least recent use
+                    os.utime(entry)
+                    return model
+            except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+                pass
+
+        model = fit()
+        self._store(
+            entry,
+            model,
+            {
+                "name": name,
+                "fingerprint": fingerprint,
+                "code_hash": code_hash,
+                "fitted_at": time.time(),
+            },
+        )
+        return model
+
+    def entry_path(self, name: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(name.encode()).hexdigest())
+
+    def evict(self, keep: Optional[str] = None):
+        """
+        Remove the least recently used entries (other than keep) until the cache
+        fits in max_bytes
+        """
+        if not os.path.isdir(self.directory):
+            return
+        entries = [
+            os.path.join(self.directory, entry)
+            for entry in os.listdir(self.directory)
+            if os.path.isfile(os.path.join(self.directory, entry, MODEL_FILE))
+            and os.path.join(self.directory, entry) != keep
+        ]
+        sizes = {entry: self._entry_size(entry) for entry in entries}
+        total_size = sum(sizes.values()) + (self._entry_size(keep) if keep else 0)
+        for entry in sorted(entries, key=os.path.getmtime):
+            if total_size <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total_size -= sizes[entry]
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _store(self, entry: str, model: Any, metadata: dict):
+        os.makedirs(entry, exist_ok=True)
+        model_bytes = pickle.dumps(model)
+        metadata = {**metadata, "model_hash": hashlib.sha1(model_bytes).hexdigest()}
+        # Write then rename so that concurrent runs never read a partial file. The
+        # metadata is written last and names the hash of its model, so that a model
+        # is only loaded along with its own metadata.
+        for file_name, contents in (
+            (MODEL_FILE, model_bytes),
+            (METADATA_FILE, json.dumps(metadata).encode()),
+        ):
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=entry)
+            with os.fdopen(file_descriptor, "wb") as temporary_file:
+                temporary_file.write(contents)
+            os.replace(temporary_path, os.path.join(entry, file_name))
+        self.evict(keep=entry)
+
+    @staticmethod
+    def _read_metadata(entry: str) -> Optional[dict]:
+        try:
+            with open(os.path.join(entry, METADATA_FILE)) as metadata_file:
+                return json.load(metadata_file)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _entry_size(entry: str) -> int:
+        return sum(
+            os.path.getsize(os.path.join(entry, file_name))
+            for file_name in os.listdir(entry)
+            if os.path.isfile(os.path.join(entry, file_name))
+        )
+
+
+model_cache = ModelCache()
+
+
+def rule_model(
+    check,
+    fit: Callable[[], Any],
+    training_data: Optional[pd.DataFrame | pd.Series] = None,
+    fingerprint: Optional[str] = None,
+    refit_seconds: Optional[float] = None,
+    cache: Optional[ModelCache] = None,
+) -> Any:
+    """
+    Model of the rule being executed, from the cache or fitted with fit(). The
+    training data is identified by its fingerprint, computed from training_data if
+    not given.
+    """
+    if fingerprint is None:
+        if training_data is None:
+            raise ValueError("Either training_data or fingerprint is required")
+        fingerprint = frame_fingerprint(training_data)
+    rule_hash = check.current_rule_hash()
+    rule, _ = check._internal["current_rule"]
+    code_hash = hashlib.sha1(
+        class_utils.get_function_code(type(check), rule).encode()
+    ).hexdigest()
+    return (model_cache if cache is None else cache).get_or_fit(
+        rule_hash,
+        fingerprint,
+        fit,
+        code_hash=code_hash,
+        refit_seconds=refit_seconds,
+    )
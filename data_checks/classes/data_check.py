@@ -39,7 +39,8 @@ class DataCheck(Check):
         """
         Setup the check. Use this to load data, initialize models, etc.
         For example `self.df = pd.read_csv("data.csv")` sets a dataframe
-        for all the rules to use.
+        for all the rules to use. To load data once and share it between
+        checks, declare a fixture instead (see data_checks.base.fixture).
         """
         super().setup()
 
@@ -1,6 +1,8 @@
+from typing import Any, Callable
 from data_checks.conf.settings import settings
 from data_checks.base.check import Check
 from data_checks.base.suite import Suite
+from data_checks.base.fixture import Fixture
 
 
 class DataSuite(Suite):
@@ -58,6 +60,21 @@ class DataSuite(Suite):
             "schedule": settings["DEFAULT_SCHEDULE"],  # default to run every day at 8am
         }
 
+    @classmethod
+    def prefetch(cls) -> list[Fixture | Callable[[], Any]]:
+        """
+        Data to load before each scheduled run when deploying with a prefetch lead
+        time (--prefetch or PREFETCH_SECONDS). Fixtures are evaluated in the scheduler
+        process, and each run inherits their values. Other functions are called to
+        warm their data, e.g. `lambda: MmapSource("events.csv").convert()`.
+        For example:
+        [
+            users_fixture,
+            lambda: MmapSource("events.csv").convert(),
+        ]
+        """
+        return []
+
     @classmethod
     def checks(cls) -> list[type | str | Check]:
         """
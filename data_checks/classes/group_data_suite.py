@@ -1,15 +1,40 @@
+import hashlib
 import json
+import os
+import time
+from datetime import datetime
+from typing import Any, Optional
+from multiprocessing import Pool
+from data_checks.conf.settings import settings
 from data_checks.classes.data_suite import DataSuite
 from data_checks.base.check import Check
+from data_checks.base.exceptions import SkipExecutionException
+from data_checks.base.failure_groups import shared_failure_groups
+from data_checks.base.fixture import fixture_scopes
+from data_checks.base.actions.execution_context import ExecutionContext
+from data_checks.base.actions.suite import SuiteAction
+from data_checks.base.suite_helper_types import CheckResult
+from data_checks.base.result_matrix import ResultMatrix
 from data_checks.conf.data_check_registry import data_check_registry
+from data_checks.utils import generator_utils
 
 """
-Suite of checks that run on a specific pre-defined group of data. For instance you might have checks on each Item in the Items table. 
+Suite of checks that run on a specific pre-defined group of data. For instance you might have checks on each Item in the Items table.
 This suite allows you to pass Item item to each check across all Items and checks.
 """
 
 
 class GroupDataSuite(DataSuite):
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        actions: list[type[SuiteAction]] = [],
+    ):
+        super().__init__(name=name, actions=actions)
+        # Results of the last run, keyed by the index of the element in the group
+        self.group_results: dict[int, list[CheckResult]] = {}
+        self.result_matrix: Optional[ResultMatrix] = None
+
     @classmethod
     def group_name(cls) -> str:
         """
@@ -26,6 +51,31 @@ class GroupDataSuite(DataSuite):
         """
         raise NotImplementedError
 
+    @classmethod
+    def group_key(cls, element: Any) -> str:
+        """
+        Short and stable key identifying an element of the group, for example
+        `str(element.product_id)`. It is used to name the check run on the element
+        and therefore in the hashes of its rules. Defaults to the JSON dump of the
+        element.
+        """
+        return json.dumps(element, default=str)
+
+    @classmethod
+    def element_hash(cls, element: Any) -> Optional[str]:
+        """
+        Hash used to find identical elements when the `deduplicate` option of
+        suite_config is enabled. Elements with the same hash are only checked once.
+        Defaults to a hash of the JSON dump of the element with sorted keys, so
+        that dicts with the same items are identical whatever their insertion
+        order. Return None to never deduplicate an element.
+        """
+        try:
+            element_json = json.dumps(element, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha1(element_json.encode()).hexdigest()
+
     @classmethod
     def group_checks(cls) -> list[type[Check] | str | Check]:
         """
@@ -51,24 +101,211 @@ class GroupDataSuite(DataSuite):
         Do not override this method. Override group_checks instead.
         """
         checks = []
+        group = cls.group()
+        for check in cls._get_group_checks():
+            for element in group:
+                checks.append(cls._check_for_element(check, element))
+        return checks
+
+    def run(self):
+        """
+        Run the group's checks on every element, one element after the other
+        """
+        try:
+            self.setup()
+            group = self.group()
+            elements, duplicates = self._get_elements_to_run(group)
+            group_results = self._exec_chunk(elements)
+            self._set_results(group, group_results, duplicates)
+            self.teardown()
+        finally:
+            fixture_scopes.release("suite")
+
+    def run_async(self):
+        """
+        Run the group's checks on a bounded pool of worker processes. The group is
+        split into chunks and each worker runs every group check over one chunk,
+        returning the results for its elements. The chunk size and the number of
+        workers can be set through the `chunk_size` and `max_workers` options of
+        suite_config (defaulting to GROUP_CHUNK_SIZE and MAX_WORKERS).
+        """
+        try:
+            self.setup()
+            config = self.suite_config() or {}
+            chunk_size = config.get("chunk_size", settings["GROUP_CHUNK_SIZE"])
+            max_workers = config.get("max_workers", settings["MAX_WORKERS"])
+
+            group = self.group()
+            elements, duplicates = self._get_elements_to_run(group)
+            chunks = generator_utils.chunks(elements, chunk_size)
+            group_results: dict[int, list[CheckResult]] = {}
+            # Failures are grouped across the workers as they happen
+            with shared_failure_groups(self._internal), Pool(
+                processes=max_workers
+            ) as pool:
+                for index, chunk_results in enumerate(
+                    pool.imap_unordered(self._exec_chunk, chunks)
+                ):
+                    print(f"[{index + 1}/{len(chunks)} Chunks] ASYNC RUN finished")
+                    group_results.update(chunk_results)
+            self._set_results(group, group_results, duplicates)
+
+            self.teardown()
+        finally:
+            fixture_scopes.release("suite")
+
+    @classmethod
+    def _get_group_checks(cls) -> list[type[Check] | Check]:
+        """
+        Internal: Resolve the registered names in group_checks to check classes
+        """
+        group_checks = []
         for check in cls.group_checks():
             if isinstance(check, str):
                 registered_check = data_check_registry[check]
                 if registered_check is None or not issubclass(registered_check, Check):
                     raise ValueError(f"Check {check} is not registered")
                 check = data_check_registry[check]
+            group_checks.append(check)
+        return group_checks
 
-            for element in cls.group():
-                check_name = f"{check.__name__}::{cls.group_name()}-{json.dumps(element, default=str)}"
-                if isinstance(check, Check):
-                    updated_check = check
-                else:
-                    updated_check = check()
-                updated_check.name = check_name
-                updated_check._set_additional_properties(
-                    {
-                        cls.group_name(): element,
-                    }
+    @classmethod
+    def _check_for_element(cls, check: type[Check] | Check, element: Any) -> Check:
+        """
+        Internal: Create the check that runs on a single element of the group
+        """
+        check_name = cls._element_check_name(check.__name__, element)
+        if isinstance(check, Check):
+            updated_check = check
+        else:
+            updated_check = check()
+        updated_check.name = check_name
+        updated_check._set_additional_properties(
+            {
+                cls.group_name(): element,
+            }
+        )
+        return updated_check
+
+    @classmethod
+    def _element_check_name(cls, check_type: str, element: Any) -> str:
+        """
+        Internal: Name of the check of type check_type run on an element
+        """
+        return f"{check_type}::{cls.group_name()}-{cls.group_key(element)}"
+
+    def _get_elements_to_run(
+        self, group: list
+    ) -> tuple[list[tuple[int, Any]], dict[int, list[int]]]:
+        """
+        Internal: Get the (index, element) pairs to run. If the `deduplicate` option
+        of suite_config is enabled, only the first of identical elements is run and
+        the indexes of its duplicates are returned keyed by its index.
+        """
+        config = self.suite_config() or {}
+        if not config.get("deduplicate", False):
+            return list(enumerate(group)), {}
+
+        elements: list[tuple[int, Any]] = []
+        duplicates: dict[int, list[int]] = {}
+        first_index_for_hash: dict[str, int] = {}
+        for index, element in enumerate(group):
+            element_hash = self.element_hash(element)
+            if element_hash is not None and element_hash in first_index_for_hash:
+                duplicates[first_index_for_hash[element_hash]].append(index)
+                continue
+            if element_hash is not None:
+                first_index_for_hash[element_hash] = index
+                duplicates[index] = []
+            elements.append((index, element))
+
+        print(f"Running {len(elements)} distinct elements out of {len(group)}")
+        return elements, duplicates
+
+    def _set_results(
+        self,
+        group: list,
+        group_results: dict[int, list[CheckResult]],
+        duplicates: dict[int, list[int]] = {},
+    ):
+        """
+        Internal: Store the results of a run as a result matrix, attributing the
+        results of deduplicated elements to all their duplicates. The failures of
+        the duplicates are counted in their failure groups as well. The matrix is
+        saved to RESULTS_DIR as one artifact per run if the setting is defined.
+        """
+        failure_groups = self._internal["failure_groups"]
+        for index, duplicate_indexes in duplicates.items():
+            for duplicate_index in duplicate_indexes:
+                group_results[duplicate_index] = group_results[index]
+                for check_result in group_results[index]:
+                    check_name = self._element_check_name(
+                        check_result["check"].split("::", 1)[0], group[duplicate_index]
+                    )
+                    for rule_result in check_result["rules"]:
+                        if rule_result["fingerprint"] in failure_groups:
+                            failure_groups.add_occurrence(
+                                rule_result["fingerprint"], check_name
+                            )
+        self.group_results = group_results
+        self.result_matrix = ResultMatrix.from_group_results(
+            [self.group_key(element) for element in group], group_results
+        )
+        print(self.result_matrix.summary())
+        if settings["RESULTS_DIR"]:
+            self.result_matrix.save(
+                os.path.join(
+                    settings["RESULTS_DIR"],
+                    f"{self.name}-{datetime.now().strftime('%Y%m%d%H%M%S')}.npz",
                 )
-                checks.append(updated_check)
-        return checks
+            )
+
+    def _exec_chunk(self, chunk: list[tuple[int, Any]]) -> dict[int, list[CheckResult]]:
+        """
+        Internal: Run all the group checks on a chunk of (index, element) pairs
+        """
+        group_checks = self._get_group_checks()
+        chunk_results: dict[int, list[CheckResult]] = {}
+        for index, element in chunk:
+            checks = self.get_checks(
+                [self._check_for_element(check, element) for check in group_checks]
+            )
+            chunk_results[index] = []
+            for check in checks:
+                print(f"[Element {index + 1}] {check}")
+                chunk_results[index].append(self._exec_group_check(check))
+        return chunk_results
+
+    def _exec_group_check(self, check: Check) -> CheckResult:
+        """
+        Internal: Run a check on its element and aggregate the results of its rules
+        """
+        check_result: CheckResult = {
+            "check": check.name,
+            "check_type": type(check).__name__,
+            "status": "skipped",
+            "duration": 0.0,
+            "rules": [],
+        }
+        context = ExecutionContext()
+        context.set_sys("check", check)
+        try:
+            self.before(context)
+        except SkipExecutionException as e:
+            return check_result
+        start_time = time.time()
+        try:
+            check_result["rules"] = check.run_all()
+            check_result["status"] = (
+                "failure"
+                if any(rule["status"] == "failure" for rule in check_result["rules"])
+                else "success"
+            )
+            self.on_success(context)
+        except Exception as e:
+            check_result["status"] = "failure"
+            context.set_sys("exception", e)
+            self.on_failure(context)
+        check_result["duration"] = time.time() - start_time
+        self.after(context)
+        return check_result
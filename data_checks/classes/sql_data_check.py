@@ -0,0 +1,171 @@
+from typing import Any, Optional
+from sqlalchemy import Engine, create_engine
+from data_checks.conf.settings import settings
+from data_checks.conf.data_source_registry import data_source_registry
+from data_checks.classes.data_check import DataCheck
+from data_checks.rules.sql_rules import (
+    SqlRule,
+    fused_query,
+    split_fused_row,
+    table_clause,
+)
+
+"""
+Check whose rules are declared as SQL rule specs and run inside the source database.
+For example:
+
+    class UsersCheck(SqlDataCheck):
+        @classmethod
+        def source(cls):
+            return "warehouse"
+
+        @classmethod
+        def sql_rules(cls):
+            return {
+                "public.users": [
+                    NotNull("email"),
+                    Unique("email"),
+                    InRange("age", min=0, max=150),
+                    Freshness("created_at", max_age=timedelta(days=1)),
+                ]
+            }
+
+creates the rules rule_sql_public_users_notnull_email, rule_sql_public_users_unique_email, etc.
+The first of these rules to run computes the aggregates of every rule on its table in a
+single query (before forking the rule processes in asynchronous runs). Regular rule_
+methods can be defined alongside.
+"""
+
+
+class SqlDataCheck(DataCheck):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for table_name, sql_rules in cls.sql_rules().items():
+            names = [sql_rule.name for sql_rule in sql_rules]
+            duplicates = sorted({name for name in names if names.count(name) > 1})
+            if duplicates:
+                raise ValueError(
+                    f"Duplicate SQL rule names on {table_name} in {cls.__name__}: "
+                    f"{duplicates}. Set the name of the rules to tell them apart."
+                )
+            for sql_rule in sql_rules:
+                setattr(
+                    cls,
+                    cls._sql_rule_method_name(table_name, sql_rule),
+                    cls._sql_rule_method(table_name, sql_rule),
+                )
+
+    def __init__(self, *args, **kwargs):
+        self._sql_aggregates: dict[str, dict[str, dict[str, Any]]] = {}
+        self._engine: Optional[Engine] = None
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def source(cls) -> str | Engine:
+        """
+        Database the SQL rules run in, as the name of a data source in DATA_SOURCES,
+        a SQLAlchemy URL or an engine
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def sql_rules(cls) -> dict[str, list[SqlRule]]:
+        """
+        SQL rules to run, keyed by table name ("table" or "schema.table")
+        """
+        return {}
+
+    def setup(self):
+        # Aggregates are recomputed on every run of the check
+        self._sql_aggregates = {}
+        super().setup()
+
+    def prepare_async(self, rules_to_run: set[str]):
+        """
+        Compute the aggregates of the tables with rules to run once, in the parent
+        process, so that the rule processes inherit them
+        """
+        super().prepare_async(rules_to_run)
+        for table_name, sql_rules in self.sql_rules().items():
+            if not any(
+                self._sql_rule_method_name(table_name, sql_rule) in rules_to_run
+                for sql_rule in sql_rules
+            ):
+                continue
+            try:
+                self._get_table_aggregates(table_name)
+            except Exception as e:
+                # The rules report the error
+                print(f"\tCould not compute the aggregates of {table_name}: {e}")
+        if self._engine is not None:
+            # Connections are not shared with the rule processes
+            self._engine.dispose()
+
+    def teardown(self):
+        super().teardown()
+        if self._engine is not None:
+            self._engine.dispose()
+            self._engine = None
+
+    def get_engine(self) -> Engine:
+        source = self.source()
+        if isinstance(source, Engine):
+            return source
+        if source in data_source_registry:
+            return data_source_registry[source]
+        if self._engine is None:
+            self._engine = create_engine(source)
+        return self._engine
+
+    @staticmethod
+    def _sql_rule_method_name(table_name: str, sql_rule: SqlRule) -> str:
+        return f"rule_sql_{table_name.replace('.', '_')}_{sql_rule.name}"
+
+    @staticmethod
+    def _sql_rule_method(table_name: str, sql_rule: SqlRule):
+        """
+        Internal: Create the rule method of a SQL rule
+        """
+
+        def rule(self):
+            return self._exec_sql_rule(table_name, sql_rule)
+
+        rule.__name__ = SqlDataCheck._sql_rule_method_name(table_name, sql_rule)
+        # Stored as the code of the rule in the checks database
+        rule.rule_source = f"{table_name}: {sql_rule!r}"
+        return rule
+
+    def _exec_sql_rule(self, table_name: str, sql_rule: SqlRule) -> dict[str, Any]:
+        """
+        Internal: Check the aggregates of a SQL rule, fetching a sample of the
+        failing rows if it fails
+        """
+        values = self._get_table_aggregates(table_name)[sql_rule.name]
+        message = sql_rule.failure_message(values)
+        if message is None:
+            return values
+
+        source = table_clause(table_name, self.sql_rules()[table_name])
+        with self.get_engine().connect() as connection:
+            sample = sql_rule.failure_sample(
+                connection, source, settings["SQL_FAILURE_SAMPLE_SIZE"]
+            )
+        raise AssertionError(f"{table_name}: {message}. Sample: {sample}")
+
+    def _get_table_aggregates(self, table_name: str) -> dict[str, dict[str, Any]]:
+        """
+        Internal: Aggregates of all the SQL rules on a table, keyed by rule name.
+        Computed with a single query the first time a rule on the table runs.
+        """
+        if table_name not in self._sql_aggregates:
+            sql_rules = self.sql_rules()[table_name]
+            query = fused_query(table_clause(table_name, sql_rules), sql_rules)
+            with self.get_engine().connect() as connection:
+                row = dict(connection.execute(query).one()._mapping)
+            self._sql_aggregates[table_name] = {
+                sql_rule.name: values
+                for sql_rule, values in zip(
+                    sql_rules, split_fused_row(row, sql_rules)
+                )
+            }
+        return self._sql_aggregates[table_name]
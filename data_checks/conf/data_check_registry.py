@@ -1,6 +1,7 @@
 from data_checks.conf.settings import settings
 from data_checks.utils import class_utils
 from data_checks.classes.data_check import DataCheck
+from data_checks.classes.sql_data_check import SqlDataCheck
 
 
 class DataCheckRegistry:
@@ -11,6 +12,7 @@ class DataCheckRegistry:
             checks = class_utils.classes_for_directory(
                 settings["CHECKS_MODULE"],
                 DataCheck,
+                [SqlDataCheck],
             )
 
             self.checks: dict[str, type[DataCheck]] = {
@@ -0,0 +1,67 @@
+import os
+from typing import Any
+from sqlalchemy import Engine, create_engine
+from data_checks.conf.settings import settings
+
+"""
+Named data sources shared by all the checks of a process. Sources are declared in
+the settings module:
+
+    DATA_SOURCES = {
+        "warehouse": "postgresql://localhost:5432/warehouse",
+        "events": {"url": "postgresql://localhost:5432/events", "pool_size": 10},
+    }
+
+and used with `data_source_registry["warehouse"]`, which returns a pooled engine
+created on first use.
+"""
+
+
+class DataSourceRegistry:
+    def __init__(self):
+        self.sources: dict[str, str | dict[str, Any]] = settings["DATA_SOURCES"] or {}
+        self.engines: dict[str, Engine] = {}
+        self.pid = os.getpid()
+        # Connections of the parent's pools must not be used by forked workers
+        os.register_at_fork(after_in_child=self._reset_after_fork)
+
+    def __getitem__(self, name: str) -> Engine:
+        if os.getpid() != self.pid:
+            self._reset_after_fork()
+        if name not in self.engines:
+            if name not in self.sources:
+                raise KeyError(
+                    f"Data source {name} is not defined in DATA_SOURCES. Options: {list(self.sources)}"
+                )
+            options = self.sources[name]
+            if isinstance(options, str):
+                options = {"url": options}
+            options = dict(options)
+            self.engines[name] = create_engine(
+                options.pop("url"), pool_pre_ping=True, **options
+            )
+        return self.engines[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.sources
+
+    def dispose(self):
+        """
+        Close the pooled connections of all the sources
+        """
+        for engine in self.engines.values():
+            engine.dispose()
+
+    def _reset_after_fork(self):
+        """
+        Internal: Replace the inherited pools without closing the parent's connections
+        """
+        for engine in self.engines.values():
+            engine.dispose(close=False)
+        self.pid = os.getpid()
+
+    def __str__(self) -> str:
+        return ",".join(self.sources.keys())
+
+
+data_source_registry = DataSourceRegistry()
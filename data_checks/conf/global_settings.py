@@ -2,4 +2,19 @@ CHECKS_DATABASE_URL = None
 CHECKS_MODULE = None
 SUITES_MODULE = None
 ALERTING_ENDPOINT = None
+DATA_SOURCES = None  # name -> SQLAlchemy URL or dict of create_engine options with a "url"
 DEFAULT_SCHEDULE = "0 8 * * *"
+PREFETCH_SECONDS = None  # seconds before each scheduled run to load the suites' prefetch data
+MAX_WORKERS = None  # defaults to the number of CPUs
+GROUP_CHUNK_SIZE = 100
+RESULTS_DIR = None  # directory where group suites store their result matrices
+FAILURE_SAMPLE_SIZE = 10  # element keys kept per group of identical failures
+MAX_SOFT_FAILURES = 100  # soft assertion failures collected per rule
+DATA_CACHE_DIR = ".data_checks_cache"
+DATA_CACHE_MAX_BYTES = 1024**3
+MODEL_CACHE_DIR = ".data_checks_models"
+MODEL_CACHE_MAX_BYTES = 1024**3
+# Minimum age of a cached model before a refit on new data, 0 to refit on every change
+MODEL_REFIT_SECONDS = 24 * 3600
+SOURCE_CHUNK_SIZE = 100_000  # rows per chunk of chunked sources
+SQL_FAILURE_SAMPLE_SIZE = 5  # failing rows fetched when a SQL rule fails
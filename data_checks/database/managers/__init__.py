@@ -3,3 +3,5 @@ from .suite_manager import SuiteManager
 from .check_manager import CheckManager
 from .rule_manager import RuleManager
 from .rule_execution_manager import RuleExecutionManager
+from .failure_group_manager import FailureGroupManager
+from .rule_state_manager import RuleStateManager
@@ -0,0 +1,45 @@
+from typing import Optional
+from data_checks.database.managers.base_manager import BaseManager
+from data_checks.database.managers.models import FailureGroup
+from data_checks.database.utils.session_utils import session_scope
+
+
+class FailureGroupManager(BaseManager):
+    model = FailureGroup
+
+    @staticmethod
+    def create_failure_group(
+        fingerprint: str,
+        rule_name: str,
+        count: int,
+        suite_id: Optional[int] = None,
+        exception_type: Optional[str] = None,
+        message: Optional[str] = None,
+        exception: Optional[str] = None,
+        traceback: Optional[str] = None,
+        sample_keys: Optional[str] = None,
+    ) -> FailureGroup:
+        new_failure_group = FailureGroup.create(
+            fingerprint=fingerprint,
+            rule_name=rule_name,
+            count=count,
+            suite_id=suite_id,
+            exception_type=exception_type,
+            message=message,
+            exception=exception,
+            traceback=traceback,
+            sample_keys=sample_keys,
+        )
+        with session_scope() as session:
+            session.add(new_failure_group)
+        return new_failure_group
+
+    @staticmethod
+    def latest(fingerprint: str) -> Optional[FailureGroup]:
+        with session_scope() as session:
+            return (
+                session.query(FailureGroup)
+                .filter(FailureGroup.fingerprint == fingerprint)
+                .order_by(FailureGroup.created_at.desc())
+                .first()
+            )
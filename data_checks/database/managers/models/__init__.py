@@ -3,3 +3,5 @@ from data_checks.database.managers.models.suite import Suite
 from data_checks.database.managers.models.check import Check
 from data_checks.database.managers.models.rule import Rule
 from data_checks.database.managers.models.rule_execution import RuleExecution
+from data_checks.database.managers.models.failure_group import FailureGroup
+from data_checks.database.managers.models.rule_state import RuleState
@@ -0,0 +1,25 @@
+from sqlalchemy import Integer, String, UnicodeText, ForeignKey
+from sqlalchemy.orm import mapped_column, Mapped
+from data_checks.database.managers.models.classes import Base
+from data_checks.database.managers.models.mixins import BaseMixin
+
+
+class FailureGroup(Base, BaseMixin):
+    """
+    Identical rule failures of a suite run collapsed into one record
+    """
+
+    __tablename__ = "failure_groups"
+
+    suite_id: Mapped[int] = mapped_column(ForeignKey("suites.id"), nullable=True)
+    fingerprint: Mapped[str] = mapped_column(String(255), index=True)
+    rule_name: Mapped[str] = mapped_column(String(255))
+    exception_type: Mapped[str] = mapped_column(String(255), nullable=True)
+    message: Mapped[str] = mapped_column(UnicodeText(), nullable=True)
+    exception = mapped_column(UnicodeText(), nullable=True)
+    traceback: Mapped[str] = mapped_column(UnicodeText(), nullable=True)
+    count: Mapped[int] = mapped_column(Integer, default=1)
+    sample_keys: Mapped[str] = mapped_column(UnicodeText(), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"FailureGroup(id={self.id!r}, fingerprint={self.fingerprint!r}, count={self.count!r})"
@@ -0,0 +1,24 @@
+import datetime
+from sqlalchemy import DateTime, String, UnicodeText
+from sqlalchemy.orm import mapped_column, Mapped
+from data_checks.database.managers.models.classes import Base
+from data_checks.database.managers.models.mixins import BaseMixin
+
+
+class RuleState(Base, BaseMixin):
+    """
+    State persisted by a rule between runs (watermarks, sketches, baselines...)
+    """
+
+    __tablename__ = "rule_states"
+
+    key: Mapped[str] = mapped_column(String(255), unique=True, index=True)
+    kind: Mapped[str] = mapped_column(String(255))
+    rule_hash: Mapped[str] = mapped_column(UnicodeText())
+    state: Mapped[str] = mapped_column(UnicodeText(), nullable=True)
+    updated_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    def __repr__(self) -> str:
+        return f"RuleState(id={self.id!r}, kind={self.kind!r}, rule_hash={self.rule_hash!r})"
@@ -33,7 +33,7 @@ class RuleExecutionManager(BaseManager):
     @staticmethod
     def update_execution(
         execution_id: int,
-        finished_at: datetime = datetime.now(),
+        finished_at: Optional[datetime] = None,
         status: Optional[str] = None,
         params: Optional[str] = None,
         logs: Optional[str] = None,
@@ -48,6 +48,6 @@ class RuleExecutionManager(BaseManager):
                     logs=logs,
                     traceback=traceback,
                     exception=exception,
-                    finished_at=finished_at,
+                    finished_at=finished_at or datetime.now(),
                 )
             )
@@ -0,0 +1,25 @@
+from typing import Optional
+import datetime
+from data_checks.database.managers.base_manager import BaseManager
+from data_checks.database.managers.models import RuleState
+from data_checks.database.utils.session_utils import session_scope
+
+
+class RuleStateManager(BaseManager):
+    model = RuleState
+
+    @staticmethod
+    def get(key: str) -> Optional[RuleState]:
+        with session_scope() as session:
+            return session.query(RuleState).filter_by(key=key).first()
+
+    @staticmethod
+    def set(key: str, kind: str, rule_hash: str, state: str) -> RuleState:
+        with session_scope() as session:
+            rule_state = session.query(RuleState).filter_by(key=key).first()
+            if rule_state is None:
+                rule_state = RuleState.create(key=key, kind=kind, rule_hash=rule_hash)
+            rule_state.state = state
+            rule_state.updated_at = datetime.datetime.utcnow()
+            session.add(rule_state)
+        return rule_state
@@ -101,7 +101,8 @@ if __name__ == "__main__":
             check = check()
             update_actions(
                 check,
-                default_check_actions + [ExecutionDatabaseAction],
+                # Stores the execution first so that the other actions get its id
+                [ExecutionDatabaseAction] + default_check_actions,
             )
             scheduler.add_job(
                 start_check_deployment,
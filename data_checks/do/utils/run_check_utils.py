@@ -3,6 +3,7 @@ import re
 from multiprocessing import Process
 from data_checks.base.actions.check import CheckAction
 from data_checks.classes.data_check import DataCheck
+from data_checks.base.fixture import fixture_scopes
 
 
 def validate_cron_expression(value):
@@ -52,4 +53,5 @@ def run_checks(
             update_actions(check, check_actions)
             check.run_all()
             count += 1
+    fixture_scopes.release("run")
     return
@@ -0,0 +1,198 @@
+"""
+Column statistics computed once and shared by all the rules of a check run.
+
+    class UsersCheck(DataCheck):
+        profile = profile_of("users")
+
+        def rule_few_missing_emails(self):
+            assert self.profile["email"].null_fraction < 0.01
+
+Statistics are computed lazily on first access. The order statistics (min, max,
+distinct count, quantiles) all come from a single sort of the column's non-null values.
+"""
+from functools import cached_property
+from typing import Any, Callable, Iterable, Optional
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+from data_checks.base.fixture import Fixture
+
+
+class ColumnProfile:
+    """
+    Memoized statistics of a column
+    """
+
+    def __init__(self, values: pd.Series):
+        self.values = values
+        self._quantiles: dict[float, Any] = {}
+
+    @cached_property
+    def count(self) -> int:
+        return len(self.values)
+
+    @cached_property
+    def null_count(self) -> int:
+        return int(self._null_mask.sum())
+
+    @property
+    def null_fraction(self) -> float:
+        return self.null_count / self.count if self.count else 0.0
+
+    @cached_property
+    def distinct_count(self) -> int:
+        """
+        Number of distinct non-null values
+        """
+        sorted_values = self._sorted
+        if sorted_values is None:
+            return int(self.values.nunique(dropna=True))
+        if len(sorted_values) == 0:
+            return 0
+        return int(np.count_nonzero(sorted_values[1:] != sorted_values[:-1])) + 1
+
+    @property
+    def distinct_fraction(self) -> float:
+        """
+        Distinct non-null values over non-null values, 1.0 when they are unique
+        """
+        non_null_count = self.count - self.null_count
+        return self.distinct_count / non_null_count if non_null_count else 1.0
+
+    @cached_property
+    def min(self) -> Any:
+        """
+        Smallest non-null value, None if there is none or the values cannot be ordered
+        """
+        sorted_values = self._sorted
+        if sorted_values is None or len(sorted_values) == 0:
+            return None
+        return _scalar(sorted_values[0])
+
+    @cached_property
+    def max(self) -> Any:
+        """
+        Largest non-null value, None if there is none or the values cannot be ordered
+        """
+        sorted_values = self._sorted
+        if sorted_values is None or len(sorted_values) == 0:
+            return None
+        return _scalar(sorted_values[-1])
+
+    @cached_property
+    def mean(self) -> Optional[float]:
+        if not self._is_numeric:
+            return None
+        return float(self.values.mean())
+
+    @cached_property
+    def std(self) -> Optional[float]:
+        if not self._is_numeric:
+            return None
+        return float(self.values.std())
+
+    def quantile(self, q: float) -> Any:
+        """
+        Quantile of the non-null values (linear interpolation for numeric columns)
+        """
+        if q not in self._quantiles:
+            self._quantiles[q] = self._compute_quantile(q)
+        return self._quantiles[q]
+
+    def quantiles(self, qs: Iterable[float]) -> dict[float, Any]:
+        return {q: self.quantile(q) for q in qs}
+
+    def __repr__(self) -> str:
+        return f"ColumnProfile(name={self.values.name!r}, count={self.count})"
+
+    @cached_property
+    def _null_mask(self) -> np.ndarray:
+        return self.values.isna().to_numpy()
+
+    @cached_property
+    def _is_numeric(self) -> bool:
+        return is_numeric_dtype(self.values.dtype) and not is_bool_dtype(
+            self.values.dtype
+        )
+
+    @cached_property
+    def _sorted(self) -> Optional[np.ndarray]:
+        """
+        Sorted non-null values, None if the values cannot be ordered
+        """
+        non_null = self.values[~self._null_mask]
+        if isinstance(non_null.dtype, pd.CategoricalDtype):
+            non_null = non_null.astype(non_null.cat.categories.dtype)
+        try:
+            return np.sort(non_null.to_numpy(), kind="stable")
+        except TypeError:
+            return None
+
+    def _compute_quantile(self, q: float) -> Any:
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantile {q} is not between 0 and 1")
+        sorted_values = self._sorted
+        if sorted_values is None:
+            raise TypeError(f"Values of {self.values.name} cannot be ordered")
+        if len(sorted_values) == 0:
+            return None
+        position = q * (len(sorted_values) - 1)
+        lower = int(np.floor(position))
+        upper = min(lower + 1, len(sorted_values) - 1)
+        if not self._is_numeric or lower == upper:
+            return _scalar(sorted_values[lower])
+        fraction = position - lower
+        return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+
+def _scalar(value: Any) -> Any:
+    if isinstance(value, (np.datetime64, np.timedelta64)):
+        return pd.Timestamp(value) if isinstance(value, np.datetime64) else pd.Timedelta(value)
+    return value
+
+
+class Profile:
+    """
+    Column profiles of a dataframe, created on first access to each column
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._columns: dict[Any, ColumnProfile] = {}
+
+    def __getitem__(self, column) -> ColumnProfile:
+        if column not in self._columns:
+            self._columns[column] = ColumnProfile(self.df[column])
+        return self._columns[column]
+
+    def __repr__(self) -> str:
+        return f"Profile(columns={list(self._columns)})"
+
+
+class profile_of:
+    """
+    Check attribute giving the profile of a dataframe, memoized for the run of the
+    check. The dataframe is the name of an attribute of the check, or a function
+    taking the check, or a fixture.
+    """
+
+    def __init__(self, source: str | Callable[..., pd.DataFrame]):
+        self.source = source
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        cache: dict = instance._internal["rule_cache"].setdefault("profiles", {})
+        if self.name not in cache:
+            cache[self.name] = Profile(self._get_frame(instance))
+        return cache[self.name]
+
+    def _get_frame(self, check) -> pd.DataFrame:
+        if isinstance(self.source, str):
+            return getattr(check, self.source)
+        if isinstance(self.source, Fixture):
+            return self.source()
+        return self.source(check)
@@ -0,0 +1,441 @@
+"""
+Mergeable sketches summarizing columns too large to process exactly:
+
+    HyperLogLog -- approximate distinct count
+    KLLSketch -- approximate quantiles
+    CountMinSketch -- approximate frequencies, and TopK for the heavy hitters
+    BloomFilter -- approximate set membership
+
+Sketches are updated chunk by chunk with `update`, merged across chunks or workers
+with `merge`, and serialized with `to_dict` / `from_dict` (e.g. to persist them with
+data_checks.base.rule_state). Null values are ignored.
+"""
+import base64
+import math
+from typing import Any, Optional
+import numpy as np
+import pandas as pd
+
+UINT64 = np.uint64
+
+
+def hash_values(values) -> np.ndarray:
+    """
+    64-bit hashes of the non-null values. Integral floats hash like integers, so that
+    keys read as floats (e.g. because of nulls) match the same integer keys.
+    """
+    values = pd.Series(values)
+    array = values[values.notna()].to_numpy()
+    if array.dtype == object:
+        # e.g. numbers mixed with None
+        inferred_type = pd.api.types.infer_dtype(array, skipna=False)
+        if inferred_type in ("integer", "floating", "mixed-integer-float"):
+            try:
+                array = array.astype(
+                    np.int64 if inferred_type == "integer" else np.float64
+                )
+            except OverflowError:
+                pass
+    if array.dtype.kind == "f":
+        # Per value, so that a key hashes the same whatever the rest of the batch
+        with np.errstate(invalid="ignore"):
+            integral = (np.mod(array, 1) == 0) & (np.abs(array) < 2**63)
+        hashes = np.empty(len(array), dtype=UINT64)
+        hashes[integral] = pd.util.hash_array(array[integral].astype(np.int64))
+        hashes[~integral] = pd.util.hash_array(array[~integral])
+        return hashes
+    return pd.util.hash_array(array)
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """
+    Number of bits needed to represent each uint64
+    """
+    values = values.copy()
+    lengths = np.zeros(len(values), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        mask = values >= (UINT64(1) << UINT64(shift))
+        lengths[mask] += shift
+        values[mask] >>= UINT64(shift)
+    return lengths + (values > 0)
+
+
+def _encode(array: np.ndarray) -> str:
+    return base64.b64encode(np.ascontiguousarray(array).tobytes()).decode()
+
+
+def _decode(encoded: str, dtype) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(encoded), dtype=dtype).copy()
+
+
+class HyperLogLog:
+    """
+    Distinct count estimate with a relative error of about 1.04 / sqrt(2 ** precision)
+
+    Attributes:
+        precision -- log2 of the number of registers
+        registers -- uint8 array of the max rank seen per register
+        count -- number of values added (with repetitions)
+    """
+
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError("HyperLogLog precision must be between 4 and 18")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+        self.count = 0
+
+    def update(self, values) -> "HyperLogLog":
+        hashes = hash_values(values)
+        self.count += len(hashes)
+        index = (hashes >> UINT64(64 - self.precision)).astype(np.int64)
+        remaining = hashes & ((UINT64(1) << UINT64(64 - self.precision)) - UINT64(1))
+        rank = (64 - self.precision) - _bit_length(remaining) + 1
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+        return self
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLogs of different precisions")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        self.count += other.count
+        return self
+
+    def estimate(self) -> float:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities
+            return m * math.log(m / zeros)
+        return float(raw)
+
+    def uniqueness_ratio(self) -> float:
+        """
+        Estimated distinct values over values added
+        """
+        return min(1.0, self.estimate() / self.count) if self.count else 1.0
+
+    def to_dict(self) -> dict:
+        return {
+            "type": "hyperloglog",
+            "precision": self.precision,
+            "count": self.count,
+            "registers": _encode(self.registers),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HyperLogLog":
+        sketch = cls(data["precision"])
+        sketch.registers = _decode(data["registers"], np.uint8)
+        sketch.count = data["count"]
+        return sketch
+
+    def __repr__(self) -> str:
+        return f"HyperLogLog(precision={self.precision}, estimate={self.estimate():.0f})"
+
+
+class KLLSketch:
+    """
+    Quantile estimate of numeric values (KLL compactors), with a rank error of
+    roughly 1.7 / k
+
+    Attributes:
+        k -- capacity of the top compactor
+        levels -- float64 arrays of the items kept at each level, an item at level h
+            standing for 2 ** h values
+        count -- number of values added
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        self.k = k
+        self.levels: list[np.ndarray] = [np.empty(0)]
+        self.count = 0
+        self._random = np.random.default_rng(seed)
+
+    def update(self, values) -> "KLLSketch":
+        values = pd.to_numeric(pd.Series(values), errors="coerce").dropna()
+        self.count += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values.to_numpy(np.float64)])
+        self._compress()
+        return self
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for height, items in enumerate(other.levels):
+            self.levels[height] = np.concatenate([self.levels[height], items])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs) -> list[Optional[float]]:
+        items, weights = self._weighted_items()
+        if len(items) == 0:
+            return [None for _ in qs]
+        order = np.argsort(items, kind="stable")
+        items, cumulative_weights = items[order], np.cumsum(weights[order])
+        total = cumulative_weights[-1]
+        positions = np.searchsorted(
+            cumulative_weights, np.asarray(qs, dtype=np.float64) * total, side="left"
+        )
+        return [float(items[min(p, len(items) - 1)]) for p in positions]
+
+    def rank(self, value: float) -> float:
+        """
+        Estimated fraction of the values smaller than or equal to value
+        """
+        items, weights = self._weighted_items()
+        total = weights.sum()
+        return float(weights[items <= value].sum() / total) if total else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "type": "kll",
+            "k": self.k,
+            "count": self.count,
+            "levels": [_encode(items) for items in self.levels],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "KLLSketch":
+        sketch = cls(data["k"])
+        sketch.levels = [_decode(items, np.float64) for items in data["levels"]]
+        sketch.count = data["count"]
+        return sketch
+
+    def _weighted_items(self) -> tuple[np.ndarray, np.ndarray]:
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(len(level), 2.0**height) for height, level in enumerate(self.levels)]
+        )
+        return items, weights
+
+    def _capacity(self, height: int) -> int:
+        depth = len(self.levels) - 1 - height
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        height = 0
+        while height < len(self.levels):
+            if len(self.levels[height]) > self._capacity(height):
+                if height + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(self.levels[height])
+                # An odd item stays at its level, every other item of the rest is promoted
+                if len(items) % 2:
+                    kept, items = items[-1:], items[:-1]
+                else:
+                    kept = np.empty(0)
+                offset = int(self._random.integers(2))
+                self.levels[height + 1] = np.concatenate(
+                    [self.levels[height + 1], items[offset::2]]
+                )
+                self.levels[height] = kept
+            height += 1
+
+    def __repr__(self) -> str:
+        return f"KLLSketch(k={self.k}, count={self.count})"
+
+
+class CountMinSketch:
+    """
+    Frequency estimates that never underestimate, overestimating by at most
+    e / width * count with probability 1 - exp(-depth)
+    """
+
+    def __init__(self, width: int = 2048, depth: int = 5):
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self.count = 0
+
+    def update(self, values) -> "CountMinSketch":
+        hashes = hash_values(values)
+        self.count += len(hashes)
+        for row, columns in enumerate(self._columns(hashes)):
+            np.add.at(self.table[row], columns, 1)
+        return self
+
+    def estimate(self, values) -> np.ndarray:
+        """
+        Estimated frequency of each non-null value
+        """
+        hashes = hash_values(values)
+        return np.min(
+            [self.table[row, columns] for row, columns in enumerate(self._columns(hashes))],
+            axis=0,
+        )
+
+    def merge(self, other: "CountMinSketch") -> "CountMinSketch":
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("Cannot merge CountMinSketches of different sizes")
+        self.table += other.table
+        self.count += other.count
+        return self
+
+    def to_dict(self) -> dict:
+        return {
+            "type": "countmin",
+            "width": self.width,
+            "depth": self.depth,
+            "count": self.count,
+            "table": _encode(self.table),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CountMinSketch":
+        sketch = cls(data["width"], data["depth"])
+        sketch.table = _decode(data["table"], np.int64).reshape(
+            data["depth"], data["width"]
+        )
+        sketch.count = data["count"]
+        return sketch
+
+    def _columns(self, hashes: np.ndarray) -> list[np.ndarray]:
+        # Double hashing: the i-th row uses h1 + i * h2
+        low = (hashes & UINT64(0xFFFFFFFF)).astype(np.int64)
+        high = (hashes >> UINT64(32)).astype(np.int64)
+        return [(low + row * high) % self.width for row in range(self.depth)]
+
+
+class TopK:
+    """
+    Heavy hitters: the k most frequent values, with their Count-Min estimates
+    """
+
+    def __init__(self, k: int = 10, width: int = 2048, depth: int = 5):
+        self.k = k
+        self.counts = CountMinSketch(width, depth)
+        self.candidates: dict[Any, int] = {}
+
+    def update(self, values) -> "TopK":
+        values = pd.Series(values).dropna()
+        self.counts.update(values)
+        self._refresh(list(self.candidates) + values.unique().tolist())
+        return self
+
+    def merge(self, other: "TopK") -> "TopK":
+        self.counts.merge(other.counts)
+        self._refresh(list(self.candidates) + list(other.candidates))
+        return self
+
+    def top(self) -> list[tuple[Any, int]]:
+        """
+        (value, estimated count) pairs, most frequent first
+        """
+        return sorted(self.candidates.items(), key=lambda item: item[1], reverse=True)
+
+    def to_dict(self) -> dict:
+        return {
+            "type": "topk",
+            "k": self.k,
+            "counts": self.counts.to_dict(),
+            "candidates": [[value, count] for value, count in self.top()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TopK":
+        sketch = cls(data["k"])
+        sketch.counts = CountMinSketch.from_dict(data["counts"])
+        sketch.candidates = {value: count for value, count in data["candidates"]}
+        return sketch
+
+    def _refresh(self, candidates: list):
+        candidates = list(dict.fromkeys(candidates))
+        if not candidates:
+            return
+        estimates = self.counts.estimate(candidates)
+        best = np.argsort(-estimates, kind="stable")[: self.k]
+        self.candidates = {candidates[i]: int(estimates[i]) for i in best}
+
+
+SKETCH_TYPES = {
+    "hyperloglog": HyperLogLog,
+    "kll": KLLSketch,
+    "countmin": CountMinSketch,
+    "topk": TopK,
+}
+
+
+def sketch_from_dict(data: dict):
+    """
+    Deserialize any sketch serialized with to_dict
+    """
+    return SKETCH_TYPES[data["type"]].from_dict(data)
+
+
+class BloomFilter:
+    """
+    Set membership with no false negatives and a false positive rate of about
+    error_rate once capacity values are added
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / max(1, capacity) * math.log(2)))
+        self.bits = np.zeros((self.size + 7) // 8, dtype=np.uint8)
+        self.count = 0
+
+    def update(self, values) -> "BloomFilter":
+        hashes = hash_values(values)
+        self.count += len(hashes)
+        for positions in self._positions(hashes):
+            np.bitwise_or.at(
+                self.bits, positions >> 3, (1 << (positions & 7)).astype(np.uint8)
+            )
+        return self
+
+    def might_contain(self, values) -> np.ndarray:
+        """
+        Boolean mask, False for the values that are certainly not in the filter.
+        Null values are never in the filter.
+        """
+        values = pd.Series(values)
+        not_null = values.notna().to_numpy()
+        mask = np.zeros(len(values), dtype=bool)
+        found = np.ones(int(not_null.sum()), dtype=bool)
+        for positions in self._positions(hash_values(values)):
+            found &= ((self.bits[positions >> 3] >> (positions & 7)) & 1).astype(bool)
+        mask[not_null] = found
+        return mask
+
+    def merge(self, other: "BloomFilter") -> "BloomFilter":
+        if (other.size, other.hash_count) != (self.size, self.hash_count):
+            raise ValueError("Cannot merge BloomFilters of different sizes")
+        np.bitwise_or(self.bits, other.bits, out=self.bits)
+        self.count += other.count
+        return self
+
+    def to_dict(self) -> dict:
+        return {
+            "type": "bloom",
+            "capacity": self.capacity,
+            "error_rate": self.error_rate,
+            "count": self.count,
+            "bits": _encode(self.bits),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BloomFilter":
+        sketch = cls(data["capacity"], data["error_rate"])
+        sketch.bits = _decode(data["bits"], np.uint8)
+        sketch.count = data["count"]
+        return sketch
+
+    def _positions(self, hashes: np.ndarray) -> list[np.ndarray]:
+        low = (hashes & UINT64(0xFFFFFFFF)).astype(np.int64)
+        high = (hashes >> UINT64(32)).astype(np.int64)
+        return [(low + i * high) % self.size for i in range(self.hash_count)]
+
+    def __repr__(self) -> str:
+        return f"BloomFilter(size={self.size}, hash_count={self.hash_count}, count={self.count})"
+
+
+SKETCH_TYPES["bloom"] = BloomFilter
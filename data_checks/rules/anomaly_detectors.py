@@ -0,0 +1,339 @@
+"""
+Streaming anomaly detectors whose statistics are persisted between runs, so that
+each run only processes the points added since the previous one instead of
+refitting on the whole history:
+
+    def rule_no_anomalies(self):
+        assert_no_anomalies(self, self.metrics["value"], Welford(), threshold=3.0)
+
+Detectors:
+    Welford -- running mean and variance of all the points
+    EWMA -- exponentially weighted mean and variance, following level changes
+    SeasonalBaseline -- running mean and variance per season (hour, day of week...)
+
+A point is scored by its z-score against the statistics and is an anomaly when the
+absolute score exceeds the threshold. Anomalies do not update the statistics,
+unless reset_after of them follow each other: the statistics then restart from these
+points, so that the detector follows a level shift instead of flagging every point
+after it. No point is scored before the statistics include min_count points.
+
+The state of the detector is stored per rule hash along with the last index seen,
+and only the points with a greater index are scored on the next run. The series
+must therefore be sorted by an increasing index (timestamps or IDs).
+"""
+from typing import Any, Callable, Optional
+import numpy as np
+import pandas as pd
+from data_checks.base.check_types import AnomalyResult
+from data_checks.base.rule_state import rule_states
+
+SAMPLE_SIZE = 10
+
+
+class Welford:
+    """
+    Running mean and variance. The points of a run are scored against the statistics
+    of the previous runs, then merged into them at once.
+    """
+
+    kind = "welford"
+
+    def __init__(self, min_count: int = 10, reset_after: Optional[int] = 5):
+        self.min_count = min_count
+        self.reset_after = reset_after
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.anomalies: list[float] = []  # current streak of consecutive anomalies
+
+    def process(self, values: np.ndarray, index: pd.Index, threshold: float) -> np.ndarray:
+        """
+        Score the points, then merge the ones that are not anomalies
+        """
+        scores, (self.count, self.mean, self.m2), self.anomalies = _process_moments(
+            values,
+            (self.count, self.mean, self.m2),
+            self.anomalies,
+            threshold,
+            self.min_count,
+            self.reset_after,
+        )
+        return scores
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "anomalies": self.anomalies,
+        }
+
+    def load(self, state: dict):
+        self.count, self.mean, self.m2 = state["count"], state["mean"], state["m2"]
+        self.anomalies = state.get("anomalies", [])
+
+
+class EWMA:
+    """
+    Exponentially weighted mean and variance with smoothing factor alpha. Points are
+    scored and merged one after the other.
+    """
+
+    kind = "ewma"
+
+    def __init__(
+        self, alpha: float = 0.1, min_count: int = 10, reset_after: Optional[int] = 5
+    ):
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.min_count = min_count
+        self.reset_after = reset_after
+        self.count = 0
+        self.mean = 0.0
+        self.variance = 0.0
+        self.anomalies: list[float] = []  # current streak of consecutive anomalies
+
+    def process(self, values: np.ndarray, index: pd.Index, threshold: float) -> np.ndarray:
+        scores = np.full(len(values), np.nan)
+        for position, value in enumerate(values):
+            if self.count >= self.min_count and self.variance > 0:
+                scores[position] = (value - self.mean) / np.sqrt(self.variance)
+                if abs(scores[position]) > threshold:
+                    self.anomalies.append(float(value))
+                    if self.reset_after and len(self.anomalies) >= self.reset_after:
+                        # Level shift: restart from the streak of anomalies
+                        streak, self.anomalies = self.anomalies, []
+                        self.count, self.mean, self.variance = 0, 0.0, 0.0
+                        for streak_value in streak:
+                            self._update(streak_value)
+                    continue
+            self.anomalies = []
+            self._update(value)
+        return scores
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "variance": self.variance,
+            "anomalies": self.anomalies,
+        }
+
+    def load(self, state: dict):
+        self.count, self.mean, self.variance = (
+            state["count"],
+            state["mean"],
+            state["variance"],
+        )
+        self.anomalies = state.get("anomalies", [])
+
+    def _update(self, value: float):
+        if self.count == 0:
+            self.mean = float(value)
+        else:
+            difference = value - self.mean
+            self.mean += self.alpha * difference
+            self.variance = (1 - self.alpha) * (
+                self.variance + self.alpha * difference * difference
+            )
+        self.count += 1
+
+
+SEASONS: dict[str, Callable[[pd.DatetimeIndex], Any]] = {
+    "hour": lambda index: index.hour,
+    "dayofweek": lambda index: index.dayofweek,
+    "hourofweek": lambda index: index.dayofweek * 24 + index.hour,
+    "month": lambda index: index.month,
+}
+
+
+class SeasonalBaseline:
+    """
+    Running mean and variance per season of a datetime index. season is one of
+    SEASONS or a function of the index returning the season of each point.
+    """
+
+    kind = "seasonal"
+
+    def __init__(
+        self,
+        season: str | Callable[[pd.Index], Any] = "hour",
+        min_count: int = 5,
+        reset_after: Optional[int] = 5,
+    ):
+        if isinstance(season, str) and season not in SEASONS:
+            raise ValueError(f"Invalid season {season}. Options: {list(SEASONS)}")
+        self.season = SEASONS[season] if isinstance(season, str) else season
+        self.min_count = min_count
+        self.reset_after = reset_after
+        self.seasons: dict[str, list[float]] = {}  # season -> [count, mean, m2]
+        self.anomalies: dict[str, list[float]] = {}  # season -> streak of anomalies
+
+    def process(self, values: np.ndarray, index: pd.Index, threshold: float) -> np.ndarray:
+        scores = np.full(len(values), np.nan)
+        seasons = pd.Series(np.asarray(self.season(index))).astype(str)
+        for season, positions in seasons.groupby(seasons).indices.items():
+            scores[positions], moments, anomalies = _process_moments(
+                values[positions],
+                tuple(self.seasons.get(season, (0, 0.0, 0.0))),
+                self.anomalies.get(season, []),
+                threshold,
+                self.min_count,
+                self.reset_after,
+            )
+            self.seasons[season] = list(moments)
+            self.anomalies[season] = anomalies
+        return scores
+
+    def to_dict(self) -> dict:
+        return {"seasons": self.seasons, "anomalies": self.anomalies}
+
+    def load(self, state: dict):
+        self.seasons = state["seasons"]
+        self.anomalies = state.get("anomalies", {})
+
+
+def detect_anomalies(
+    check,
+    values: pd.Series,
+    detector: Welford | EWMA | SeasonalBaseline,
+    threshold: float = 3.0,
+    name: Optional[str] = None,
+) -> AnomalyResult:
+    """
+    Score the points of values added since the last run of the rule being executed
+    and update the persisted state of the detector. name identifies the series within
+    the rule and defaults to the name of the series.
+    """
+    name = str(name if name is not None else values.name or "values")
+    rule_hash = check.current_rule_hash()
+    kind = f"detector:{detector.kind}:{name}"
+    state = rule_states.get(rule_hash, kind)
+    last_index = None
+    if state is not None:
+        detector.load(state["detector"])
+        last_index = state["last_index"]
+
+    values = values.dropna()
+    if last_index is not None:
+        values = values[values.index > last_index]
+    points = values.to_numpy(dtype=float)
+
+    scores = detector.process(points, values.index, threshold)
+    anomalous = _anomalous(scores, threshold)
+    if len(values):
+        last_index = values.index[-1]
+    rule_states.set(
+        rule_hash, kind, {"detector": detector.to_dict(), "last_index": last_index}
+    )
+
+    return {
+        "name": name,
+        "detector": detector.kind,
+        "points": len(values),
+        "anomalies": [
+            (values.index[position], points[position], float(scores[position]))
+            for position in np.flatnonzero(anomalous)
+        ],
+        "threshold": threshold,
+    }
+
+
+def assert_no_anomalies(
+    check,
+    values: pd.Series,
+    detector: Welford | EWMA | SeasonalBaseline,
+    threshold: float = 3.0,
+    name: Optional[str] = None,
+) -> AnomalyResult:
+    """
+    Fail if detect_anomalies finds anomalies among the new points
+    """
+    result = detect_anomalies(check, values, detector, threshold, name)
+    anomalies = result["anomalies"]
+    assert not anomalies, (
+        f"{len(anomalies)} anomalies in {result['name']} out of {result['points']} new "
+        f"points ({result['detector']}, |z| > {threshold}): "
+        + ", ".join(
+            f"{index}: {value} (z={score:.2f})"
+            for index, value, score in anomalies[:SAMPLE_SIZE]
+        )
+    )
+    return result
+
+
+def _anomalous(scores: np.ndarray, threshold: float) -> np.ndarray:
+    return np.abs(np.nan_to_num(scores)) > threshold
+
+
+def _process_moments(
+    values: np.ndarray,
+    moments: tuple[int, float, float],
+    anomalies: list[float],
+    threshold: float,
+    min_count: int,
+    reset_after: Optional[int],
+) -> tuple[np.ndarray, tuple[int, float, float], list[float]]:
+    """
+    Internal: Score values against the moments (count, mean, m2) and merge the ones
+    that are not anomalies. anomalies is the streak of consecutive anomalies that
+    ended the previous points. When a streak reaches reset_after points, the moments
+    restart from it and the following points are scored against the new moments.
+    Returns the scores, the moments and the streak of anomalies at the end.
+    """
+    scores = np.full(len(values), np.nan)
+    start = 0
+    while start < len(values):
+        points = values[start:]
+        scores[start:] = _zscores(points, *moments, min_count)
+        anomalous = _anomalous(scores[start:], threshold)
+        positions = np.arange(len(points))
+        # Position of the last point that is not an anomaly, -1 if none
+        last_normal = np.maximum.accumulate(np.where(anomalous, -1, positions))
+        streaks = np.where(
+            anomalous, positions - last_normal + (last_normal < 0) * len(anomalies), 0
+        )
+        resets = np.flatnonzero(streaks >= reset_after) if reset_after else []
+        if not len(resets):
+            moments = _merge_moments(*moments, points[~anomalous])
+            if len(points):
+                streak = points[last_normal[-1] + 1 :].tolist()
+                anomalies = anomalies + streak if last_normal[-1] < 0 else streak
+            break
+        # Level shift: restart from the streak of anomalies
+        reset = resets[0]
+        streak = points[last_normal[reset] + 1 : reset + 1].tolist()
+        if last_normal[reset] < 0:
+            streak = anomalies + streak
+        moments = _merge_moments(0, 0.0, 0.0, np.array(streak))
+        anomalies = []
+        start += reset + 1
+    return scores, moments, anomalies
+
+
+def _zscores(
+    values: np.ndarray, count: int, mean: float, m2: float, min_count: int
+) -> np.ndarray:
+    if count < max(2, min_count) or m2 <= 0:
+        return np.full(len(values), np.nan)
+    return (values - mean) / np.sqrt(m2 / (count - 1))
+
+
+def _merge_moments(
+    count: int, mean: float, m2: float, values: np.ndarray
+) -> tuple[int, float, float]:
+    """
+    Merge the moments of values into (count, mean, m2), see Chan et al.
+    """
+    if not len(values):
+        return count, mean, m2
+    values_mean = float(values.mean())
+    values_m2 = float(((values - values_mean) ** 2).sum())
+    total = count + len(values)
+    delta = values_mean - mean
+    return (
+        total,
+        mean + delta * len(values) / total,
+        m2 + values_m2 + delta * delta * count * len(values) / total,
+    )
@@ -0,0 +1,59 @@
+"""
+Rules that stream their data chunk by chunk.
+
+    @chunked_rule(ChunkedSource.csv("events.csv", usecols=["date"]))
+    def rule_fresh(self, chunk, state, max_days_stale=2):
+        oldest = pd.to_datetime(chunk["date"]).min()
+        state["oldest"] = min(state.get("oldest", oldest), oldest)
+
+    @rule_fresh.merge
+    def rule_fresh(self, state, max_days_stale=2):
+        assert_that(state["oldest"], greater_than(...))
+
+The decorated function is called once per chunk with a state dict shared across
+the chunks. The merge step, if any, is called once with the final state and gives
+the verdict of the rule. Both receive the params of the rule. Peak memory is
+bounded by the chunk size, as long as the state stays small.
+
+A source without any row fails the rule, unless allow_empty is set, in which case
+the merge step receives the empty state.
+"""
+import functools
+from typing import Callable
+from data_checks.sources.chunked_source import ChunkedSource
+
+
+def chunked_rule(
+    source: ChunkedSource | Callable[..., ChunkedSource], allow_empty: bool = False
+):
+    """
+    Declare a chunked rule. The source is either a ChunkedSource or a function
+    taking the check and returning one, for sources that depend on the check's
+    properties (`lambda self: ChunkedSource.csv(self.path)`).
+    """
+
+    def decorator(func):
+        steps = {"merge": None}
+
+        @functools.wraps(func)
+        def rule(self, *args, **kwargs):
+            chunks = source if isinstance(source, ChunkedSource) else source(self)
+            state: dict = {}
+            is_empty = True
+            for chunk in chunks:
+                is_empty = is_empty and len(chunk) == 0
+                func(self, chunk, state, *args, **kwargs)
+            if is_empty and not allow_empty:
+                raise AssertionError(f"No data in source {chunks.name}")
+            if steps["merge"] is None:
+                return state
+            return steps["merge"](self, state, *args, **kwargs)
+
+        def merge(merge_func):
+            steps["merge"] = merge_func
+            return rule
+
+        rule.merge = merge
+        return rule
+
+    return decorator
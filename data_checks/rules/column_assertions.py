@@ -0,0 +1,160 @@
+"""
+Vectorized assertions on columns. Each assertion evaluates a whole column at once
+and returns a ColumnAssertionResult with the mask of the failing rows and a sample
+of the failing values. assert_column raises if there is any failure, reporting the
+number of failures and the sample instead of stopping at the first bad row:
+
+    assert_column(matches(self.emails, EMAIL_PATTERN))
+"""
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Iterable, Optional
+import numpy as np
+import pandas as pd
+from data_checks.base.check_types import ColumnAssertionResult
+
+SAMPLE_SIZE = 10
+
+
+def not_null(values, sample_size: int = SAMPLE_SIZE) -> ColumnAssertionResult:
+    values = _as_series(values)
+    return _result("not_null", values, values.isna().to_numpy(), sample_size)
+
+
+def unique(values, sample_size: int = SAMPLE_SIZE) -> ColumnAssertionResult:
+    """
+    Non-null values appear once. Every occurrence of a duplicated value fails.
+    """
+    values = _as_series(values)
+    mask = values.duplicated(keep=False).to_numpy() & values.notna().to_numpy()
+    return _result("unique", values, mask, sample_size)
+
+
+def matches(
+    values, pattern: str, flags: int = 0, sample_size: int = SAMPLE_SIZE
+) -> ColumnAssertionResult:
+    """
+    Values fully match the regular expression. Null values fail.
+    """
+    values = _as_series(values)
+    matched = values.astype("string").str.fullmatch(_compile(pattern, flags))
+    mask = ~matched.fillna(False).to_numpy(dtype=bool)
+    return _result("matches", values, mask, sample_size)
+
+
+def in_set(
+    values, allowed: Iterable, sample_size: int = SAMPLE_SIZE
+) -> ColumnAssertionResult:
+    values = _as_series(values)
+    mask = ~values.isin(list(allowed)).to_numpy()
+    return _result("in_set", values, mask, sample_size)
+
+
+def not_in_set(
+    values, forbidden: Iterable, sample_size: int = SAMPLE_SIZE
+) -> ColumnAssertionResult:
+    values = _as_series(values)
+    mask = values.isin(list(forbidden)).to_numpy()
+    return _result("not_in_set", values, mask, sample_size)
+
+
+def in_range(
+    values,
+    min: Any = None,
+    max: Any = None,
+    inclusive: bool = True,
+    sample_size: int = SAMPLE_SIZE,
+) -> ColumnAssertionResult:
+    """
+    Non-null values are between min and max. Either bound can be omitted.
+    """
+    values = _as_series(values)
+    mask = np.zeros(len(values), dtype=bool)
+    if min is not None:
+        mask |= (values < min if inclusive else values <= min).to_numpy(dtype=bool)
+    if max is not None:
+        mask |= (values > max if inclusive else values >= max).to_numpy(dtype=bool)
+    return _result("in_range", values, mask, sample_size)
+
+
+def fresh(
+    values,
+    max_age: timedelta,
+    now: Optional[datetime] = None,
+    sample_size: int = SAMPLE_SIZE,
+) -> ColumnAssertionResult:
+    """
+    Datetimes are at most max_age old. Values that are not datetimes fail.
+    Datetimes are compared in UTC, naive ones (including now) being taken as UTC.
+    now defaults to the current time.
+    """
+    values = _as_series(values)
+    dates = pd.to_datetime(values, errors="coerce", utc=True)
+    now = pd.Timestamp.now(tz="UTC") if now is None else pd.Timestamp(now)
+    threshold = (
+        now.tz_localize("UTC") if now.tzinfo is None else now.tz_convert("UTC")
+    ) - max_age
+    mask = (dates.isna() | (dates < threshold)).to_numpy(dtype=bool)
+    return _result("fresh", values, mask, sample_size)
+
+
+def monotonic(
+    values,
+    increasing: bool = True,
+    strict: bool = False,
+    sample_size: int = SAMPLE_SIZE,
+) -> ColumnAssertionResult:
+    """
+    Values never decrease (or increase). The rows that break the order fail, as do
+    null values. Values are compared with the previous non-null value.
+    """
+    values = _as_series(values)
+    nulls = values.isna().to_numpy()
+    current = values[~nulls].to_numpy()
+    previous = np.roll(current, 1)
+    if increasing:
+        breaks = current <= previous if strict else current < previous
+    else:
+        breaks = current >= previous if strict else current > previous
+    breaks = np.asarray(breaks, dtype=bool)
+    if len(breaks):
+        breaks[0] = False
+    mask = nulls.copy()
+    mask[~nulls] = breaks
+    return _result("monotonic", values, mask, sample_size)
+
+
+def assert_column(result: ColumnAssertionResult, message: Optional[str] = None):
+    """
+    Raise an AssertionError describing the failures of an assertion, if any
+    """
+    if result["failures"]:
+        raise AssertionError(
+            f"{message or result['assertion']}: {result['failures']} of {result['total']} "
+            f"values failed. Sample (index, value): {result['sample']}"
+        )
+
+
+@lru_cache(maxsize=256)
+def _compile(pattern: str, flags: int = 0) -> re.Pattern:
+    return re.compile(pattern, flags)
+
+
+def _as_series(values) -> pd.Series:
+    return values if isinstance(values, pd.Series) else pd.Series(values)
+
+
+def _result(
+    assertion: str, values: pd.Series, mask: np.ndarray, sample_size: int
+) -> ColumnAssertionResult:
+    failing = np.flatnonzero(mask)[:sample_size]
+    return {
+        "assertion": assertion,
+        "mask": mask,
+        "failures": int(np.count_nonzero(mask)),
+        "total": len(values),
+        "sample": list(
+            zip(values.index[failing].tolist(), values.iloc[failing].tolist())
+        ),
+    }
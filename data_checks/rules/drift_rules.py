@@ -0,0 +1,206 @@
+"""
+Drift of a column's distribution against the previous runs of the rule.
+
+Each run stores a compact profile of the column (a KLL quantile sketch for numeric
+values, the counts of the most frequent categories for categorical values) in the
+rule's state. The profiles of the last `window` runs form the baseline that the
+current profile is compared to, so historical data is never reloaded:
+
+    def rule_amounts_stable(self):
+        assert_no_drift(self, self.orders["amount"], method="psi")
+
+Methods:
+    psi -- population stability index over the baseline deciles (numeric), fails above
+        threshold (0.2 by default, 0.1 to 0.2 is usually read as a moderate shift)
+    ks -- Kolmogorov-Smirnov distance between the sketched distributions (numeric),
+        fails above threshold (0.1 by default)
+    chi2 -- chi-square test of the category frequencies (categorical), fails when the
+        p-value is below threshold (0.001 by default)
+"""
+import math
+from statistics import NormalDist
+from typing import Optional
+import numpy as np
+import pandas as pd
+from data_checks.base.check_types import DriftResult
+from data_checks.base.rule_state import rule_states
+from data_checks.profiling.sketches import KLLSketch
+
+DEFAULT_THRESHOLDS = {"psi": 0.2, "ks": 0.1, "chi2": 0.001}
+OTHER_CATEGORY = "__other__"
+EPSILON = 1e-6
+
+
+def column_profile(values, method: str, max_categories: int = 100) -> dict:
+    """
+    Compact profile of a column for a drift method
+    """
+    values = pd.Series(values).dropna()
+    if method == "chi2":
+        counts = values.astype(str).value_counts()
+        top = counts.iloc[:max_categories].to_dict()
+        other = int(counts.iloc[max_categories:].sum())
+        if other:
+            top[OTHER_CATEGORY] = other
+        return {
+            "count": len(values),
+            "counts": {key: int(value) for key, value in top.items()},
+        }
+    return {"count": len(values), "kll": KLLSketch().update(values).to_dict()}
+
+
+def population_stability_index(
+    baseline: KLLSketch, current: KLLSketch, bins: int = 10
+) -> float:
+    """
+    PSI of the current distribution over the quantile bins of the baseline
+    """
+    edges = np.unique(
+        [
+            value
+            for value in baseline.quantiles(np.linspace(0, 1, bins + 1)[1:-1])
+            if value is not None
+        ]
+    )
+    baseline_fractions = _bin_fractions(baseline, edges)
+    current_fractions = _bin_fractions(current, edges)
+    return float(
+        np.sum(
+            (current_fractions - baseline_fractions)
+            * np.log(current_fractions / baseline_fractions)
+        )
+    )
+
+
+def ks_distance(baseline: KLLSketch, current: KLLSketch) -> tuple[float, float]:
+    """
+    Kolmogorov-Smirnov distance of two sketched distributions, with its asymptotic
+    p-value
+    """
+    points, _ = baseline._weighted_items()
+    current_points, _ = current._weighted_items()
+    points = np.unique(np.concatenate([points, current_points]))
+    distance = max(
+        (abs(baseline.rank(point) - current.rank(point)) for point in points),
+        default=0.0,
+    )
+    effective_size = (
+        baseline.count * current.count / max(1, baseline.count + current.count)
+    )
+    return distance, _kolmogorov_p_value(distance, effective_size)
+
+
+def chi_square(baseline_counts: dict, current_counts: dict) -> tuple[float, float]:
+    """
+    Chi-square statistic of the current counts against the baseline frequencies, with
+    its p-value (Wilson-Hilferty approximation)
+    """
+    categories = sorted(set(baseline_counts) | set(current_counts))
+    baseline = np.array(
+        [baseline_counts.get(key, 0) for key in categories], dtype=float
+    )
+    current = np.array([current_counts.get(key, 0) for key in categories], dtype=float)
+    expected = (baseline + EPSILON) / (baseline + EPSILON).sum() * current.sum()
+    statistic = float(np.sum((current - expected) ** 2 / expected))
+    degrees = max(1, len(categories) - 1)
+    z = ((statistic / degrees) ** (1 / 3) - (1 - 2 / (9 * degrees))) / math.sqrt(
+        2 / (9 * degrees)
+    )
+    return statistic, 1 - NormalDist().cdf(z)
+
+
+def compare(
+    method: str, baseline_profiles: list[dict], profile: dict
+) -> tuple[float, Optional[float]]:
+    """
+    Statistic (and p-value if any) of the current profile against the merged baseline
+    profiles
+    """
+    if method == "chi2":
+        baseline_counts: dict[str, int] = {}
+        for baseline_profile in baseline_profiles:
+            for key, count in baseline_profile["counts"].items():
+                baseline_counts[key] = baseline_counts.get(key, 0) + count
+        return chi_square(baseline_counts, profile["counts"])
+
+    baseline = KLLSketch.from_dict(baseline_profiles[0]["kll"])
+    for baseline_profile in baseline_profiles[1:]:
+        baseline.merge(KLLSketch.from_dict(baseline_profile["kll"]))
+    current = KLLSketch.from_dict(profile["kll"])
+    if method == "psi":
+        return population_stability_index(baseline, current), None
+    return ks_distance(baseline, current)
+
+
+def assert_no_drift(
+    check,
+    values,
+    method: str = "psi",
+    threshold: Optional[float] = None,
+    name: Optional[str] = None,
+    window: int = 7,
+) -> DriftResult:
+    """
+    Compare a column with the profiles of the last `window` runs of the rule being
+    executed, then add its profile to them. name identifies the column within the
+    rule and defaults to the name of the series.
+    """
+    if method not in DEFAULT_THRESHOLDS:
+        raise ValueError(
+            f"Invalid drift method {method}. Options: {list(DEFAULT_THRESHOLDS)}"
+        )
+    threshold = DEFAULT_THRESHOLDS[method] if threshold is None else threshold
+    name = str(name if name is not None else getattr(values, "name", None) or "values")
+    rule_hash = check.current_rule_hash()
+    kind = f"drift:{method}:{name}"
+    baseline_profiles: list[dict] = rule_states.get(rule_hash, kind, [])
+    profile = column_profile(values, method)
+
+    result: DriftResult = {
+        "name": name,
+        "method": method,
+        "statistic": None,
+        "p_value": None,
+        "threshold": threshold,
+        "baseline_runs": len(baseline_profiles),
+    }
+    if baseline_profiles and profile["count"]:
+        result["statistic"], result["p_value"] = compare(
+            method, baseline_profiles, profile
+        )
+    rule_states.set(rule_hash, kind, (baseline_profiles + [profile])[-window:])
+
+    if result["statistic"] is not None:
+        drifted = (
+            result["p_value"] < threshold
+            if method == "chi2"
+            else result["statistic"] > threshold
+        )
+        assert not drifted, (
+            f"{name} drifted from the last {len(baseline_profiles)} runs: {method} "
+            f"statistic {result['statistic']:.4f}"
+            + (
+                f", p-value {result['p_value']:.4g}"
+                if result["p_value"] is not None
+                else ""
+            )
+            + f" (threshold {threshold})"
+        )
+    return result
+
+
+def _bin_fractions(sketch: KLLSketch, edges: np.ndarray) -> np.ndarray:
+    cumulative = np.array([0.0] + [sketch.rank(edge) for edge in edges] + [1.0])
+    return np.maximum(np.diff(cumulative), EPSILON)
+
+
+def _kolmogorov_p_value(distance: float, effective_size: float) -> float:
+    if distance <= 0 or effective_size <= 0:
+        return 1.0
+    root = math.sqrt(effective_size)
+    statistic = (root + 0.12 + 0.11 / root) * distance
+    p_value = 2 * sum(
+        (-1) ** (k - 1) * math.exp(-2 * k * k * statistic * statistic)
+        for k in range(1, 101)
+    )
+    return float(min(1.0, max(0.0, p_value)))
@@ -0,0 +1,181 @@
+"""
+Vectorized outlier detection on a series or an array. Every method takes an optional
+`by` key (an array or series of the same length) to evaluate each group separately,
+so that thousands of series stored in one long dataframe are checked in one call:
+
+    def rule_no_price_outliers(self):
+        prices = self.prices_df
+        assert_no_outliers(mad(prices["price"], by=prices["product_id"]))
+
+Each method returns the index labels of the outliers with their scores (the
+positions for arrays). Missing values and the values of constant groups are never
+outliers.
+"""
+from typing import Any, Optional
+import numpy as np
+import pandas as pd
+from data_checks.base.check_types import OutlierResult
+
+SAMPLE_SIZE = 10
+# Scale of the median absolute deviation to the standard deviation of a normal law
+MAD_SCALE = 0.6745
+# Scale of the mean absolute deviation to the standard deviation of a normal law
+MEAN_AD_SCALE = 1.253314
+# Interquartile range of a normal law in standard deviations
+NORMAL_IQR = 1.349
+
+
+def zscore(values, threshold: float = 3.0, by: Any = None) -> OutlierResult:
+    """
+    Values more than threshold standard deviations away from the mean
+    """
+    values = _as_series(values)
+    grouped = _grouped(values, by)
+    scores = (values - grouped.transform("mean")) / grouped.transform("std")
+    return _result("zscore", values, scores, threshold)
+
+
+def mad(values, threshold: float = 3.5, by: Any = None) -> OutlierResult:
+    """
+    Values whose modified z-score (from the median and the median absolute deviation)
+    exceeds threshold. Robust to the outliers themselves. Groups whose median absolute
+    deviation is 0 (more than half of the values are equal) use the mean absolute
+    deviation instead.
+    """
+    values = _as_series(values)
+    deviations = values - _grouped(values, by).transform("median")
+    grouped_deviations = _grouped(deviations.abs(), by)
+    median_deviations = grouped_deviations.transform("median")
+    spreads = (median_deviations / MAD_SCALE).where(
+        median_deviations > 0,
+        MEAN_AD_SCALE * grouped_deviations.transform("mean"),
+    )
+    scores = deviations / spreads
+    return _result("mad", values, scores, threshold)
+
+
+def iqr(values, k: float = 1.5, by: Any = None) -> OutlierResult:
+    """
+    Values outside of [Q1 - k * IQR, Q3 + k * IQR]. The score is the distance to the
+    quartiles in interquartile ranges. Groups whose interquartile range is 0 use the
+    range expected from their standard deviation instead.
+    """
+    values = _as_series(values)
+    grouped = _grouped(values, by)
+    first_quartile = grouped.transform("quantile", 0.25)
+    third_quartile = grouped.transform("quantile", 0.75)
+    ranges = third_quartile - first_quartile
+    ranges = ranges.where(ranges > 0, NORMAL_IQR * grouped.transform("std"))
+    scores = (
+        np.maximum(values - third_quartile, 0) - np.maximum(first_quartile - values, 0)
+    ) / ranges
+    return _result("iqr", values, scores, k)
+
+
+def rolling_zscore(
+    values,
+    window: int,
+    threshold: float = 3.0,
+    by: Any = None,
+    min_periods: Optional[int] = None,
+) -> OutlierResult:
+    """
+    Values more than threshold standard deviations away from the mean of the window
+    values preceding them. Values are expected in order within each group.
+    """
+    values = _as_series(values)
+    mean, std = _trailing(values, by, window, min_periods, ("mean", "std"))
+    scores = (values - mean) / std
+    return _result("rolling_zscore", values, scores, threshold)
+
+
+def pct_change(
+    values,
+    window: int,
+    max_change: float = 0.5,
+    by: Any = None,
+    min_periods: Optional[int] = None,
+) -> OutlierResult:
+    """
+    Values changing by more than max_change (0.5 for 50%) relative to the mean of the
+    window values preceding them. Values are expected in order within each group.
+    """
+    values = _as_series(values)
+    (mean,) = _trailing(values, by, window, min_periods, ("mean",))
+    scores = (values - mean) / mean.abs()
+    return _result("pct_change", values, scores, max_change)
+
+
+def assert_no_outliers(
+    result: OutlierResult, message: Optional[str] = None, sample_size: int = SAMPLE_SIZE
+):
+    """
+    Raise an AssertionError listing the first outliers, if any
+    """
+    if result["failures"]:
+        sample = ", ".join(
+            f"{index!r} ({score:.2f})"
+            for index, score in zip(
+                result["indices"][:sample_size], result["scores"][:sample_size]
+            )
+        )
+        raise AssertionError(
+            f"{message or result['method']}: {result['failures']} outliers out of "
+            f"{result['total']} values. First outliers (score): {sample}"
+        )
+
+
+def _as_series(values) -> pd.Series:
+    return (values if isinstance(values, pd.Series) else pd.Series(values)).astype(float)
+
+
+def _grouped(values: pd.Series, by: Any):
+    if by is None:
+        # A single group
+        return values.groupby(np.zeros(len(values), dtype=np.int8))
+    return values.groupby(np.asarray(by), sort=False)
+
+
+def _trailing(
+    values: pd.Series,
+    by: Any,
+    window: int,
+    min_periods: Optional[int],
+    aggregations: tuple[str, ...],
+) -> list[pd.Series]:
+    """
+    Rolling aggregations of the window values preceding each value, within its group
+    """
+    keys = np.zeros(len(values), dtype=np.int8) if by is None else np.asarray(by)
+    positions = pd.Series(values.to_numpy(), index=pd.RangeIndex(len(values)))
+    previous = positions.groupby(keys, sort=False).shift(1)
+    rolling = previous.groupby(keys, sort=False).rolling(
+        window, min_periods=window if min_periods is None else min_periods
+    )
+    return [
+        pd.Series(
+            getattr(rolling, aggregation)()
+            .reset_index(level=0, drop=True)
+            .sort_index()
+            .to_numpy(),
+            index=values.index,
+        )
+        for aggregation in aggregations
+    ]
+
+
+def _result(
+    method: str, values: pd.Series, scores: pd.Series, threshold: float
+) -> OutlierResult:
+    scores = scores.to_numpy(dtype=float)
+    with np.errstate(invalid="ignore"):
+        mask = np.nan_to_num(np.abs(scores), nan=0.0, posinf=np.inf) > threshold
+    failing = np.flatnonzero(mask)
+    return {
+        "method": method,
+        "mask": mask,
+        "indices": values.index[failing].tolist(),
+        "scores": scores[failing],
+        "failures": len(failing),
+        "total": len(values),
+    }
@@ -0,0 +1,141 @@
+"""
+Evaluate a heavy rule over partitions of a dataframe in parallel.
+
+    def rule_valid_emails(self):
+        invalid = partition_apply(
+            self.users,
+            lambda users: users[~users["email"].str.match(EMAIL_PATTERN)],
+        )
+        assert invalid.empty, f"{len(invalid)} invalid emails"
+
+The partitions are evaluated by a pool of MAX_WORKERS forked processes. The data
+and the function are shared with the workers through fork's copy-on-write memory,
+so neither is pickled. Only the partial results are sent back, so they should be
+small (counts, masks, failing rows...). Partial results are merged by the merge
+function, which defaults to concatenating dataframes, series and arrays. Where
+fork is not available, the partitions are evaluated one after the other in the
+calling process.
+"""
+import os
+from multiprocessing import current_process, get_context
+from multiprocessing.context import BaseContext
+from typing import Any, Callable, Optional
+import numpy as np
+import pandas as pd
+from data_checks.conf.settings import settings
+
+# Data and function of the running partition_apply, inherited by the forked workers
+_partitioned: Optional[tuple[pd.DataFrame | pd.Series, Callable[..., Any]]] = None
+
+
+def partition_apply(
+    data: pd.DataFrame | pd.Series,
+    func: Callable[[pd.DataFrame | pd.Series], Any],
+    merge: Optional[Callable[[list], Any]] = None,
+    by: Optional[str | list[str]] = None,
+    partitions: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    min_partition_size: int = 10_000,
+) -> Any:
+    """
+    Apply func to partitions of data in parallel and merge the partial results
+
+    data -- dataframe or series to partition
+    func -- function evaluated on each partition
+    merge -- function merging the list of partial results, see merge_results by default
+    by -- column(s) to partition on, so that all the rows with the same key are in
+        the same partition. Rows are split in contiguous ranges by default.
+    partitions -- number of partitions, defaults to the number of workers
+    max_workers -- size of the pool, defaults to MAX_WORKERS (the number of CPUs)
+    min_partition_size -- smaller data is not worth parallelizing
+    """
+    global _partitioned
+    merge = merge_results if merge is None else merge
+    max_workers = max_workers or settings["MAX_WORKERS"] or os.cpu_count() or 1
+    partition_positions = _get_partitions(
+        data, by, partitions or max_workers, min_partition_size
+    )
+    fork_context = _get_fork_context()
+    # Daemonic workers (e.g. of group suites) cannot start their own pool
+    if (
+        len(partition_positions) <= 1
+        or current_process().daemon
+        or fork_context is None
+    ):
+        return merge([func(data.iloc[positions]) for positions in partition_positions])
+
+    # Set before forking the workers so that they inherit it, whatever the default
+    # start method of the platform
+    _partitioned = (data, func)
+    try:
+        with fork_context.Pool(
+            processes=min(max_workers, len(partition_positions))
+        ) as pool:
+            return merge(pool.map(_apply_partition, partition_positions))
+    finally:
+        _partitioned = None
+
+
+def merge_results(results: list) -> Any:
+    """
+    Concatenate partial dataframes, series or arrays. Other results are returned as a list.
+    """
+    if results and all(
+        isinstance(result, (pd.DataFrame, pd.Series)) for result in results
+    ):
+        return pd.concat(results)
+    if results and all(isinstance(result, np.ndarray) for result in results):
+        return np.concatenate(results)
+    return results
+
+
+def _get_fork_context() -> Optional[BaseContext]:
+    """
+    Internal: Multiprocessing context forking the workers, None if fork is not
+    available on the platform
+    """
+    try:
+        return get_context("fork")
+    except ValueError:
+        return None
+
+
+def _apply_partition(positions: slice | np.ndarray) -> Any:
+    if _partitioned is None:
+        raise RuntimeError("No partitioned data in the worker")
+    data, func = _partitioned
+    return func(data.iloc[positions])
+
+
+def _get_partitions(
+    data: pd.DataFrame | pd.Series,
+    by: Optional[str | list[str]],
+    partitions: int,
+    min_partition_size: int,
+) -> list[slice | np.ndarray]:
+    """
+    Internal: Row positions of each partition, as ranges or, when partitioning by
+    key, as arrays of positions of groups balanced by size
+    """
+    partitions = max(1, min(partitions, len(data) // max(1, min_partition_size)))
+    if by is None:
+        bounds = np.linspace(0, len(data), partitions + 1, dtype=int)
+        return [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+    groups = sorted(
+        data.groupby(by, sort=False, dropna=False).indices.values(),
+        key=len,
+        reverse=True,
+    )
+    # Greedily assign the largest groups to the smallest partitions
+    partition_groups: list[list[np.ndarray]] = [[] for _ in range(partitions)]
+    partition_sizes = np.zeros(partitions, dtype=np.int64)
+    for positions in groups:
+        smallest = int(np.argmin(partition_sizes))
+        partition_groups[smallest].append(positions)
+        partition_sizes[smallest] += len(positions)
+    return [
+        np.sort(np.concatenate(group_positions))
+        for group_positions in partition_groups
+        if group_positions
+    ]
@@ -0,0 +1,117 @@
+"""
+Rules evaluated record by record, fused into a single pass over their data.
+
+    @record_rule("content", message="Message: `{}` may contain spam")
+    def rule_no_spam(self, message):
+        return not is_spam(message)
+
+    @record_rule("content", message="Message: `{}` may contain hate speech")
+    def rule_no_hate_speech(self, message):
+        return not is_hate_speech(message)
+
+The decorated function checks one record and returns whether it passes. The source is
+the name of an attribute of the check (an iterable, e.g. a series) or a function taking
+the check and returning the iterable. The first record rule to run iterates over the
+source once and evaluates all the record rules of the check on the same source for each
+record. Sources are compared by equality: rules share a pass when they name the same
+attribute or are given the same function (not two identical lambdas). The outcomes are cached for the rest of the check's run, so the other rules
+only report them. Rules with params and rules that the actions of the check would skip
+(see CheckAction.skips) are left out of the pass, a record rule run with params is
+evaluated on its own. When the rules run asynchronously, the pass is done once before
+the rule processes start (see Check.prepare_async) and a rule missing from it is
+evaluated on its own in its process.
+"""
+import functools
+from typing import Any, Callable, Iterable
+from data_checks.base.check_types import RecordRuleOutcome
+from data_checks.rules.column_assertions import SAMPLE_SIZE
+
+
+def record_rule(
+    source: str | Callable[[Any], Iterable], message: str = "Record {} failed"
+):
+    """
+    Declare a record rule. message is formatted with the failing record.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def rule(self, *args, **kwargs):
+            rule_name = self._internal["current_rule"][0]
+            outcomes = (
+                {} if args or kwargs else _get_fused_outcomes(self, rule.record_source)
+            )
+            if rule_name not in outcomes:
+                outcomes = _evaluate(self, {rule_name: rule}, args, kwargs)
+            outcome = outcomes[rule_name]
+            if outcome["error"] is not None:
+                raise outcome["error"]
+            if outcome["failures"]:
+                raise AssertionError(
+                    f"{outcome['failures']} of {outcome['total']} records failed:\n"
+                    + "\n".join(message.format(record) for record in outcome["sample"])
+                )
+
+        def prepare(self):
+            try:
+                _get_fused_outcomes(self, source)
+            finally:
+                self._internal["rule_cache"]["record_rules_prepared"] = True
+
+        rule.record_func = func
+        rule.record_source = source
+        rule.prepare = prepare
+        return rule
+
+    return decorator
+
+
+def _get_fused_outcomes(check, source) -> dict[str, RecordRuleOutcome]:
+    """
+    Internal: Outcomes of the record rules of the check on the source, computed in
+    one pass the first time one of them runs. Empty in the rule processes of an
+    asynchronous run if the pass was not done beforehand, so that every process only
+    evaluates its own rule.
+    """
+    cache: dict = check._internal["rule_cache"].setdefault("record_rules", {})
+    if source not in cache:
+        if check._internal["rule_cache"].get("record_rules_prepared", False):
+            return {}
+        rules = {
+            name: getattr(type(check), name)
+            for name in check.get_rules_to_run()
+            if getattr(getattr(type(check), name), "record_source", None) == source
+            and name not in check.rules_params
+            and not check.will_skip(name)
+        }
+        cache[source] = _evaluate(check, rules) if rules else {}
+    return cache[source]
+
+
+def _evaluate(
+    check, rules: dict[str, Callable], args: tuple = (), kwargs: dict = {}
+) -> dict[str, RecordRuleOutcome]:
+    """
+    Internal: Evaluate record rules in a single pass over their source
+    """
+    outcomes: dict[str, RecordRuleOutcome] = {
+        name: {"failures": 0, "total": 0, "sample": [], "error": None} for name in rules
+    }
+    source = next(iter(rules.values())).record_source
+    records = getattr(check, source) if isinstance(source, str) else source(check)
+    for record in records:
+        for name, rule in rules.items():
+            outcome = outcomes[name]
+            if outcome["error"] is not None:
+                continue
+            outcome["total"] += 1
+            try:
+                passed = rule.record_func(check, record, *args, **kwargs)
+            except Exception as e:
+                outcome["error"] = e
+                continue
+            if not passed:
+                outcome["failures"] += 1
+                if len(outcome["sample"]) < SAMPLE_SIZE:
+                    outcome["sample"].append(record)
+    return outcomes
@@ -0,0 +1,115 @@
+"""
+Referential integrity ("every order's user_id exists in users") without merges.
+
+The parent keys are indexed once per run, as a fixture:
+
+    users_index = key_index(lambda: users()["id"])
+
+    class OrdersCheck(DataCheck):
+        def rule_known_users(self):
+            assert_column(references(self.orders["user_id"], users_index()), "Unknown users")
+
+and the child keys are probed against the index in a vectorized way. A HashIndex keeps
+the sorted 64-bit hashes of the parent keys (8 bytes per key). A BloomFilter is smaller
+(about 10 bits per key at a 1% error rate) but lets some orphans through. Neither
+misses a key that exists as long as both sides have the same type (1 and 1.0 hash the
+same, "1" and 1 do not), so the orphans found can be verified exactly, for example
+with a query on the parent table.
+"""
+from typing import Callable, Iterable, Optional
+import numpy as np
+import pandas as pd
+from data_checks.base.check_types import ColumnAssertionResult
+from data_checks.base.fixture import Fixture, fixture
+from data_checks.profiling.sketches import BloomFilter, hash_values
+from data_checks.rules.column_assertions import SAMPLE_SIZE, _result
+
+
+class HashIndex:
+    """
+    Sorted unique hashes of a set of keys
+    """
+
+    def __init__(self, hashes: np.ndarray):
+        self.hashes = hashes
+
+    @classmethod
+    def build(cls, keys) -> "HashIndex":
+        return cls(np.unique(hash_values(keys)))
+
+    def might_contain(self, values) -> np.ndarray:
+        """
+        Boolean mask, False for the values that are certainly not in the index.
+        Null values are never in the index.
+        """
+        values = pd.Series(values)
+        not_null = values.notna().to_numpy()
+        hashes = hash_values(values)
+        positions = np.minimum(
+            np.searchsorted(self.hashes, hashes), max(0, len(self.hashes) - 1)
+        )
+        mask = np.zeros(len(values), dtype=bool)
+        if len(self.hashes):
+            mask[not_null] = self.hashes[positions] == hashes
+        return mask
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def __repr__(self) -> str:
+        return f"HashIndex(keys={len(self.hashes)})"
+
+
+def build_key_index(
+    keys, kind: str = "hash", error_rate: float = 0.01
+) -> HashIndex | BloomFilter:
+    """
+    Index a set of parent keys. kind is "hash" or "bloom".
+    """
+    if kind == "hash":
+        return HashIndex.build(keys)
+    if kind == "bloom":
+        keys = pd.Series(keys)
+        return BloomFilter(max(1, len(keys)), error_rate).update(keys)
+    raise ValueError(f"Invalid key index kind {kind}. Options: ['hash', 'bloom']")
+
+
+def key_index(
+    keys: Callable[[], Iterable],
+    kind: str = "hash",
+    error_rate: float = 0.01,
+    scope: str = "run",
+) -> Fixture:
+    """
+    Fixture of the index of the parent keys returned by the keys function, built once
+    per scope (the run by default)
+    """
+    return fixture(
+        lambda: build_key_index(keys(), kind=kind, error_rate=error_rate), scope=scope
+    )
+
+
+def references(
+    values,
+    index: HashIndex | BloomFilter,
+    verify: Optional[Callable[[np.ndarray], np.ndarray] | Iterable] = None,
+    sample_size: int = SAMPLE_SIZE,
+) -> ColumnAssertionResult:
+    """
+    Non-null values exist in the index of the parent keys. The values that are not
+    found can be verified exactly with verify, either the parent keys themselves or
+    a function taking the distinct values not found and returning a boolean mask of
+    the ones that exist.
+    """
+    values = values if isinstance(values, pd.Series) else pd.Series(values)
+    not_null = values.notna().to_numpy()
+    mask = not_null & ~index.might_contain(values)
+    if verify is not None and mask.any():
+        candidates = pd.unique(values[mask])
+        exists = (
+            verify(candidates)
+            if callable(verify)
+            else pd.Series(candidates).isin(pd.Series(verify)).to_numpy()
+        )
+        mask &= ~values.isin(candidates[np.asarray(exists, dtype=bool)]).to_numpy()
+    return _result("references", values, mask, sample_size)
@@ -0,0 +1,208 @@
+"""
+Rules validated on a random sample of their data.
+
+    @sampled_rule(lambda self: self.events, sample_size=10_000, max_failure_rate=0.01)
+    def rule_valid_amounts(self, sample):
+        return sample["amount"] <= 0
+
+The rule receives a sample of the data and returns a boolean mask of the failing
+rows. The failure rate of the whole dataset is estimated with a Wilson confidence
+interval and the rule fails when the upper bound exceeds max_failure_rate, even if
+the sample has no failure. Without failures the upper bound is about 3.84 / sample_size
+at 95% confidence, so the sample must be large enough for max_failure_rate (at least
+3,840 rows for the default 0.001). When all the data is validated, the failure rate
+is exact. The data can be a dataframe or a ChunkedSource, in which case the sample
+is drawn in a single streaming pass.
+
+Sampling options can be overridden in the suite_config of the suite ({"sampling": {...}})
+and, with precedence, in the rules_config of the check ({"rule_name": {"sampling": {...}}}):
+    enabled -- sample the data (True) or validate all of it (False)
+    sample_size -- number of rows sampled
+    strata -- column(s) to stratify the sample on, proportionally to the size of each stratum
+    max_failure_rate -- maximum acceptable failure rate
+    confidence -- confidence level of the interval
+    seed -- seed of the random sampling
+"""
+import functools
+import math
+from statistics import NormalDist
+from typing import Any, Callable, Optional
+import numpy as np
+import pandas as pd
+from data_checks.base.check_types import SampleResult
+from data_checks.sources.chunked_source import ChunkedSource
+
+DEFAULT_SAMPLING = {
+    "enabled": True,
+    "sample_size": 10_000,
+    "strata": None,
+    "max_failure_rate": 0.001,
+    "confidence": 0.95,
+    "seed": None,
+}
+
+
+def wilson_interval(
+    failures: int, sample_size: int, confidence: float
+) -> tuple[float, float]:
+    """
+    Wilson score interval of a proportion
+    """
+    if sample_size == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    rate = failures / sample_size
+    denominator = 1 + z**2 / sample_size
+    center = (rate + z**2 / (2 * sample_size)) / denominator
+    margin = (
+        z
+        * math.sqrt(rate * (1 - rate) / sample_size + z**2 / (4 * sample_size**2))
+        / denominator
+    )
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def sample_frame(
+    df: pd.DataFrame, sample_size: int, strata=None, seed: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Uniform or stratified (proportional allocation) sample of a dataframe
+    """
+    if len(df) <= sample_size:
+        return df
+    if strata is None:
+        return df.sample(n=sample_size, random_state=seed)
+    fraction = sample_size / len(df)
+    return df.groupby(strata, group_keys=False, dropna=False).apply(
+        lambda stratum: stratum.sample(
+            n=max(1, round(len(stratum) * fraction)), random_state=seed
+        )
+    )
+
+
+def sample_chunks(
+    source: ChunkedSource, sample_size: int, strata=None, seed: Optional[int] = None
+) -> tuple[pd.DataFrame, int]:
+    """
+    Sample a chunked source in one pass. Every row gets a random priority and the rows
+    with the lowest priorities are kept, so memory is bounded by the sample size. When
+    stratified, the final size of each stratum is only known at the end, so up to
+    sample_size rows are kept per stratum: memory is bounded by the sample size times
+    the number of strata. Returns the sample and the number of rows in the source.
+    """
+    random = np.random.default_rng(seed)
+    reservoir: Optional[pd.DataFrame] = None
+    stratum_sizes: Optional[pd.Series] = None
+    population_size = 0
+    for chunk in source:
+        population_size += len(chunk)
+        chunk = chunk.assign(_priority=random.random(len(chunk)))
+        reservoir = chunk if reservoir is None else pd.concat([reservoir, chunk])
+        if strata is None:
+            reservoir = reservoir.nsmallest(sample_size, "_priority")
+        else:
+            sizes = chunk.groupby(strata, dropna=False).size()
+            stratum_sizes = (
+                sizes if stratum_sizes is None else stratum_sizes.add(sizes, fill_value=0)
+            )
+            reservoir = reservoir.groupby(strata, group_keys=False, dropna=False).apply(
+                lambda stratum: stratum.nsmallest(sample_size, "_priority")
+            )
+
+    if reservoir is None:
+        return pd.DataFrame(), 0
+    if strata is not None and population_size > sample_size:
+        # Keep a number of rows proportional to the size of each stratum
+        fraction = sample_size / population_size
+        allocation = (stratum_sizes * fraction).round().clip(lower=1).astype(int)
+        reservoir = reservoir.groupby(strata, group_keys=False, dropna=False).apply(
+            lambda stratum: stratum.nsmallest(
+                int(allocation.loc[stratum.name]), "_priority"
+            )
+        )
+    return reservoir.drop(columns="_priority"), population_size
+
+
+def sampled_rule(
+    source: pd.DataFrame | ChunkedSource | Callable[..., Any], **sampling
+):
+    """
+    Declare a sampled rule. The source is a dataframe, a ChunkedSource or a function
+    taking the check and returning one. The keyword arguments override DEFAULT_SAMPLING.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def rule(self, *args, **kwargs) -> SampleResult:
+            config = _get_sampling_config(self, sampling)
+            data = (
+                source
+                if isinstance(source, (pd.DataFrame, ChunkedSource))
+                else source(self)
+            )
+            if isinstance(data, ChunkedSource):
+                if config["enabled"]:
+                    sample, population_size = sample_chunks(
+                        data, config["sample_size"], config["strata"], config["seed"]
+                    )
+                else:
+                    sample = pd.concat(list(data))
+                    population_size = len(sample)
+            else:
+                population_size = len(data)
+                sample = (
+                    sample_frame(
+                        data, config["sample_size"], config["strata"], config["seed"]
+                    )
+                    if config["enabled"]
+                    else data
+                )
+
+            failures = int(np.count_nonzero(func(self, sample, *args, **kwargs)))
+            if len(sample) == population_size:
+                # All the data was validated, the failure rate is exact
+                lower_bound = upper_bound = (
+                    failures / population_size if population_size else 0.0
+                )
+            else:
+                lower_bound, upper_bound = wilson_interval(
+                    failures, len(sample), config["confidence"]
+                )
+            result: SampleResult = {
+                "sample_size": len(sample),
+                "population_size": population_size,
+                "failures": failures,
+                "failure_rate": failures / len(sample) if len(sample) else 0.0,
+                "lower_bound": lower_bound,
+                "upper_bound": upper_bound,
+                "confidence": config["confidence"],
+            }
+            print(
+                f"\t\t{failures}/{len(sample)} sampled rows failed, failure rate in "
+                f"[{lower_bound:.4f}, {upper_bound:.4f}] at {config['confidence']:.0%} confidence"
+            )
+            if upper_bound > config["max_failure_rate"]:
+                raise AssertionError(
+                    f"Failure rate of up to {upper_bound:.4f} exceeds {config['max_failure_rate']} "
+                    f"({failures} failures in a sample of {len(sample)} rows out of {population_size})"
+                )
+            return result
+
+        return rule
+
+    return decorator
+
+
+def _get_sampling_config(check, sampling: dict) -> dict:
+    """
+    Internal: Sampling options of the rule being executed. rules_config takes
+    precedence over suite_config, which takes precedence over the decorator.
+    """
+    rule, _ = check._internal["current_rule"]
+    rule_config = check.check_config().get("rules_config", {}).get(rule, {})
+    return {
+        **DEFAULT_SAMPLING,
+        **sampling,
+        **check._internal["suite_config"].get("sampling", {}),
+        **rule_config.get("sampling", {}),
+    }
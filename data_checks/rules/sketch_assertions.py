@@ -0,0 +1,104 @@
+"""
+Assertions on sketches (see data_checks.profiling.sketches), for columns too large
+to check exactly. Build the sketch over all the chunks or partitions of the data,
+merging the partial sketches, then assert on it:
+
+    @chunked_rule(ChunkedSource.csv("orders.csv", usecols=["order_id"]))
+    def rule_unique_orders(self, chunk, state):
+        state.setdefault("ids", HyperLogLog()).update(chunk["order_id"])
+
+    @rule_unique_orders.merge
+    def rule_unique_orders(self, state):
+        assert_uniqueness_ratio(state["ids"], min_ratio=0.99)
+        assert_stable(self, state["ids"], lambda ids: ids.estimate(), max_change=0.1)
+"""
+from typing import Any, Callable, Optional
+from data_checks.base.rule_state import rule_states
+from data_checks.profiling.sketches import (
+    HyperLogLog,
+    KLLSketch,
+    TopK,
+    sketch_from_dict,
+)
+
+
+def assert_uniqueness_ratio(sketch: HyperLogLog, min_ratio: float = 1.0):
+    """
+    Estimated distinct values over values is at least min_ratio. Keep some margin
+    below 1.0 for the error of the estimate.
+    """
+    ratio = sketch.uniqueness_ratio()
+    assert ratio >= min_ratio, (
+        f"About {sketch.estimate():.0f} distinct values out of {sketch.count}, "
+        f"uniqueness ratio {ratio:.4f} is below {min_ratio}"
+    )
+
+
+def assert_distinct_between(
+    sketch: HyperLogLog, min: Optional[float] = None, max: Optional[float] = None
+):
+    estimate = sketch.estimate()
+    assert (min is None or estimate >= min) and (max is None or estimate <= max), (
+        f"About {estimate:.0f} distinct values, expected between {min} and {max}"
+    )
+
+
+def assert_quantile_between(
+    sketch: KLLSketch, q: float, min: Optional[float] = None, max: Optional[float] = None
+):
+    value = sketch.quantile(q)
+    assert value is not None, "No values to compute quantiles from"
+    assert (min is None or value >= min) and (max is None or value <= max), (
+        f"Quantile {q} is about {value}, expected between {min} and {max}"
+    )
+
+
+def assert_no_heavy_hitters(sketch: TopK, max_share: float):
+    """
+    No value makes up more than max_share of the values
+    """
+    total = sketch.counts.count
+    heavy_hitters = [
+        (value, count) for value, count in sketch.top() if total and count / total > max_share
+    ]
+    assert not heavy_hitters, (
+        f"Values over {max_share:.2%} of the {total} values (value, estimated count): {heavy_hitters}"
+    )
+
+
+def previous_sketch(check, name: str = "sketch") -> Optional[Any]:
+    """
+    Sketch stored by the rule being executed in its last run, see save_sketch
+    """
+    data = rule_states.get(check.current_rule_hash(), f"sketch:{name}")
+    return None if data is None else sketch_from_dict(data)
+
+
+def save_sketch(check, sketch, name: str = "sketch"):
+    """
+    Store a sketch for the next runs of the rule being executed
+    """
+    rule_states.set(check.current_rule_hash(), f"sketch:{name}", sketch.to_dict())
+
+
+def assert_stable(
+    check,
+    sketch,
+    metric: Callable[[Any], float],
+    max_change: float,
+    name: str = "sketch",
+):
+    """
+    A metric of the sketch changed by at most max_change (relative) since the last
+    run of the rule. The sketch is then stored for the next run.
+    """
+    previous = previous_sketch(check, name)
+    save_sketch(check, sketch, name)
+    if previous is None:
+        return
+    previous_value, value = metric(previous), metric(sketch)
+    change = abs(value - previous_value) / abs(previous_value) if previous_value else 0.0
+    assert change <= max_change, (
+        f"Changed by {change:.2%} since the last run ({previous_value} to {value}), "
+        f"more than {max_change:.2%}"
+    )
@@ -0,0 +1,233 @@
+"""
+Declarative rules compiled to SQL aggregates and executed in the source database.
+Only the aggregates, and a few failing rows when a rule fails, leave the database.
+
+All the rules on the same table are fused into a single query, so the table is
+scanned once. See data_checks.classes.sql_data_check.SqlDataCheck.
+"""
+from datetime import datetime, timedelta
+from typing import Any, Optional
+import pandas as pd
+from sqlalchemy import (
+    Connection,
+    TableClause,
+    and_,
+    case,
+    column,
+    false,
+    func,
+    literal_column,
+    or_,
+    select,
+    table,
+)
+
+
+class SqlRule:
+    """
+    Rule on a column of a table, computed from one or more SQL aggregates.
+
+    Attributes:
+        column -- name of the checked column
+        name -- name of the rule, which must be unique among the rules of a table.
+            Defaults to "{type}_{column}", e.g. "notnull_email". Set it to have
+            multiple rules of the same type on a column.
+    """
+
+    def __init__(self, column: str, name: Optional[str] = None):
+        self.column = column
+        self.name = name or f"{type(self).__name__.lower()}_{column}"
+
+    def aggregates(self, source: TableClause) -> dict[str, Any]:
+        """
+        Aggregate expressions needed by the rule, keyed by name
+        """
+        raise NotImplementedError
+
+    def failure_message(self, values: dict[str, Any]) -> Optional[str]:
+        """
+        Message describing the failure given the values of the aggregates,
+        None if the rule succeeds
+        """
+        raise NotImplementedError
+
+    def failure_sample(
+        self, connection: Connection, source: TableClause, limit: int
+    ) -> list[dict]:
+        """
+        A few rows showing the failure
+        """
+        condition = self.failing_condition(source)
+        if condition is None:
+            return []
+        query = (
+            select(literal_column("*")).select_from(source).where(condition).limit(limit)
+        )
+        return [dict(row._mapping) for row in connection.execute(query)]
+
+    def failing_condition(self, source: TableClause):
+        """
+        Condition matching the rows that fail the rule, if there is one
+        """
+        return None
+
+    def __repr__(self) -> str:
+        params = ", ".join(f"{key}={value!r}" for key, value in vars(self).items())
+        return f"{type(self).__name__}({params})"
+
+
+class NotNull(SqlRule):
+    def aggregates(self, source: TableClause) -> dict[str, Any]:
+        return {"nulls": func.count() - func.count(source.c[self.column])}
+
+    def failure_message(self, values: dict[str, Any]) -> Optional[str]:
+        if values["nulls"]:
+            return f"{values['nulls']} null values in {self.column}"
+        return None
+
+    def failing_condition(self, source: TableClause):
+        return source.c[self.column].is_(None)
+
+
+class Unique(SqlRule):
+    def aggregates(self, source: TableClause) -> dict[str, Any]:
+        return {
+            "duplicates": func.count(source.c[self.column])
+            - func.count(source.c[self.column].distinct())
+        }
+
+    def failure_message(self, values: dict[str, Any]) -> Optional[str]:
+        if values["duplicates"]:
+            return f"{values['duplicates']} duplicate values in {self.column}"
+        return None
+
+    def failure_sample(
+        self, connection: Connection, source: TableClause, limit: int
+    ) -> list[dict]:
+        query = (
+            select(source.c[self.column], func.count().label("count"))
+            .where(source.c[self.column].is_not(None))
+            .group_by(source.c[self.column])
+            .having(func.count() > 1)
+            .limit(limit)
+        )
+        return [dict(row._mapping) for row in connection.execute(query)]
+
+
+class InRange(SqlRule):
+    """
+    Non-null values are between min and max (inclusive). Either bound can be omitted,
+    but not both.
+    """
+
+    def __init__(
+        self, column: str, min: Any = None, max: Any = None, name: Optional[str] = None
+    ):
+        if min is None and max is None:
+            raise ValueError(f"InRange on {column} needs a min or a max")
+        super().__init__(column, name)
+        self.min = min
+        self.max = max
+
+    def aggregates(self, source: TableClause) -> dict[str, Any]:
+        return {
+            "out_of_range": func.coalesce(
+                func.sum(case((self.failing_condition(source), 1), else_=0)), 0
+            )
+        }
+
+    def failure_message(self, values: dict[str, Any]) -> Optional[str]:
+        if values["out_of_range"]:
+            return f"{values['out_of_range']} values of {self.column} outside of [{self.min}, {self.max}]"
+        return None
+
+    def failing_condition(self, source: TableClause):
+        conditions = []
+        if self.min is not None:
+            conditions.append(source.c[self.column] < self.min)
+        if self.max is not None:
+            conditions.append(source.c[self.column] > self.max)
+        return and_(source.c[self.column].is_not(None), or_(false(), *conditions))
+
+
+class Freshness(SqlRule):
+    """
+    The most recent value of a timestamp column is at most max_age old. now defaults
+    to the current time, in the timezone of the column values. When only one of the
+    latest value and now is timezone-aware, the naive one is taken as UTC.
+    """
+
+    def __init__(
+        self,
+        column: str,
+        max_age: timedelta,
+        now: Optional[datetime] = None,
+        name: Optional[str] = None,
+    ):
+        super().__init__(column, name)
+        self.max_age = max_age
+        self.now = now
+
+    def aggregates(self, source: TableClause) -> dict[str, Any]:
+        return {"latest": func.max(source.c[self.column])}
+
+    def failure_message(self, values: dict[str, Any]) -> Optional[str]:
+        if values["latest"] is None:
+            return f"No values in {self.column}"
+        latest = pd.Timestamp(values["latest"])
+        now = (
+            pd.Timestamp.now(tz=latest.tzinfo)
+            if self.now is None
+            else pd.Timestamp(self.now)
+        )
+        if (latest.tzinfo is None) != (now.tzinfo is None):
+            latest, now = as_utc(latest), as_utc(now)
+        if latest < now - self.max_age:
+            return f"Latest {self.column} {latest} is older than {self.max_age}"
+        return None
+
+
+def as_utc(timestamp: pd.Timestamp) -> pd.Timestamp:
+    """
+    Timestamp converted to UTC, naive timestamps being taken as UTC
+    """
+    if timestamp.tzinfo is None:
+        return timestamp.tz_localize("UTC")
+    return timestamp.tz_convert("UTC")
+
+
+def table_clause(name: str, rules: list[SqlRule]) -> TableClause:
+    """
+    Lightweight table ("table" or "schema.table") with the columns used by the rules
+    """
+    schema, _, table_name = name.rpartition(".")
+    return table(
+        table_name,
+        *[column(name) for name in sorted({rule.column for rule in rules})],
+        schema=schema or None,
+    )
+
+
+def fused_query(source: TableClause, rules: list[SqlRule]):
+    """
+    Single query computing the aggregates of all the rules on a table. Aggregates
+    are labeled "{rule index}__{aggregate name}".
+    """
+    return select(
+        *[
+            aggregate.label(f"{index}__{name}")
+            for index, rule in enumerate(rules)
+            for name, aggregate in rule.aggregates(source).items()
+        ]
+    ).select_from(source)
+
+
+def split_fused_row(row: dict[str, Any], rules: list[SqlRule]) -> list[dict[str, Any]]:
+    """
+    Split the result of a fused query into the aggregate values of each rule
+    """
+    values: list[dict[str, Any]] = [{} for _ in rules]
+    for label, value in row.items():
+        index, _, name = label.partition("__")
+        values[int(index)][name] = value
+    return values
@@ -0,0 +1,43 @@
+"""
+Incremental rules that only validate the data added since their last success.
+
+    @watermark_rule(lambda self: orders_max_id())
+    def rule_new_orders_valid(self, previous, current):
+        orders = read_orders(id_after=previous, id_up_to=current)
+        ...
+
+On each run the watermark function gives the current high-water mark (the latest
+timestamp or ID of the data) and the rule receives the (previous, current] window.
+The watermark is committed, per rule hash, only when the rule succeeds (including
+its soft assertions), so a failing window is validated again on the next run. previous is `initial` (None by
+default) on the first run.
+"""
+import functools
+from typing import Any, Callable
+from data_checks.base.rule_state import rule_states
+
+
+def watermark_rule(watermark: Callable[[Any], Any], initial: Any = None):
+    """
+    Declare an incremental rule. watermark takes the check and returns the
+    current high-water mark.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def rule(self, *args, **kwargs):
+            rule_hash = self.current_rule_hash()
+            previous = rule_states.get(rule_hash, "watermark", initial)
+            current = watermark(self)
+            if previous is not None and current is not None and current <= previous:
+                print(f"\t\tNo new data since watermark {previous}")
+                return None
+            result = func(self, previous, current, *args, **kwargs)
+            self.after_rule_success(
+                lambda: rule_states.set(rule_hash, "watermark", current)
+            )
+            return result
+
+        return rule
+
+    return decorator
@@ -0,0 +1,70 @@
+"""
+Datasets read as a stream of dataframe chunks, so that rules can process files
+larger than the available memory.
+"""
+from typing import Callable, Iterator, Optional
+import pandas as pd
+from data_checks.conf.settings import settings
+
+
+class ChunkedSource:
+    """
+    Re-iterable stream of dataframe chunks. Every iteration reads the dataset
+    from the start, so only one chunk is held in memory at a time.
+    """
+
+    def __init__(self, read_chunks: Callable[[], Iterator[pd.DataFrame]], name: str):
+        """
+        read_chunks -- function returning a new iterator over the chunks
+        name -- description of the dataset
+        """
+        self.read_chunks = read_chunks
+        self.name = name
+
+    @classmethod
+    def csv(
+        cls, path: str, chunksize: Optional[int] = None, **read_csv_kwargs
+    ) -> "ChunkedSource":
+        """
+        Stream a CSV file, SOURCE_CHUNK_SIZE rows at a time by default
+        """
+        chunksize = chunksize or settings["SOURCE_CHUNK_SIZE"]
+
+        def read_chunks():
+            with pd.read_csv(path, chunksize=chunksize, **read_csv_kwargs) as reader:
+                yield from reader
+
+        return cls(read_chunks, name=path)
+
+    @classmethod
+    def sql(
+        cls, query, con, chunksize: Optional[int] = None, **read_sql_kwargs
+    ) -> "ChunkedSource":
+        """
+        Stream the result of a SQL query, SOURCE_CHUNK_SIZE rows at a time by default
+        """
+        chunksize = chunksize or settings["SOURCE_CHUNK_SIZE"]
+        return cls(
+            lambda: pd.read_sql(query, con, chunksize=chunksize, **read_sql_kwargs),
+            name=str(query),
+        )
+
+    @classmethod
+    def frame(cls, df: pd.DataFrame, chunksize: Optional[int] = None) -> "ChunkedSource":
+        """
+        Stream a dataframe already in memory, mostly useful to test chunked rules
+        """
+        chunksize = chunksize or settings["SOURCE_CHUNK_SIZE"]
+        return cls(
+            lambda: (
+                df.iloc[start : start + chunksize]
+                for start in range(0, len(df), chunksize)
+            ),
+            name="dataframe",
+        )
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        return iter(self.read_chunks())
+
+    def __repr__(self) -> str:
+        return f"ChunkedSource(name={self.name!r})"
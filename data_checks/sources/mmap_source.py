@@ -0,0 +1,64 @@
+"""
+Local data files served to checks as read-only memory-mapped data.
+
+The file is converted once into the columnar format of the data cache. Every check,
+in any process, then maps the same column files, so the data is shared through the
+OS page cache instead of being parsed into the private memory of each process.
+"""
+import os
+from typing import Callable, Optional
+import numpy as np
+import pandas as pd
+from data_checks.cache import column_store
+from data_checks.cache.data_cache import DataCache, data_cache, file_fingerprint
+
+
+class MmapSource:
+    def __init__(
+        self,
+        path: str,
+        reader: Callable[..., pd.DataFrame] = pd.read_csv,
+        cache: Optional[DataCache] = None,
+        hash_contents: bool = False,
+        **reader_kwargs,
+    ):
+        """
+        path -- file to serve
+        reader -- function that parses the file, pd.read_csv by default
+        cache -- data cache storing the converted file, the default data cache by default
+        hash_contents -- fingerprint the file by its contents instead of its size and mtime
+        """
+        self.path = path
+        self.reader = reader
+        self.cache = data_cache if cache is None else cache
+        self.hash_contents = hash_contents
+        self.reader_kwargs = reader_kwargs
+
+    def frame(self, columns: Optional[list] = None) -> pd.DataFrame:
+        """
+        Dataframe whose numeric and datetime columns are read-only memory-mapped arrays
+        """
+        return column_store.read_frame(self.convert(), mmap=True, columns=columns)
+
+    def array(self, column) -> np.ndarray:
+        """
+        Read-only memory-mapped array of a single column
+        """
+        entry = self.convert()
+        return column_store.read_column(
+            entry, column_store.column_position(entry, column), mmap=True
+        )
+
+    def convert(self) -> str:
+        """
+        Convert the file into the columnar format if it changed since the last
+        conversion. Returns the directory of the converted file.
+        """
+        return self.cache.store(
+            name=f"mmap:{os.path.abspath(self.path)}:{self.reader.__name__}:{sorted(self.reader_kwargs.items())}",
+            fingerprint=file_fingerprint(self.path, hash_contents=self.hash_contents),
+            loader=lambda: self.reader(self.path, **self.reader_kwargs),
+        )
+
+    def __repr__(self) -> str:
+        return f"MmapSource(path={self.path!r})"
@@ -26,6 +26,10 @@ def extract_wrapped(decorated):
 
 def get_function_code(cls: object, function_name: str):
     function_obj: Any = getattr(cls, function_name)
+    # Generated rules (e.g. SQL rules) describe their own code
+    rule_source = getattr(function_obj, "rule_source", None)
+    if rule_source is not None:
+        return rule_source
     if function_obj.__closure__ is not None:
         function_obj = extract_wrapped(function_obj)
     source_code = inspect.getsource(function_obj)
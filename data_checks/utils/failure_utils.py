@@ -0,0 +1,59 @@
+"""
+This module contains functions for fingerprinting rule failures so that identical failures can be grouped.
+"""
+import hashlib
+import re
+import traceback
+from data_checks.base.exceptions import DataCheckException
+
+# Variable parts of a message, replaced by placeholders to get its template
+MESSAGE_PATTERNS = [
+    (
+        re.compile(
+            r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+        ),
+        "<uuid>",
+    ),
+    (re.compile(r"0x[0-9a-fA-F]+"), "<hex>"),
+    (re.compile(r"'[^']*'|\"[^\"]*\"|`[^`]*`"), "<str>"),
+    (re.compile(r"[-+]?\d+(\.\d+)?"), "<num>"),
+]
+
+
+def unwrap_exception(exception: BaseException) -> BaseException:
+    """
+    Get the exception raised by the rule from a DataCheckException
+    """
+    if isinstance(exception, DataCheckException) and exception.exception is not None:
+        return exception.exception
+    return exception
+
+
+def message_template(message: str) -> str:
+    """
+    Replace the numbers, quoted strings, hex values and uuids of a message by placeholders
+    """
+    for pattern, placeholder in MESSAGE_PATTERNS:
+        message = pattern.sub(placeholder, message)
+    return message
+
+
+def exception_type(exception: BaseException) -> str:
+    exception = unwrap_exception(exception)
+    return f"{type(exception).__module__}.{type(exception).__qualname__}"
+
+
+def fingerprint(exception: BaseException) -> str:
+    """
+    Fingerprint of an exception built from its type, message template and traceback frames
+    """
+    raised_exception = unwrap_exception(exception)
+    frames = [
+        f"{frame.filename}:{frame.name}:{frame.lineno}"
+        for frame in traceback.extract_tb(raised_exception.__traceback__)
+    ]
+    fingerprint_source = "\n".join(
+        [exception_type(raised_exception), message_template(str(raised_exception))]
+        + frames
+    )
+    return hashlib.sha1(fingerprint_source.encode()).hexdigest()
@@ -1,5 +1,18 @@
+from typing import Iterable, TypeVar
 from data_checks.base.check import Check
 
+T = TypeVar("T")
+
 
 def generate_checks(check_type: type[Check], check_fields: list[dict]) -> list[Check]:
     return [check_type(**check_field) for check_field in check_fields]
+
+
+def chunks(iterable: Iterable[T], size: int) -> list[list[T]]:
+    """
+    Split an iterable into consecutive lists of at most `size` elements
+    """
+    if size < 1:
+        raise ValueError(f"Chunk size must be a positive integer, got {size}")
+    items = list(iterable)
+    return [items[i : i + size] for i in range(0, len(items), size)]
@@ -1,7 +1,11 @@
 import argparse
 from copy import deepcopy
+from datetime import datetime, timedelta
+from typing import Optional
+from apscheduler.schedulers.base import BaseScheduler
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.date import DateTrigger
 from multiprocessing import Process
 from data_checks.conf.settings import settings
 from data_checks.conf.data_suite_registry import data_suite_registry
@@ -10,6 +14,7 @@ from data_checks.base.actions.suite import (
     MainDatabaseAction,
     ErrorLoggingSuiteAction,
     FindSuiteModelAction,
+    FailureGroupsDatabaseAction,
 )
 from data_checks.base.actions.check import (
     MainDatabaseAction as CheckMainDatabaseAction,
@@ -19,6 +24,7 @@ from data_checks.base.actions.check import (
     RuleAlertingAction,
 )
 from data_checks.base.suite import CheckActions
+from data_checks.base.fixture import Fixture, fixture_scopes
 from data_checks.classes.data_suite import DataSuite
 
 
@@ -29,6 +35,63 @@ def start_suite_deployment(suite: DataSuite, is_async: bool = False):
     process = Process(target=suite.run if not is_async else suite.run_async)
     process.start()
     process.join()
+    # The run inherited the prefetched values, free them until the next prefetch
+    for prefetched in suite.prefetch():
+        if isinstance(prefetched, Fixture):
+            fixture_scopes.discard(prefetched)
+
+
+def prefetch_suite(
+    scheduler: BaseScheduler,
+    suite: DataSuite,
+    trigger: CronTrigger,
+    lead_seconds: int,
+    fire_time: datetime,
+):
+    """
+    Load the prefetch data of a suite in the scheduler process ahead of its run at
+    fire_time, so that the forked run inherits it. Then schedule the next prefetch.
+    """
+    print(f"[PREFETCH] {suite.name} for the run at {fire_time}")
+    for prefetched in suite.prefetch():
+        try:
+            if isinstance(prefetched, Fixture):
+                # Reload so the run gets fresh data
+                fixture_scopes.discard(prefetched)
+                fixture_scopes.get(prefetched)
+            else:
+                prefetched()
+        except Exception as e:
+            # The run loads the data itself if prefetching fails
+            print(f"[PREFETCH] {suite.name} failed to prefetch {prefetched}: {e}")
+    schedule_prefetch(scheduler, suite, trigger, lead_seconds, after=fire_time)
+
+
+def schedule_prefetch(
+    scheduler: BaseScheduler,
+    suite: DataSuite,
+    trigger: CronTrigger,
+    lead_seconds: int,
+    after: Optional[datetime] = None,
+):
+    """
+    Schedule the prefetch of a suite lead_seconds before its next run after `after`
+    (or now). If that time has already passed, the prefetch starts immediately.
+    """
+    now = datetime.now(trigger.timezone)
+    fire_time = trigger.get_next_fire_time(
+        None, now if after is None else max(now, after + timedelta(seconds=1))
+    )
+    if fire_time is None:
+        return
+    run_date = max(now, fire_time - timedelta(seconds=lead_seconds))
+    scheduler.add_job(
+        prefetch_suite,
+        DateTrigger(run_date),
+        id=f"{suite.name}:prefetch",
+        replace_existing=True,
+        args=(scheduler, suite, trigger, lead_seconds, fire_time),
+    )
 
 
 def update_actions(
@@ -66,6 +129,7 @@ def run_suites(
             update_actions(suite, actions, check_actions)
             suite.run()
             count += 1
+    fixture_scopes.release("run")
 
 
 def main():
@@ -107,6 +171,13 @@ def main():
         default=False,
     )
 
+    parser.add_argument(
+        "--prefetch",
+        type=int,
+        help="When deploying, load the suites' prefetch data this many seconds before each scheduled run.",
+        default=settings["PREFETCH_SECONDS"],
+    )
+
     parser.add_argument(
         "--disable_exception_logging",
         "-s",
@@ -176,9 +247,11 @@ def main():
         # Find database suites and checks to make the rule execution with
         suite_actions = default_suite_actions + [
             FindSuiteModelAction,  # Finds the corresponding Suite model for the check and rule
+            FailureGroupsDatabaseAction,  # Stores identical failures of a run as one record
         ]
         check_actions = {
-            "default": default_check_actions["default"] + [ExecutionDatabaseAction],
+            # Stores the execution first so that the other actions get its id
+            "default": [ExecutionDatabaseAction] + default_check_actions["default"],
             "checks": {},
         }
         scheduler = BackgroundScheduler()
@@ -189,15 +262,18 @@ def main():
             print(f"[CRON JOB - {schedule}] {suite_name}")
             suite = suite()
             update_actions(suite, suite_actions, check_actions)
+            trigger = CronTrigger.from_crontab(schedule)
             scheduler.add_job(
                 start_suite_deployment,
-                CronTrigger.from_crontab(schedule),
+                trigger,
                 id=suite_name,
                 args=(
                     suite,
                     args.parallel,
                 ),
             )
+            if args.prefetch and suite.prefetch():
+                schedule_prefetch(scheduler, suite, trigger, args.prefetch)
 
         scheduler.start()
 
@@ -1,6 +1,7 @@
 import openai
 import pandas as pd
 from data_checks.classes.data_check import DataCheck
+from data_checks.rules.record_rule import record_rule
 
 openai.api_key = "SECRET KEY HERE"
 
@@ -22,67 +23,46 @@ class ContentCheck(DataCheck):
         )
         return response.choices[0].text.strip() == "True"
 
-    def rule_no_personal_data(self):
-        for message in self.content:
-            response = self.openai_checker(message, "personal data")
-            assert response == False, f"Message: `{message}` may contain personal data"
+    @record_rule("content", message="Message: `{}` may contain personal data")
+    def rule_no_personal_data(self, message):
+        return not self.openai_checker(message, "personal data")
 
-    def rule_no_spam(self):
-        for message in self.content:
-            response = self.openai_checker(message, "spam")
-            assert response == False, f"Message: `{message}` may contain spam"
+    @record_rule("content", message="Message: `{}` may contain spam")
+    def rule_no_spam(self, message):
+        return not self.openai_checker(message, "spam")
 
-    def rule_no_incoherent_content(self):
-        for message in self.content:
-            response = self.openai_checker(message, "incoherent content")
-            assert (
-                response == False
-            ), f"Message: `{message}` may contain incoherent content"
+    @record_rule("content", message="Message: `{}` may contain incoherent content")
+    def rule_no_incoherent_content(self, message):
+        return not self.openai_checker(message, "incoherent content")
 
-    def rule_no_offensive_content(self):
-        for message in self.content:
-            response = self.openai_checker(message, "offensive content")
-            assert (
-                response == False
-            ), f"Message: `{message}` may contain offensive content"
+    @record_rule("content", message="Message: `{}` may contain offensive content")
+    def rule_no_offensive_content(self, message):
+        return not self.openai_checker(message, "offensive content")
 
-    def rule_no_misinformation(self):
-        for message in self.content:
-            response = self.openai_checker(message, "misinformation")
-            assert response == False, f"Message: `{message}` may contain misinformation"
+    @record_rule("content", message="Message: `{}` may contain misinformation")
+    def rule_no_misinformation(self, message):
+        return not self.openai_checker(message, "misinformation")
 
-    def rule_no_hate_speech(self):
-        for message in self.content:
-            response = self.openai_checker(message, "hate speech")
-            assert response == False, f"Message: `{message}` may contain hate speech"
+    @record_rule("content", message="Message: `{}` may contain hate speech")
+    def rule_no_hate_speech(self, message):
+        return not self.openai_checker(message, "hate speech")
 
-    def rule_no_strong_language(self):
-        for message in self.content:
-            response = self.openai_checker(message, "strong language")
-            assert (
-                response == False
-            ), f"Message: `{message}` may contain strong language"
+    @record_rule("content", message="Message: `{}` may contain strong language")
+    def rule_no_strong_language(self, message):
+        return not self.openai_checker(message, "strong language")
 
-    def rule_no_adult_content(self):
-        for message in self.content:
-            response = self.openai_checker(message, "adult content")
-            assert response == False, f"Message: `{message}` may contain adult content"
+    @record_rule("content", message="Message: `{}` may contain adult content")
+    def rule_no_adult_content(self, message):
+        return not self.openai_checker(message, "adult content")
 
-    def rule_no_bot_content(self):
-        for message in self.content:
-            response = self.openai_checker(message, "bot content")
-            assert response == False, f"Message: `{message}` may contain bot content"
+    @record_rule("content", message="Message: `{}` may contain bot content")
+    def rule_no_bot_content(self, message):
+        return not self.openai_checker(message, "bot content")
 
-    def rule_no_long_suspicous_urls(self):
-        for message in self.content:
-            response = self.openai_checker(message, "long and suspicious URLs")
-            assert (
-                response == False
-            ), f"Message: `{message}` may contain long and suspicious URLs"
+    @record_rule("content", message="Message: `{}` may contain long and suspicious URLs")
+    def rule_no_long_suspicous_urls(self, message):
+        return not self.openai_checker(message, "long and suspicious URLs")
 
-    def rule_no_extremely_negative_sentiment(self):
-        for message in self.content:
-            response = self.openai_checker(message, "extremely negative sentiment")
-            assert (
-                response == False
-            ), f"Message: `{message}` may contain extremely negative sentiment"
+    @record_rule("content", message="Message: `{}` may contain extremely negative sentiment")
+    def rule_no_extremely_negative_sentiment(self, message):
+        return not self.openai_checker(message, "extremely negative sentiment")
@@ -1,10 +1,13 @@
 import re
 import pandas as pd
 from data_checks.classes.data_check import DataCheck
+from data_checks.profiling.column_profile import profile_of
 from hamcrest import assert_that, equal_to, is_not
 
 
 class DateCheck(DataCheck):
+    profile = profile_of("dates_df")
+
     def rule_is_properly_formatted(self, format_pattern, column="DOB"):
         dates = self.dates_df[column]
         for date in dates:
@@ -15,8 +18,7 @@ class DateCheck(DataCheck):
             )
 
     def rule_nonnull(self, column="DOB"):
-        dates = self.dates_df[column]
-        assert_that(dates.isnull().sum(), equal_to(0), "Null date found")
+        assert_that(self.profile[column].null_count, equal_to(0), "Null date found")
 
     def rule_valid_date(self, column="DOB"):
         dates = self.dates_df[column]
@@ -1,24 +1,18 @@
-import re
 from data_checks.classes.data_check import DataCheck
-from hamcrest import assert_that, equal_to, is_not
+from data_checks.rules.column_assertions import assert_column, matches, not_in_set
 
 
 class IpCheck(DataCheck):
     BLACKLISTED = ["192.256.1.1", "192.168.1.1"]
 
     def rule_not_blacklisted(self):
-        for ip in self.ips:
-            assert_that(
-                ip in self.BLACKLISTED, equal_to(False), f"IP {ip} is blacklisted"
-            )
+        assert_column(not_in_set(self.ips, self.BLACKLISTED), "Blacklisted IPs")
 
     def rule_valid_ipv4(self):
-        for ip in self.ips:
-            assert_that(
-                re.match(
-                    r"^((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$",
-                    ip,
-                ),
-                is_not(None),
-                f"IP {ip} is not valid IPv4",
-            )
+        assert_column(
+            matches(
+                self.ips,
+                r"((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)",
+            ),
+            "IPs are not valid IPv4",
+        )
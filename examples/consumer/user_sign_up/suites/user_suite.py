@@ -5,12 +5,19 @@ from examples.consumer.user_sign_up.checks.ip_check import IpCheck
 from examples.consumer.user_sign_up.checks.payments_check import PaymentsCheck
 from examples.consumer.user_sign_up.checks.status_check import StatusCheck
 from data_checks.classes.data_suite import DataSuite
+from data_checks.base.fixture import fixture
+from data_checks.cache.data_cache import data_cache
+
+
+@fixture(scope="run")
+def sign_up_data() -> pd.DataFrame:
+    return data_cache.read_csv("examples/consumer/user_sign_up/data.csv")
 
 
 class UserSuite(DataSuite):
     @classmethod
     def checks(cls):
-        data = pd.read_csv("examples/consumer/user_sign_up/data.csv")
+        data = sign_up_data()
         return [
             DateCheck(dates_df=data),
             EmailCheck(emails=data["Email"]),
@@ -19,6 +26,10 @@ class UserSuite(DataSuite):
             StatusCheck(statuses=data["Status"]),
         ]
 
+    @classmethod
+    def prefetch(cls):
+        return [sign_up_data]
+
     @classmethod
     def suite_config(cls) -> dict:
         return {
@@ -4,16 +4,40 @@ from adtk.detector import PersistAD
 from pyod.models.iforest import IForest
 from pyod.models.ocsvm import OCSVM
 from hamcrest import assert_that, equal_to
+from data_checks.base.fixture import fixture
+from data_checks.cache.model_cache import rule_model
 from data_checks.classes.data_check import DataCheck
+from data_checks.rules.anomaly_detectors import (
+    EWMA,
+    SeasonalBaseline,
+    Welford,
+    assert_no_anomalies,
+)
 
 
-class AnomalyDetectionCheck(DataCheck):
-    time_series_data = pd.read_csv(
+@fixture(scope="check")
+def time_series_data() -> pd.DataFrame:
+    return pd.read_csv(
         "examples/general/anomaly_detection/data.csv",
         index_col="timestamp",
         parse_dates=True,
     )
 
+
+class AnomalyDetectionCheck(DataCheck):
+    time_series_data = time_series_data
+
+    def rule_detect_with_welford(self):
+        assert_no_anomalies(self, self.time_series_data["value"], Welford(min_count=10))
+
+    def rule_detect_with_ewma(self):
+        assert_no_anomalies(self, self.time_series_data["value"], EWMA(alpha=0.2))
+
+    def rule_detect_with_seasonal_baseline(self):
+        assert_no_anomalies(
+            self, self.time_series_data["value"], SeasonalBaseline(season="hour")
+        )
+
     def rule_detect_with_adtk(self):
         s_train = validate_series(self.time_series_data)
         persist_ad = PersistAD()
@@ -24,8 +48,7 @@ class AnomalyDetectionCheck(DataCheck):
 
     def rule_detect_with_pyod_iforest(self):
         X = self.time_series_data[["value"]]
-        model = IForest()
-        model.fit(X)
+        model = rule_model(self, lambda: IForest().fit(X), training_data=X)
         scores_pred = model.decision_function(X)
         threshold = model.threshold_
         labels_pred = scores_pred > threshold
@@ -39,8 +62,7 @@ class AnomalyDetectionCheck(DataCheck):
 
     def rule_detect_with_pyod_ocsvm(self):
         X = self.time_series_data[["value"]]
-        model = OCSVM()
-        model.fit(X)
+        model = rule_model(self, lambda: OCSVM().fit(X), training_data=X)
         scores_pred = model.decision_function(X)
         threshold = model.threshold_
         labels_pred = scores_pred > threshold
@@ -1,17 +1,33 @@
 import pandas as pd
-from hamcrest import assert_that, greater_than_or_equal_to
 from data_checks.classes.data_check import DataCheck
+from data_checks.rules.chunked_rule import chunked_rule
+from data_checks.rules.column_assertions import SAMPLE_SIZE, assert_column, fresh
+from data_checks.sources.chunked_source import ChunkedSource
 
 
 class FreshnessCheck(DataCheck):
-    def rule_ensure_all_fresh_data(self, date_column="date", max_days_stale=2):
-        dates = pd.read_csv("examples/general/freshness/data.csv")[date_column]
-        for date in dates:
-            assert_that(
-                pd.Timestamp(date),
-                greater_than_or_equal_to(
-                    pd.Timestamp("2023-08-22 10:00:00")
-                    - pd.Timedelta(days=max_days_stale)
-                ),
-                f"Data is stale. The date {date} is older than {max_days_stale} days ago.",
-            )
+    @chunked_rule(
+        ChunkedSource.csv("examples/general/freshness/data.csv", chunksize=10_000)
+    )
+    def rule_ensure_all_fresh_data(
+        self, chunk, state, date_column="date", max_days_stale=2
+    ):
+        result = fresh(
+            chunk[date_column],
+            max_age=pd.Timedelta(days=max_days_stale),
+            now=pd.Timestamp("2023-08-22 10:00:00"),
+        )
+        if "result" not in state:
+            state["result"] = {**result, "mask": None}
+        else:
+            state["result"]["failures"] += result["failures"]
+            state["result"]["total"] += result["total"]
+            state["result"]["sample"] = (
+                state["result"]["sample"] + result["sample"]
+            )[:SAMPLE_SIZE]
+
+    @rule_ensure_all_fresh_data.merge
+    def rule_ensure_all_fresh_data(self, state, date_column="date", max_days_stale=2):
+        assert_column(
+            state["result"], f"Data is older than {max_days_stale} days ago"
+        )
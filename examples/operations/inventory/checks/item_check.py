@@ -8,35 +8,38 @@ from examples.operations.inventory.item import Item
 class ItemCheck(DataCheck):
     def rule_required_fields(self):
         item: Item = self.item
-        assert_that(
-            item.product_id,
-            is_not(None),
-            f"product_id is required for {item.name}",
+        self.expect_that(
+            item.product_id, is_not(None), "product_id is required for {}", item.name
         )
-        assert_that(
+        self.expect_that(
             item.name,
             is_not(None),
-            f"name is required for productId: {item.product_id}",
+            "name is required for productId: {}",
+            item.product_id,
         )
-        assert_that(
+        self.expect_that(
             item.category,
             is_not(None),
-            f"category is required for productId: {item.product_id}",
+            "category is required for productId: {}",
+            item.product_id,
         )
-        assert_that(
+        self.expect_that(
             item.brand,
             is_not(None),
-            f"brand is required for productId: {item.product_id}",
+            "brand is required for productId: {}",
+            item.product_id,
         )
-        assert_that(
+        self.expect_that(
             item.price,
             is_not(None),
-            f"price is required for productId: {item.product_id}",
+            "price is required for productId: {}",
+            item.product_id,
         )
-        assert_that(
+        self.expect_that(
             item.stock,
             is_not(None),
-            f"stock is required for productId: {item.product_id}",
+            "stock is required for productId: {}",
+            item.product_id,
         )
 
     def rule_reasonable_values(self):
@@ -1,8 +1,15 @@
 import pandas as pd
 from data_checks.classes.group_data_suite import GroupDataSuite
+from data_checks.base.fixture import fixture
 from examples.operations.inventory.item import Item
 
 
+@fixture(scope="suite")
+def items() -> list[Item]:
+    items_df = pd.read_csv("examples/operations/inventory/data.csv")
+    return [Item(**kwargs) for kwargs in items_df.to_dict(orient="records")]
+
+
 class InventorySuite(GroupDataSuite):
     @classmethod
     def group_name(cls) -> str:
@@ -18,9 +25,14 @@ class InventorySuite(GroupDataSuite):
         List of group's members. Each element will be subject to the specified
         checks. Can be accessed through self.{group_name} in checks
         """
-        items_df = pd.read_csv("examples/operations/inventory/data.csv")
+        return items()
 
-        return [Item(**kwargs) for kwargs in items_df.to_dict(orient="records")]
+    @classmethod
+    def group_key(cls, element: Item) -> str:
+        """
+        Short and stable key identifying each element of the group
+        """
+        return str(element.product_id)
 
     @classmethod
     def group_checks(cls):
@@ -0,0 +1,3 @@
+CHECKS_DATABASE_URL = None
+CHECKS_MODULE = "registered_checks"
+SUITES_MODULE = "registered_checks"
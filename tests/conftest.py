@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Settings used by the tests, see tests/check_settings.py
+sys.path.insert(0, os.path.dirname(__file__))
+os.environ.setdefault("CHECK_SETTINGS_MODULE", "check_settings")
@@ -0,0 +1,3 @@
+"""
+Checks and suites registered by the test settings. Tests define their own.
+"""
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+from data_checks.classes.data_check import DataCheck
+from data_checks.rules.anomaly_detectors import (
+    EWMA,
+    SeasonalBaseline,
+    Welford,
+    assert_no_anomalies,
+    detect_anomalies,
+)
+
+metrics = {}
+detectors = {
+    "welford": lambda: Welford(),
+    "ewma": lambda: EWMA(),
+    "seasonal": lambda: SeasonalBaseline("hour"),
+}
+anomalies = []
+
+
+class MetricsCheck(DataCheck):
+    def rule_detect(self, kind):
+        result = detect_anomalies(self, metrics["value"], detectors[kind]())
+        anomalies.append([value for _, value, _ in result["anomalies"]])
+
+    def rule_no_anomalies(self):
+        assert_no_anomalies(self, metrics["value"], Welford())
+
+
+def noise(size: int) -> np.ndarray:
+    # Standard deviation of about 0.7, cycling through the hours of the day as well
+    return np.resize([-1.0, -0.5, 0.0, 0.5, 1.0], size)
+
+
+def append(values):
+    start = 0 if "value" not in metrics else len(metrics["value"])
+    new = pd.Series(
+        values,
+        index=pd.date_range("2023-08-01", periods=len(values), freq="h")
+        + pd.Timedelta(hours=start),
+    )
+    metrics["value"] = pd.concat([metrics.get("value"), new]).rename("value")
+
+
+def run(check, rule, **params):
+    check.rules_params = {rule: params}
+    check.excluded_rules = [name for name in check.rules if name != rule]
+    (result,) = check.run_all()
+    return result["status"]
+
+
+@pytest.mark.parametrize("kind", ["welford", "ewma", "seasonal"])
+def test_level_shift_is_followed(kind):
+    metrics.clear()
+    anomalies.clear()
+    check = MetricsCheck(name=f"level_shift_{kind}")
+    append(noise(24 * 20))
+    run(check, "rule_detect", kind=kind)
+    for _ in range(3):
+        append(10 + noise(24 * 5))
+        run(check, "rule_detect", kind=kind)
+    # The first points of the shift are flagged (per season for seasonal), then the
+    # detector follows the new level
+    assert [len(values) for values in anomalies] == [
+        0,
+        5 * 24 if kind == "seasonal" else 5,
+        0,
+        0,
+    ]
+
+
+@pytest.mark.parametrize("kind", ["welford", "ewma", "seasonal"])
+def test_isolated_anomalies_do_not_update_the_statistics(kind):
+    metrics.clear()
+    anomalies.clear()
+    check = MetricsCheck(name=f"isolated_{kind}")
+    append(noise(24 * 10))
+    run(check, "rule_detect", kind=kind)
+    for _ in range(2):
+        values = noise(24 * 10)
+        values[:: 24 * 2] = 100
+        append(values)
+        run(check, "rule_detect", kind=kind)
+    assert anomalies == [[], [100] * 5, [100] * 5]
+
+
+def test_only_new_points_are_scored():
+    metrics.clear()
+    check = MetricsCheck(name="new_points")
+    append(noise(100))
+    assert run(check, "rule_no_anomalies") == "success"
+    append([50.0])
+    assert run(check, "rule_no_anomalies") == "failure"
+    append(noise(10))
+    assert run(check, "rule_no_anomalies") == "success"
@@ -0,0 +1,56 @@
+import pandas as pd
+from data_checks.classes.data_check import DataCheck
+from data_checks.rules.chunked_rule import chunked_rule
+from data_checks.sources.chunked_source import ChunkedSource
+
+values = pd.DataFrame({"value": range(10)})
+empty = pd.DataFrame({"value": []})
+
+
+class ChunkedCheck(DataCheck):
+    @chunked_rule(ChunkedSource.frame(values, chunksize=3))
+    def rule_sum(self, chunk, state, expected=45):
+        state["chunks"] = state.get("chunks", 0) + 1
+        state["sum"] = state.get("sum", 0) + chunk["value"].sum()
+
+    @rule_sum.merge
+    def rule_sum(self, state, expected=45):
+        assert state["chunks"] == 4
+        assert state["sum"] == expected
+
+    @chunked_rule(ChunkedSource.frame(empty, chunksize=3))
+    def rule_empty(self, chunk, state):
+        state["seen"] = True
+
+    @rule_empty.merge
+    def rule_empty(self, state):
+        assert state["seen"]
+
+    @chunked_rule(lambda self: ChunkedSource.frame(empty), allow_empty=True)
+    def rule_allowed_empty(self, chunk, state):
+        pass
+
+    @rule_allowed_empty.merge
+    def rule_allowed_empty(self, state):
+        assert state == {}
+
+
+def run(rule, **params):
+    check = ChunkedCheck(rules_params={rule: params}, only_run_specified_rules=True)
+    (result,) = check.run_all()
+    return result
+
+
+def test_chunks_are_merged():
+    assert run("rule_sum")["status"] == "success"
+    assert run("rule_sum", expected=44)["status"] == "failure"
+
+
+def test_empty_source_fails_with_a_clear_message():
+    result = run("rule_empty")
+    assert result["status"] == "failure"
+    assert "No data in source" in result["exception"]
+
+
+def test_empty_source_can_be_allowed():
+    assert run("rule_allowed_empty")["status"] == "success"
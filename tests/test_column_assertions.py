@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import pandas as pd
+import pytest
+from data_checks.rules.column_assertions import (
+    assert_column,
+    fresh,
+    in_range,
+    matches,
+    monotonic,
+    not_null,
+    unique,
+)
+
+now = datetime(2023, 8, 22, 12, tzinfo=timezone.utc)
+
+
+def test_fresh_compares_datetimes_in_utc():
+    values = pd.Series(
+        [
+            datetime(2023, 8, 22, 11),  # Naive, taken as UTC
+            datetime(2023, 8, 22, 10),
+            datetime(2023, 8, 22, 13, tzinfo=timezone(timedelta(hours=2))),
+            datetime(2023, 8, 22, 5, tzinfo=timezone(timedelta(hours=-5))),
+        ],
+        dtype=object,
+    )
+    for reference in (now, now.replace(tzinfo=None)):
+        result = fresh(values, max_age=timedelta(hours=1, minutes=30), now=reference)
+        assert result["mask"].tolist() == [False, True, False, True]
+
+
+def test_fresh_fails_the_values_that_are_not_datetimes():
+    # Strings with different offsets are parsed as well
+    values = pd.Series(
+        ["2023-08-22T11:30:00+00:00", "yesterday", None, "2023-08-22T13:00:00+02:00"]
+    )
+    result = fresh(values, max_age=timedelta(hours=1), now=now)
+    assert result["mask"].tolist() == [False, True, True, False]
+    assert [index for index, _ in result["sample"]] == [1, 2]
+
+
+def test_fresh_defaults_to_the_current_time():
+    values = pd.Series([datetime.now(timezone.utc), datetime(2023, 8, 22)])
+    assert fresh(values, max_age=timedelta(hours=1))["mask"].tolist() == [False, True]
+
+
+@pytest.mark.parametrize(
+    "values, increasing, strict, failing",
+    [
+        ([1, 2, 2, 3], True, False, []),
+        ([1, 2, 2, 3], True, True, [2]),
+        ([3, 2, 2, 1], False, False, []),
+        ([1, 3, 2, 4], True, False, [2]),
+        # Null values fail and do not hide a break in the order
+        ([1.0, 3.0, np.nan, 2.0, 4.0], True, False, [2, 3]),
+        ([np.nan, 1.0, 2.0], True, False, [0]),
+        (["a", None, "c", "b"], True, False, [1, 3]),
+    ],
+)
+def test_monotonic(values, increasing, strict, failing):
+    result = monotonic(values, increasing=increasing, strict=strict)
+    assert np.flatnonzero(result["mask"]).tolist() == failing
+
+
+def test_monotonic_empty():
+    assert monotonic(pd.Series([], dtype=float))["failures"] == 0
+
+
+def test_assertions_report_a_sample_of_the_failures():
+    values = pd.Series(["a@b.io", None, "a@b.io", "bad"], index=list("wxyz"))
+    assert not_null(values)["sample"] == [("x", None)]
+    assert unique(values)["failures"] == 2
+    result = matches(values, r"[^@]+@[^@]+", sample_size=1)
+    assert result["failures"] == 2
+    assert result["sample"] == [("x", None)]
+    assert in_range([1, 5, 10], min=2, max=10, inclusive=False)["mask"].tolist() == [
+        True,
+        False,
+        True,
+    ]
+    with pytest.raises(AssertionError) as error:
+        assert_column(not_null(values), message="Missing emails")
+    assert str(error.value) == (
+        "Missing emails: 1 of 4 values failed. Sample (index, value): [('x', None)]"
+    )
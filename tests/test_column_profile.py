@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+import pytest
+from data_checks.base.fixture import fixture, fixture_scopes
+from data_checks.classes.data_check import DataCheck
+from data_checks.profiling.column_profile import ColumnProfile, profile_of
+
+values = pd.Series([3.0, 1.0, np.nan, 4.0, 1.0, 5.0, np.nan, 9.0], name="value")
+
+
+def test_numeric_statistics():
+    profile = ColumnProfile(values)
+    assert profile.count == 8
+    assert profile.null_count == 2
+    assert profile.null_fraction == 0.25
+    assert profile.distinct_count == 5
+    assert profile.distinct_fraction == 5 / 6
+    assert (profile.min, profile.max) == (1.0, 9.0)
+    assert profile.mean == pytest.approx(values.mean())
+    assert profile.std == pytest.approx(values.std())
+    for q in (0, 0.1, 0.25, 0.5, 0.9, 1):
+        assert profile.quantile(q) == pytest.approx(values.quantile(q))
+    assert repr(profile) == "ColumnProfile(name='value', count=8)"
+
+
+def test_order_statistics_come_from_a_single_sort(monkeypatch):
+    sorts = []
+    sort = np.sort
+    monkeypatch.setattr(
+        np, "sort", lambda *args, **kwargs: sorts.append(1) or sort(*args, **kwargs)
+    )
+    profile = ColumnProfile(values)
+    profile.min, profile.max, profile.distinct_count
+    profile.quantiles([0.25, 0.5, 0.75])
+    assert len(sorts) == 1
+
+
+def test_non_numeric_columns():
+    names = ColumnProfile(pd.Series(["b", "a", None, "c", "a"]))
+    assert (names.min, names.max) == ("a", "c")
+    assert names.distinct_count == 3
+    assert names.mean is None and names.std is None
+    # No interpolation between values that are not numbers, the lower one is taken
+    assert names.quantiles([0.5, 0.7, 1]) == {0.5: "a", 0.7: "b", 1: "c"}
+
+    dates = ColumnProfile(pd.Series(pd.to_datetime(["2023-08-02", None, "2023-08-01"])))
+    assert dates.min == pd.Timestamp("2023-08-01")
+    assert dates.max == pd.Timestamp("2023-08-02")
+
+    categories = ColumnProfile(pd.Series(["low", "high", "low"], dtype="category"))
+    assert categories.distinct_count == 2
+    assert categories.min == "high"
+
+    flags = ColumnProfile(pd.Series([True, False, True]))
+    assert flags.mean is None
+    assert flags.distinct_count == 2
+
+
+def test_unordered_and_empty_columns():
+    mixed = ColumnProfile(pd.Series([1, "a", None, "a"]))
+    assert mixed.min is None and mixed.max is None
+    assert mixed.distinct_count == 2
+    with pytest.raises(TypeError):
+        mixed.quantile(0.5)
+
+    empty = ColumnProfile(pd.Series([], dtype=float))
+    assert empty.null_fraction == 0.0
+    assert empty.distinct_fraction == 1.0
+    assert empty.min is None and empty.quantile(0.5) is None
+    with pytest.raises(ValueError):
+        empty.quantile(1.5)
+
+
+loads = []
+
+
+def load_users(check=None) -> pd.DataFrame:
+    loads.append(1)
+    return pd.DataFrame({"email": ["a@b.io", None, "c@d.io"], "age": [20, 30, 40]})
+
+
+@fixture
+def users():
+    return load_users()
+
+
+class UsersCheck(DataCheck):
+    profile = profile_of("users")
+    function_profile = profile_of(load_users)
+    fixture_profile = profile_of(users)
+
+    @property
+    def users(self):
+        return load_users()
+
+    def rule_missing_emails(self):
+        assert self.profile["email"].null_fraction < 0.5
+        assert self.profile["email"] is self.profile["email"]
+
+    def rule_ages(self):
+        assert self.profile["age"].max == 40
+        assert self.function_profile["age"].min == 20
+        assert self.fixture_profile["age"].quantile(0.5) == 30
+
+
+def test_profiles_are_memoized_for_the_run_of_the_check():
+    loads.clear()
+    check = UsersCheck()
+    results = check.run_all()
+    assert [result["status"] for result in results] == ["success", "success"]
+    # One load per profile for all the rules of the run
+    assert len(loads) == 3
+    check.run_all()
+    assert len(loads) == 6
+    fixture_scopes.release("check")
+    assert isinstance(UsersCheck.profile, profile_of)
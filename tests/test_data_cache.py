@@ -0,0 +1,92 @@
+import os
+import time
+import pandas as pd
+import pytest
+from data_checks.cache import column_store
+from data_checks.cache.data_cache import FINGERPRINT_FILE, DataCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DataCache(str(tmp_path), max_bytes=10**6)
+
+
+class Loader:
+    def __init__(self, size: int = 3):
+        self.calls = 0
+        self.size = size
+
+    def __call__(self):
+        self.calls += 1
+        return pd.DataFrame(
+            {
+                "value": [float(self.calls)] * self.size,
+                "at": pd.date_range(
+                    "2023-08-01", periods=self.size, freq="h", tz="Europe/Paris"
+                ),
+                "name": ["a"] * self.size,
+            }
+        )
+
+
+def test_entry_is_reused_until_the_fingerprint_changes(cache):
+    load = Loader()
+    df = cache.get_or_load("orders", "v1", load)
+    pd.testing.assert_frame_equal(cache.get_or_load("orders", "v1", load), df)
+    assert load.calls == 1
+    assert cache.get_or_load("orders", "v2", load)["value"].tolist() == [2.0] * 3
+    assert cache.get_or_load("orders", "v2", load, mmap=True)["value"].tolist() == [
+        2.0
+    ] * 3
+    assert load.calls == 2
+
+
+def test_frames_are_published_with_their_fingerprint(cache):
+    entry = cache.store("orders", "v1", Loader())
+    with open(os.path.join(entry, FINGERPRINT_FILE)) as fingerprint_file:
+        assert fingerprint_file.read() == "v1"
+    cache.store("orders", "v2", Loader())
+    with open(os.path.join(entry, FINGERPRINT_FILE)) as fingerprint_file:
+        assert fingerprint_file.read() == "v2"
+    # Neither the written nor the replaced frames are left behind
+    assert os.listdir(cache.directory) == [os.path.basename(entry)]
+
+
+def test_replacing_a_frame_keeps_the_open_memory_maps_valid(tmp_path):
+    directory = str(tmp_path / "frame")
+    column_store.write_frame(pd.DataFrame({"value": [1.0, 2.0]}), directory)
+    mapped = column_store.read_frame(directory, mmap=True)
+    column_store.write_frame(pd.DataFrame({"value": [3.0]}), directory)
+    assert mapped["value"].tolist() == [1.0, 2.0]
+    assert column_store.read_frame(directory)["value"].tolist() == [3.0]
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    for name in ("a", "b"):
+        cache.store(name, "v1", Loader(size=100))
+    entry_size = column_store.directory_size(cache.entry_path("a"))
+    cache.max_bytes = 2 * entry_size + entry_size // 2
+    past = time.time() - 60
+    os.utime(cache.entry_path("a"), (past, past))
+    os.utime(cache.entry_path("b"), (past - 1, past - 1))
+    # Reading a makes it the most recently used entry
+    cache.get_or_load("a", "v1", Loader(size=100))
+    cache.store("c", "v1", Loader(size=100))
+    assert os.path.exists(cache.entry_path("a"))
+    assert not os.path.exists(cache.entry_path("b"))
+    assert os.path.exists(cache.entry_path("c"))
+
+
+def test_frames_being_written_are_not_evicted(cache):
+    cache.store("a", "v1", Loader(size=100))
+    temporary_directory = f"{cache.entry_path('b')}.0123.tmp"
+    column_store.write_frame(Loader(size=100)(), temporary_directory)
+    cache.max_bytes = 0
+    cache.evict()
+    assert not os.path.exists(cache.entry_path("a"))
+    assert column_store.is_stored(temporary_directory)
+
+
+def test_only_dataframes_are_cached(cache):
+    with pytest.raises(TypeError):
+        cache.get_or_load("orders", "v1", lambda: [1, 2, 3])
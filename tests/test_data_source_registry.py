@@ -0,0 +1,60 @@
+import multiprocessing
+import os
+import pytest
+from sqlalchemy import text
+from data_checks.conf.data_source_registry import DataSourceRegistry
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = DataSourceRegistry()
+    registry.sources = {
+        "warehouse": f"sqlite:///{tmp_path / 'warehouse.db'}",
+        "events": {"url": f"sqlite:///{tmp_path / 'events.db'}", "pool_size": 2},
+    }
+    yield registry
+    registry.dispose()
+
+
+def query(registry: DataSourceRegistry) -> int:
+    with registry["warehouse"].connect() as connection:
+        return connection.execute(text("SELECT 1")).scalar()
+
+
+def child_pool_state(registry: DataSourceRegistry, results):
+    engine = registry["warehouse"]
+    results.put((engine.pool.checkedin(), registry.pid == os.getpid(), query(registry)))
+
+
+def test_engines_are_created_once_per_source(registry):
+    assert registry["warehouse"] is registry["warehouse"]
+    assert registry["events"].pool.size() == 2
+    assert "events" in registry
+    with pytest.raises(KeyError):
+        registry["unknown"]
+
+
+def test_forked_workers_do_not_reuse_the_parent_connections(registry):
+    assert query(registry) == 1
+    engine = registry["warehouse"]
+    assert engine.pool.checkedin() == 1
+
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    process = context.Process(target=child_pool_state, args=(registry, results))
+    process.start()
+    # The child starts with an empty pool and opens its own connection
+    assert results.get(timeout=30) == (0, True, 1)
+    process.join()
+
+    # The parent's connection was neither closed nor replaced by the child
+    assert registry["warehouse"] is engine
+    assert engine.pool.checkedin() == 1
+    assert query(registry) == 1
+
+
+def test_engines_are_reset_when_used_from_another_process(registry):
+    query(registry)
+    registry.pid = -1
+    assert registry["warehouse"].pool.checkedin() == 0
+    assert registry.pid == os.getpid()
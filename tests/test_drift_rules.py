@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+from data_checks.classes.data_check import DataCheck
+from data_checks.profiling.sketches import KLLSketch
+from data_checks.rules.drift_rules import (
+    assert_no_drift,
+    chi_square,
+    ks_distance,
+    population_stability_index,
+)
+
+random = np.random.default_rng(0)
+data = {}
+
+
+class AmountsCheck(DataCheck):
+    def rule_amounts_psi(self):
+        assert_no_drift(self, data["amount"], method="psi")
+
+    def rule_amounts_ks(self):
+        assert_no_drift(self, data["amount"], method="ks")
+
+    def rule_countries_chi2(self):
+        assert_no_drift(self, data["country"], method="chi2", window=3)
+
+
+def run(check) -> dict[str, str]:
+    return {result["rule"]: result["status"] for result in check.run_all()}
+
+
+def sample(mean: float, countries: list[str], size: int = 5_000):
+    data["amount"] = pd.Series(random.normal(mean, 1, size), name="amount")
+    data["country"] = pd.Series(random.choice(countries, size), name="country")
+
+
+def test_drift_against_previous_runs():
+    check = AmountsCheck()
+    for _ in range(3):
+        sample(0, ["FR", "US"])
+        assert set(run(check).values()) == {"success"}
+    sample(1, ["FR", "US", "DE"])
+    assert run(check) == {
+        "rule_amounts_psi": "failure",
+        "rule_amounts_ks": "failure",
+        "rule_countries_chi2": "failure",
+    }
+    # The drifted profile is part of the baseline of the next runs
+    sample(1, ["FR", "US", "DE"])
+    results = run(check)
+    assert results["rule_amounts_psi"] == "failure"
+    # Only the last 3 profiles are kept for chi2
+    for _ in range(2):
+        sample(1, ["FR", "US", "DE"])
+        run(check)
+    sample(1, ["FR", "US", "DE"])
+    assert run(check)["rule_countries_chi2"] == "success"
+
+
+def test_statistics():
+    same = KLLSketch().update(random.normal(0, 1, 10_000))
+    other = KLLSketch().update(random.normal(0, 1, 10_000))
+    shifted = KLLSketch().update(random.normal(0.5, 1, 10_000))
+    assert population_stability_index(same, other) < 0.05
+    assert population_stability_index(same, shifted) > 0.2
+    distance, p_value = ks_distance(same, other)
+    assert distance < 0.05 and p_value > 0.001
+    distance, p_value = ks_distance(same, shifted)
+    assert distance > 0.15 and p_value < 0.001
+    _, p_value = chi_square({"a": 500, "b": 500}, {"a": 510, "b": 490})
+    assert p_value > 0.1
+    _, p_value = chi_square({"a": 500, "b": 500}, {"a": 700, "b": 300})
+    assert p_value < 0.001
+
+
+def test_invalid_method():
+    check = AmountsCheck()
+    check._internal["current_rule"] = ("rule_amounts_psi", {"args": (), "kwargs": {}})
+    with pytest.raises(ValueError):
+        assert_no_drift(check, [1, 2, 3], method="wasserstein")
@@ -0,0 +1,115 @@
+import sys
+from types import SimpleNamespace
+import pytest
+from data_checks.base.actions.check import (
+    ExecutionDatabaseAction,
+    SkipRuleExecutionAction,
+)
+from data_checks.base.actions.check import execution_database_action
+from data_checks.classes.data_check import DataCheck
+
+
+class FakeRuleExecutionManager:
+    """
+    Records the executions instead of storing them, the models require PostgreSQL
+    """
+
+    executions: dict[int, dict] = {}
+
+    @classmethod
+    def create_execution(cls, rule, **fields):
+        execution_id = len(cls.executions) + 1
+        cls.executions[execution_id] = {
+            "rule": rule.name,
+            "statuses": [fields["status"]],
+            **fields,
+        }
+        return SimpleNamespace(id=execution_id)
+
+    @classmethod
+    def update_execution(cls, execution_id, **fields):
+        cls.executions[execution_id].update(fields)
+        cls.executions[execution_id]["statuses"].append(fields.get("status"))
+
+
+class FakeCheckManager:
+    @staticmethod
+    def latest(name):
+        return None
+
+
+class FakeRuleManager:
+    @staticmethod
+    def latest(suite_name, check_name, name, params):
+        return SimpleNamespace(name=name, config=None)
+
+
+@pytest.fixture(autouse=True)
+def managers(monkeypatch):
+    FakeRuleExecutionManager.executions = {}
+    monkeypatch.setattr(
+        execution_database_action, "RuleExecutionManager", FakeRuleExecutionManager
+    )
+    monkeypatch.setattr(execution_database_action, "RuleManager", FakeRuleManager)
+    monkeypatch.setattr(execution_database_action, "CheckManager", FakeCheckManager)
+
+
+def fail(value):
+    assert False, f"Value {value} is wrong"
+
+
+class LogsCheck(DataCheck):
+    def rule_logs(self):
+        print("Checking the logs")
+
+    def rule_fails(self, value=1):
+        fail(value)
+
+
+def run(check, *actions):
+    check.set_actions([ExecutionDatabaseAction, *actions])
+    results = {result["rule"]: result["status"] for result in check.run_all()}
+    assert sys.stdout is sys.__stdout__
+    return results
+
+
+def executions_by_rule() -> dict[str, dict]:
+    return {
+        execution["rule"]: execution
+        for execution in FakeRuleExecutionManager.executions.values()
+    }
+
+
+def test_executions_are_stored_as_running_then_updated():
+    assert run(LogsCheck()) == {
+        "rule_logs": "success",
+        "rule_fails": "failure",
+    }
+    executions = executions_by_rule()
+    assert executions["rule_logs"]["statuses"] == ["running", "success"]
+    assert executions["rule_fails"]["statuses"] == ["running", "failure"]
+    assert "Checking the logs" in executions["rule_logs"]["logs"]
+    assert executions["rule_logs"]["finished_at"] is not None
+    assert "fail(value)" in executions["rule_fails"]["traceback"]
+
+
+def test_duplicate_failures_do_not_store_their_traceback_again():
+    check = LogsCheck(
+        rules_params={"rule_fails": [{"value": 1}, {"value": 2}]},
+        excluded_rules=["rule_logs"],
+    )
+    run(check)
+    first, duplicate = FakeRuleExecutionManager.executions.values()
+    assert "fail(value)" in first["traceback"]
+    assert duplicate["traceback"].startswith("Identical to failure")
+    assert duplicate["statuses"] == ["running", "failure"]
+
+
+def test_stdout_is_restored_when_a_later_action_skips_the_rule():
+    assert run(LogsCheck(), SkipRuleExecutionAction) == {
+        "rule_logs": "skipped",
+        "rule_fails": "skipped",
+    }
+    assert [
+        execution["statuses"] for execution in executions_by_rule().values()
+    ] == [["running", "skipped"]] * 2
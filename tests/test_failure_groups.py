@@ -0,0 +1,127 @@
+import os
+from data_checks.base.actions.check import CheckAction
+from data_checks.base.exceptions import DataCheckException
+from data_checks.base.failure_groups import FailureGroups
+from data_checks.classes.data_check import DataCheck
+from data_checks.classes.data_suite import DataSuite
+from data_checks.classes.group_data_suite import GroupDataSuite
+from data_checks.utils import failure_utils
+
+ALERTS_FILE = os.path.join(os.path.dirname(__file__), ".alerts")
+
+
+def raise_failure(value):
+    assert value < 0, f"Value {value} of 'item-{value}' is not negative"
+
+
+def failure(value) -> DataCheckException:
+    try:
+        raise_failure(value)
+    except AssertionError as e:
+        return DataCheckException.from_assertion_exception(e)
+    raise RuntimeError("No failure")
+
+
+def test_message_template():
+    assert (
+        failure_utils.message_template("Value 3.5 of 'a' at 0xff1 is not 12")
+        == "Value <num> of <str> at <hex> is not <num>"
+    )
+
+
+def test_identical_failures_have_the_same_fingerprint():
+    assert failure_utils.fingerprint(failure(1)) == failure_utils.fingerprint(failure(2))
+    try:
+        assert False, "Value 1 of 'item-1' is not negative"
+    except AssertionError as e:
+        other_line = DataCheckException.from_assertion_exception(e)
+    assert failure_utils.fingerprint(failure(1)) != failure_utils.fingerprint(other_line)
+
+
+def test_failure_groups_count_and_sample_keys():
+    failure_groups = FailureGroups(sample_size=2)
+    fingerprint = failure_utils.fingerprint(failure(1))
+    assert failure_groups.add(fingerprint, "rule", "a", failure(1))
+    assert not failure_groups.add(fingerprint, "rule", "b", failure(2))
+    assert not failure_groups.add(fingerprint, "rule", "c", failure(3))
+    (group,) = failure_groups.values()
+    assert group["count"] == 3
+    assert group["sample_keys"] == ["a", "b"]
+    assert group["message"].startswith("Value <num> of <str> is not negative")
+    assert "raise_failure" in group["traceback"]
+
+
+class AlertOnceAction(CheckAction):
+    @staticmethod
+    def on_failure(check, context) -> None:
+        if not context.get_sys("duplicate_failure"):
+            with open(ALERTS_FILE, "a") as alerts:
+                alerts.write(f"{check.name}\n")
+
+
+class PositiveCheck(DataCheck):
+    def rule_negative(self):
+        raise_failure(self.element)
+
+
+class PositiveGroupSuite(GroupDataSuite):
+    @classmethod
+    def suite_config(cls):
+        return {"chunk_size": 1, "max_workers": 2}
+
+    @classmethod
+    def group_name(cls):
+        return "element"
+
+    @classmethod
+    def group(cls):
+        return [1, 2, 3, 4]
+
+    @classmethod
+    def group_checks(cls):
+        return [PositiveCheck]
+
+
+class OneCheck(DataCheck):
+    def rule_negative(self):
+        raise_failure(1)
+
+
+class TwoCheck(OneCheck):
+    pass
+
+
+class PositiveSuite(DataSuite):
+    @classmethod
+    def checks(cls):
+        return [OneCheck, TwoCheck]
+
+
+def run_with_alerts(suite, run):
+    if os.path.exists(ALERTS_FILE):
+        os.remove(ALERTS_FILE)
+    suite.set_check_actions({"default": [AlertOnceAction], "checks": {}})
+    try:
+        run()
+        with open(ALERTS_FILE) as alerts:
+            return alerts.read().splitlines()
+    finally:
+        os.remove(ALERTS_FILE)
+
+
+def test_group_suite_run_async_groups_failures_across_workers():
+    suite = PositiveGroupSuite()
+    alerts = run_with_alerts(suite, suite.run_async)
+    assert len(alerts) == 1
+    (group,) = suite._internal["failure_groups"].values()
+    assert group["count"] == 4
+    assert not suite._internal["failure_groups"].is_shared
+
+
+def test_suite_run_async_groups_failures_across_checks():
+    suite = PositiveSuite()
+    alerts = run_with_alerts(suite, suite.run_async)
+    assert len(alerts) == 1
+    (group,) = suite._internal["failure_groups"].values()
+    assert group["count"] == 2
+    assert sorted(group["sample_keys"]) == ["OneCheck", "TwoCheck"]
@@ -0,0 +1,105 @@
+import pytest
+from data_checks.base.fixture import Fixture, fixture, fixture_scopes
+from data_checks.classes.data_check import DataCheck
+from data_checks.classes.data_suite import DataSuite
+
+calls = []
+
+
+@fixture(scope="suite")
+def numbers():
+    calls.append("numbers")
+    yield [1, 2, 3]
+    calls.append("numbers teardown")
+
+
+@fixture
+def total():
+    calls.append("total")
+    return sum(numbers())
+
+
+class SumCheck(DataCheck):
+    total = total
+
+    def rule_total(self):
+        assert self.total == 6
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    calls.clear()
+    yield
+    for scope in ("check", "suite", "run"):
+        fixture_scopes.release(scope)
+
+
+def test_fixtures_are_lazy_and_shared_within_their_scope():
+    assert calls == []
+    assert total() == 6
+    assert total() == 6
+    assert calls == ["total", "numbers"]
+    assert fixture_scopes.is_loaded(numbers)
+
+
+def test_release_runs_teardowns_and_resets_the_scope():
+    numbers()
+    fixture_scopes.release("check")
+    assert calls == ["numbers"]
+    fixture_scopes.release("suite")
+    assert calls == ["numbers", "numbers teardown"]
+    assert not fixture_scopes.is_loaded(numbers)
+    numbers()
+    assert calls[-1] == "numbers"
+
+
+def test_discard_releases_a_single_fixture():
+    total()
+    fixture_scopes.discard(numbers)
+    assert calls == ["total", "numbers", "numbers teardown"]
+    assert fixture_scopes.is_loaded(total)
+
+
+def test_check_releases_its_scope_after_running():
+    results = SumCheck().run_all()
+    assert [result["status"] for result in results] == ["success"]
+    assert not fixture_scopes.is_loaded(total)
+    assert fixture_scopes.is_loaded(numbers)
+
+
+class FailingTeardownCheck(DataCheck):
+    total = total
+
+    def rule_total(self):
+        assert self.total == 6
+
+    def teardown(self):
+        raise RuntimeError("Cannot close the connection")
+
+
+class FailingTeardownSuite(DataSuite):
+    @classmethod
+    def checks(cls):
+        return [SumCheck()]
+
+    def teardown(self):
+        raise RuntimeError("Cannot close the connection")
+
+
+def test_check_releases_its_scope_when_it_raises():
+    with pytest.raises(RuntimeError):
+        FailingTeardownCheck().run_all()
+    assert not fixture_scopes.is_loaded(total)
+    assert fixture_scopes.is_loaded(numbers)
+
+
+def test_suite_releases_its_scope_when_it_raises():
+    with pytest.raises(RuntimeError):
+        FailingTeardownSuite().run()
+    assert not fixture_scopes.is_loaded(numbers)
+    assert calls[-1] == "numbers teardown"
+
+
+def test_invalid_scope():
+    with pytest.raises(ValueError):
+        Fixture(lambda: None, scope="session")
@@ -0,0 +1,224 @@
+import os
+import tempfile
+import pytest
+from data_checks.classes.data_check import DataCheck
+from data_checks.classes.group_data_suite import GroupDataSuite
+from data_checks.utils import generator_utils
+
+RUNS_FILE = os.path.join(tempfile.mkdtemp(), "runs")
+
+
+def runs() -> list[tuple[int, int]]:
+    """
+    (process id, element) of every check run, across the worker processes
+    """
+    with open(RUNS_FILE) as runs_file:
+        return [tuple(map(int, line.split())) for line in runs_file]
+
+
+class RecordCheck(DataCheck):
+    def rule_positive(self):
+        with open(RUNS_FILE, "a") as runs_file:
+            runs_file.write(f"{os.getpid()} {self.element}\n")
+        assert self.element > 0
+
+
+class SecondCheck(DataCheck):
+    def rule_even(self):
+        assert self.element % 2 == 0
+
+
+class ChunkedSuite(GroupDataSuite):
+    config = {"chunk_size": 3, "max_workers": 2}
+
+    @classmethod
+    def suite_config(cls):
+        return cls.config
+
+    @classmethod
+    def group_name(cls):
+        return "element"
+
+    @classmethod
+    def group(cls):
+        return list(range(-1, 9))
+
+    @classmethod
+    def group_checks(cls):
+        return [RecordCheck, SecondCheck]
+
+
+def setup_function():
+    open(RUNS_FILE, "w").close()
+
+
+def test_chunks():
+    assert generator_utils.chunks(range(7), 3) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert generator_utils.chunks([], 3) == []
+    with pytest.raises(ValueError):
+        generator_utils.chunks([1], 0)
+
+
+def test_run_async_dispatches_chunks_to_a_bounded_pool():
+    suite = ChunkedSuite()
+    suite.run_async()
+    assert sorted(element for _, element in runs()) == list(range(-1, 9))
+    processes = {process for process, _ in runs()}
+    assert os.getpid() not in processes
+    assert len(processes) <= 2
+    # Every chunk runs all its elements in the same worker
+    for chunk in generator_utils.chunks(range(-1, 9), 3):
+        assert len({process for process, element in runs() if element in chunk}) == 1
+    # Results are keyed by the index of the element in the group
+    assert sorted(suite.group_results) == list(range(10))
+    assert [len(results) for results in suite.group_results.values()] == [2] * 10
+    assert suite.result_matrix.failing_elements("RecordCheck.rule_positive") == [
+        "-1",
+        "0",
+    ]
+
+
+def test_run_and_run_async_give_the_same_results():
+    suite = ChunkedSuite()
+    suite.run()
+    assert {process for process, _ in runs()} == {os.getpid()}
+    matrix = suite.result_matrix
+    suite.run_async()
+    assert suite.result_matrix.keys == matrix.keys
+    assert suite.result_matrix.rules == matrix.rules
+    assert (suite.result_matrix.status == matrix.status).all()
+
+
+class ProductCheck(DataCheck):
+    def rule_in_stock(self):
+        assert self.product["stock"] > 0, f"Product {self.product['id']} is out of stock"
+
+
+class ProductSuite(GroupDataSuite):
+    products = [
+        {"id": 1, "name": "pen", "stock": 0},
+        {"id": 2, "name": "ink", "stock": 3},
+        {"id": 3, "name": "pad", "stock": 0},
+    ]
+
+    @classmethod
+    def suite_config(cls):
+        return {"chunk_size": 1, "max_workers": 2}
+
+    @classmethod
+    def group_name(cls):
+        return "product"
+
+    @classmethod
+    def group(cls):
+        return cls.products
+
+    @classmethod
+    def group_key(cls, element):
+        return str(element["id"])
+
+    @classmethod
+    def group_checks(cls):
+        return [ProductCheck]
+
+
+def test_group_key_names_the_checks_of_the_elements():
+    check_names = [check.name for check in ProductSuite.checks()]
+    assert check_names == [f"ProductCheck::product-{id}" for id in (1, 2, 3)]
+    # The default key is the JSON dump of the element
+    assert GroupDataSuite.group_key({"id": 1}) == '{"id": 1}'
+
+
+def test_group_key_is_stable_when_the_element_changes():
+    (check,) = ProductSuite.checks()[:1]
+    check._internal["current_rule"] = ("rule_in_stock", {"args": (), "kwargs": {}})
+    rule_hash = check.current_rule_hash()
+    changed = ProductSuite._check_for_element(
+        ProductCheck, {"id": 1, "name": "pen", "stock": 10}
+    )
+    changed._internal["current_rule"] = check._internal["current_rule"]
+    assert changed.current_rule_hash() == rule_hash
+
+
+def test_group_keys_identify_failures_across_workers():
+    # Each product runs in its own chunk, the identical failures are grouped across
+    # the workers
+    suite = ProductSuite()
+    suite.run_async()
+    assert suite.result_matrix.keys == ["1", "2", "3"]
+    assert suite.result_matrix.failing_elements("ProductCheck.rule_in_stock") == [
+        "1",
+        "3",
+    ]
+    (group,) = suite._internal["failure_groups"].values()
+    assert group["count"] == 2
+    assert sorted(group["sample_keys"]) == [
+        "ProductCheck::product-1",
+        "ProductCheck::product-3",
+    ]
+
+
+class PriceCheck(DataCheck):
+    def rule_positive_price(self):
+        with open(RUNS_FILE, "a") as runs_file:
+            runs_file.write(f"{os.getpid()} {self.item['id']}\n")
+        assert self.item["price"] > 0, f"Price {self.item['price']} is not positive"
+
+
+class DeduplicatedSuite(GroupDataSuite):
+    @classmethod
+    def suite_config(cls):
+        return {"deduplicate": True, "chunk_size": 1, "max_workers": 2}
+
+    @classmethod
+    def group_name(cls):
+        return "item"
+
+    @classmethod
+    def group(cls):
+        return [
+            {"id": 1, "price": -1},
+            {"id": 2, "price": 5},
+            # Same items as the first one, whatever the order of their keys
+            {"price": -1, "id": 1},
+            {"id": 1, "price": -1},
+        ]
+
+    @classmethod
+    def group_checks(cls):
+        return [PriceCheck]
+
+
+def test_element_hash_ignores_the_order_of_the_keys():
+    assert GroupDataSuite.element_hash({"a": 1, "b": 2}) == GroupDataSuite.element_hash(
+        {"b": 2, "a": 1}
+    )
+    assert GroupDataSuite.element_hash({"a": 1}) != GroupDataSuite.element_hash({"a": 2})
+    circular = []
+    circular.append(circular)
+    assert GroupDataSuite.element_hash(circular) is None
+
+
+@pytest.mark.parametrize("run", ["run", "run_async"])
+def test_duplicates_are_run_once_and_share_the_results(run):
+    suite = DeduplicatedSuite()
+    getattr(suite, run)()
+    assert sorted(element for _, element in runs()) == [1, 2]
+    assert suite.group_results[2] == suite.group_results[0]
+    assert suite.group_results[3] == suite.group_results[0]
+    first_key, _, reordered_key, duplicate_key = suite.result_matrix.keys
+    assert suite.result_matrix.failing_elements("PriceCheck.rule_positive_price") == [
+        first_key,
+        reordered_key,
+        duplicate_key,
+    ]
+    # The key of the duplicate is the key of the first element
+    assert suite.result_matrix.failing_rules(first_key) == [
+        "PriceCheck.rule_positive_price"
+    ]
+    # The duplicates are counted in the failure group of the first element
+    (group,) = suite._internal["failure_groups"].values()
+    assert group["count"] == 3
+    assert group["sample_keys"] == [
+        f"PriceCheck::item-{key}" for key in (first_key, reordered_key, duplicate_key)
+    ]
@@ -0,0 +1,150 @@
+import os
+import time
+import pandas as pd
+import pytest
+from data_checks.cache import model_cache
+from data_checks.cache.model_cache import (
+    METADATA_FILE,
+    MODEL_FILE,
+    ModelCache,
+    frame_fingerprint,
+    rule_model,
+)
+from data_checks.classes.data_check import DataCheck
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ModelCache(str(tmp_path), max_bytes=10**6, refit_seconds=0)
+
+
+class Fit:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {"model": self.calls}
+
+
+def test_model_is_reused_for_the_same_training_data(cache):
+    fit = Fit()
+    assert cache.get_or_fit("rule", "data-1", fit) == {"model": 1}
+    assert cache.get_or_fit("rule", "data-1", fit) == {"model": 1}
+    assert cache.get_or_fit("rule", "data-2", fit) == {"model": 2}
+    assert cache.get_or_fit("other_rule", "data-2", fit) == {"model": 3}
+    assert fit.calls == 3
+
+
+def test_refit_interval(cache):
+    fit = Fit()
+    cache.get_or_fit("rule", "data-1", fit)
+    # Recent enough, the model is kept even though the data changed
+    assert cache.get_or_fit("rule", "data-2", fit, refit_seconds=3600) == {"model": 1}
+    assert cache.get_or_fit("rule", "data-2", fit, refit_seconds=0) == {"model": 2}
+
+
+def test_models_are_kept_for_a_day_by_default(tmp_path):
+    cache = ModelCache(str(tmp_path))
+    assert cache.refit_seconds == 24 * 3600
+    fit = Fit()
+    cache.get_or_fit("rule", "data-1", fit)
+    # Growing data changes at every run
+    assert cache.get_or_fit("rule", "data-2", fit) == {"model": 1}
+    assert cache.get_or_fit("rule", "data-3", fit, refit_seconds=0) == {"model": 2}
+
+
+def test_metadata_is_written_last(cache, monkeypatch):
+    replaced = []
+    replace = os.replace
+    monkeypatch.setattr(
+        model_cache.os,
+        "replace",
+        lambda source, destination: replaced.append(os.path.basename(destination))
+        or replace(source, destination),
+    )
+    cache.get_or_fit("rule", "data-1", Fit())
+    assert replaced == [MODEL_FILE, METADATA_FILE]
+    # Only the published files are left in the entry
+    assert sorted(os.listdir(cache.entry_path("rule"))) == [METADATA_FILE, MODEL_FILE]
+
+
+def test_model_is_only_loaded_with_its_metadata(cache):
+    fit = Fit()
+    cache.get_or_fit("rule", "data-1", fit)
+    entry = cache.entry_path("rule")
+    with open(os.path.join(entry, METADATA_FILE)) as metadata_file:
+        metadata = metadata_file.read()
+    cache.get_or_fit("rule", "data-2", fit)
+    # The new model is in place but a concurrent writer put back the old metadata
+    with open(os.path.join(entry, METADATA_FILE), "w") as metadata_file:
+        metadata_file.write(metadata)
+    assert cache.get_or_fit("rule", "data-1", fit) == {"model": 3}
+
+
+def test_code_change_forces_a_refit(cache):
+    fit = Fit()
+    cache.get_or_fit("rule", "data-1", fit, code_hash="v1", refit_seconds=3600)
+    model = cache.get_or_fit("rule", "data-1", fit, code_hash="v2", refit_seconds=3600)
+    assert model == {"model": 2}
+
+
+def test_unreadable_model_is_refit(cache):
+    fit = Fit()
+    cache.get_or_fit("rule", "data-1", fit)
+    with open(os.path.join(cache.entry_path("rule"), MODEL_FILE), "wb") as model_file:
+        model_file.write(b"not a pickle")
+    assert cache.get_or_fit("rule", "data-1", fit) == {"model": 2}
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    fit = Fit()
+    for name in ("a", "b"):
+        cache.get_or_fit(name, "data", fit)
+    entry_size = cache._entry_size(cache.entry_path("a"))
+    # Room for two entries, whose metadata sizes vary by a few bytes
+    cache.max_bytes = 2 * entry_size + entry_size // 2
+    past = time.time() - 60
+    os.utime(cache.entry_path("a"), (past, past))
+    os.utime(cache.entry_path("b"), (past - 1, past - 1))
+    # Loading a makes it the most recently used entry
+    cache.get_or_fit("a", "data", fit)
+    cache.get_or_fit("c", "data", fit)
+    assert os.path.exists(cache.entry_path("a"))
+    assert not os.path.exists(cache.entry_path("b"))
+    assert os.path.exists(cache.entry_path("c"))
+    assert fit.calls == 3
+
+
+def test_frame_fingerprint():
+    frame = pd.DataFrame({"value": [1, 2, 3]})
+    assert frame_fingerprint(frame) == frame_fingerprint(frame.copy())
+    assert frame_fingerprint(frame) != frame_fingerprint(frame.rename(columns={"value": "v"}))
+    assert frame_fingerprint(frame) != frame_fingerprint(frame.assign(value=[1, 2, 4]))
+
+
+fits = Fit()
+training_data = {}
+
+
+class ModelCheck(DataCheck):
+    def rule_with_model(self):
+        model = rule_model(
+            self, fits, training_data=training_data["value"], cache=self.cache
+        )
+        assert model == {"model": fits.calls}
+
+
+def test_rule_model(cache):
+    check = ModelCheck()
+    check.cache = cache
+    training_data["value"] = pd.Series([1.0, 2.0])
+    for _ in range(2):
+        (result,) = check.run_all()
+        assert result["status"] == "success"
+    assert fits.calls == 1
+    training_data["value"] = pd.Series([1.0, 3.0])
+    check.run_all()
+    assert fits.calls == 2
+    with pytest.raises(ValueError):
+        rule_model(check, fits, cache=cache)
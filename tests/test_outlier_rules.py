@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+from data_checks.rules.outlier_rules import (
+    assert_no_outliers,
+    iqr,
+    mad,
+    pct_change,
+    rolling_zscore,
+    zscore,
+)
+
+values = pd.Series(
+    [10.0, 11.0, 9.0, 10.0, 12.0, 8.0, 10.0, 11.0, 9.0, 10.0, 100.0, None],
+    index=list("abcdefghijkl"),
+)
+
+
+@pytest.mark.parametrize("method", [zscore, mad, iqr])
+def test_global_methods_find_the_outlier(method):
+    result = method(values)
+    assert result["indices"] == ["k"]
+    assert result["failures"] == 1
+    assert result["total"] == len(values)
+    assert result["mask"].tolist() == [False] * 10 + [True, False]
+
+
+def test_thresholds():
+    assert mad(values, threshold=1.0)["failures"] > 1
+    assert iqr(values, k=100)["failures"] == 0
+    assert zscore([1.0, 1.0, 1.0])["failures"] == 0
+
+
+def test_arrays_are_indexed_by_position():
+    assert mad(values.to_numpy())["indices"] == [10]
+
+
+def test_groups_are_evaluated_separately():
+    # 100 is normal for the second product, 10 is not
+    prices = pd.Series([10.0, 11.0, 9.0, 10.0, 100.0, 101.0, 99.0, 10.0, 100.0, 11.0])
+    products = ["a", "a", "a", "a", "b", "b", "b", "b", "b", "a"]
+    assert mad(prices, by=products)["indices"] == [7]
+    assert iqr(prices, by=pd.Series(products))["indices"] == [7]
+
+
+def test_rolling_methods_compare_with_the_preceding_values():
+    series = pd.Series([10.0, 11.0, 10.0, 11.0, 10.0, 30.0, 30.0, 31.0, 30.0, 31.0, 30.0])
+    result = rolling_zscore(series, window=4)
+    assert result["indices"] == [5]
+    # The window has moved to the new level
+    assert not result["mask"][9:].any()
+    assert pct_change(series, window=3)["indices"] == [5, 6]
+    # Not enough preceding values to score the shift
+    assert rolling_zscore(series, window=10)["failures"] == 0
+
+
+def test_rolling_methods_by_group():
+    series = pd.Series([1.0, 100.0, 1.1, 101.0, 0.9, 99.0, 1.0, 100.0, 5.0, 100.0])
+    keys = np.tile(["low", "high"], 5)
+    assert pct_change(series, window=2, by=keys)["indices"] == [8]
+
+
+def test_assert_no_outliers():
+    assert_no_outliers(zscore(values.iloc[:10]))
+    with pytest.raises(AssertionError) as error:
+        assert_no_outliers(mad(values), message="Price outliers")
+    assert str(error.value).startswith(
+        "Price outliers: 1 outliers out of 12 values. First outliers (score): 'k' ("
+    )
+
+
+@pytest.mark.parametrize("method", [mad, iqr])
+def test_zero_spread_does_not_flag_every_deviation(method):
+    # More than half of the values are equal, the median absolute deviation and the
+    # interquartile range are 0
+    tight = pd.Series([10.0] * 6 + [11.0, 9.0, 12.0, 8.0])
+    assert method(tight)["failures"] == 0
+    spike = pd.Series([10.0] * 6 + [11.0, 9.0, 100.0])
+    result = method(spike)
+    assert result["indices"] == [8]
+    assert np.isfinite(result["scores"]).all()
+    # Constant groups have no outliers
+    constant = pd.Series([5.0] * 4 + [1.0, 2.0, 3.0, 50.0])
+    groups = ["a"] * 4 + ["b"] * 4
+    assert method(constant, by=groups)["mask"][:4].tolist() == [False] * 4
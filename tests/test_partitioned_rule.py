@@ -0,0 +1,100 @@
+import multiprocessing
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from data_checks.rules import partitioned_rule
+from data_checks.rules.partitioned_rule import merge_results, partition_apply
+
+users = pd.DataFrame(
+    {
+        "country": np.resize(["fr", "de", "it", "es"], 400),
+        "age": np.arange(400) % 90,
+    }
+)
+
+
+def test_partitions_are_evaluated_by_forked_workers():
+    # The lambda cannot be pickled, it is inherited by the workers
+    processes = partition_apply(
+        users,
+        lambda part: (os.getpid(), len(part)),
+        max_workers=2,
+        min_partition_size=100,
+    )
+    assert len(processes) == 2
+    assert os.getpid() not in {process for process, _ in processes}
+    assert sum(rows for _, rows in processes) == len(users)
+    assert partitioned_rule._partitioned is None
+
+
+def test_workers_are_forked_whatever_the_default_start_method():
+    start_method = multiprocessing.get_start_method()
+    multiprocessing.set_start_method("spawn", force=True)
+    try:
+        processes = partition_apply(
+            users, lambda part: os.getpid(), max_workers=2, min_partition_size=100
+        )
+    finally:
+        multiprocessing.set_start_method(start_method, force=True)
+    assert len(processes) == 2
+    assert os.getpid() not in processes
+
+
+def test_partitions_by_key_keep_the_groups_together():
+    countries = partition_apply(
+        users,
+        lambda part: part["country"].unique().tolist(),
+        by="country",
+        max_workers=2,
+        min_partition_size=100,
+    )
+    assert sorted(country for part in countries for country in part) == [
+        "de",
+        "es",
+        "fr",
+        "it",
+    ]
+
+
+def test_parallel_and_serial_results_are_the_same(monkeypatch):
+    minors = partition_apply(
+        users,
+        lambda part: part[part["age"] < 18],
+        max_workers=2,
+        min_partition_size=100,
+    )
+    monkeypatch.setattr(partitioned_rule, "_get_fork_context", lambda: None)
+    processes = partition_apply(
+        users, lambda part: os.getpid(), max_workers=2, min_partition_size=100
+    )
+    # Without fork the partitions are evaluated in the calling process
+    assert processes == [os.getpid()] * 2
+    serial_minors = partition_apply(
+        users,
+        lambda part: part[part["age"] < 18],
+        max_workers=2,
+        min_partition_size=100,
+    )
+    pd.testing.assert_frame_equal(minors, serial_minors)
+    pd.testing.assert_frame_equal(minors, users[users["age"] < 18])
+
+
+def test_small_data_is_not_partitioned():
+    assert partition_apply(users, lambda part: os.getpid(), max_workers=2) == [
+        os.getpid()
+    ]
+
+
+def test_worker_errors_are_raised():
+    def fail(part):
+        raise ValueError("Invalid partition")
+
+    with pytest.raises(ValueError):
+        partition_apply(users, fail, max_workers=2, min_partition_size=100)
+    assert partitioned_rule._partitioned is None
+
+
+def test_merge_results():
+    assert merge_results([np.array([1]), np.array([2, 3])]).tolist() == [1, 2, 3]
+    assert merge_results([1, 2]) == [1, 2]
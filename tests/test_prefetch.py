@@ -0,0 +1,119 @@
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+import pytest
+from apscheduler.triggers.cron import CronTrigger
+from data_checks.base.fixture import fixture, fixture_scopes
+from data_checks.classes.data_check import DataCheck
+from data_checks.classes.data_suite import DataSuite
+from data_checks.utils.main_utils import (
+    prefetch_suite,
+    schedule_prefetch,
+    start_suite_deployment,
+)
+
+LOADS_FILE = os.path.join(tempfile.mkdtemp(), "loads")
+
+
+def loads() -> list[str]:
+    with open(LOADS_FILE) as loads_file:
+        return loads_file.read().split()
+
+
+@fixture(scope="run")
+def orders():
+    with open(LOADS_FILE, "a") as loads_file:
+        loads_file.write(f"{os.getpid()}\n")
+    return [1, 2, 3]
+
+
+def failing_prefetch():
+    raise ConnectionError("The warehouse is down")
+
+
+class OrdersCheck(DataCheck):
+    orders = orders
+
+    def rule_orders(self):
+        assert self.orders == [1, 2, 3]
+        with open(LOADS_FILE, "a") as loads_file:
+            loads_file.write("checked\n")
+
+
+class PrefetchedSuite(DataSuite):
+    @classmethod
+    def checks(cls):
+        return [OrdersCheck]
+
+    @classmethod
+    def prefetch(cls):
+        return [failing_prefetch, orders]
+
+
+class FakeScheduler:
+    def __init__(self):
+        self.jobs = {}
+
+    def add_job(self, function, trigger, id, replace_existing, args):
+        self.jobs[id] = (function, trigger.run_date, args)
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    open(LOADS_FILE, "w").close()
+    yield
+    fixture_scopes.release("run")
+
+
+# Every day at 3:00 UTC
+trigger = CronTrigger.from_crontab("0 3 * * *", timezone="UTC")
+
+
+def test_prefetch_is_scheduled_ahead_of_the_next_run():
+    scheduler = FakeScheduler()
+    suite = PrefetchedSuite()
+    after = datetime.now(timezone.utc) + timedelta(days=2)
+    schedule_prefetch(scheduler, suite, trigger, 600, after=after)
+    function, run_date, args = scheduler.jobs["PrefetchedSuite:prefetch"]
+    fire_time = trigger.get_next_fire_time(None, after + timedelta(seconds=1))
+    assert function is prefetch_suite
+    assert run_date == fire_time - timedelta(seconds=600)
+    assert args == (scheduler, suite, trigger, 600, fire_time)
+
+
+def test_late_prefetch_starts_immediately():
+    scheduler = FakeScheduler()
+    before = datetime.now(timezone.utc)
+    # The next run is always less than a day away
+    schedule_prefetch(scheduler, PrefetchedSuite(), trigger, 24 * 3600)
+    _, run_date, (*_, fire_time) = scheduler.jobs["PrefetchedSuite:prefetch"]
+    assert before <= run_date <= datetime.now(timezone.utc)
+    assert fire_time - run_date < timedelta(days=1)
+
+
+def test_prefetch_loads_the_data_and_schedules_the_next_prefetch():
+    scheduler = FakeScheduler()
+    suite = PrefetchedSuite()
+    fire_time = trigger.get_next_fire_time(None, datetime.now(timezone.utc))
+    orders()
+    # Fixtures are reloaded and failures do not stop the prefetch
+    prefetch_suite(scheduler, suite, trigger, 600, fire_time)
+    assert loads() == [str(os.getpid())] * 2
+    assert fixture_scopes.is_loaded(orders)
+    *_, next_fire_time = scheduler.jobs["PrefetchedSuite:prefetch"][2]
+    assert next_fire_time == fire_time + timedelta(days=1)
+
+
+def test_deployed_run_inherits_the_prefetched_data():
+    prefetch_suite(
+        FakeScheduler(),
+        PrefetchedSuite(),
+        trigger,
+        600,
+        trigger.get_next_fire_time(None, datetime.now(timezone.utc)),
+    )
+    start_suite_deployment(PrefetchedSuite())
+    # Loaded once by the prefetch, not by the forked run
+    assert loads() == [str(os.getpid()), "checked"]
+    # The data is freed until the next prefetch
+    assert not fixture_scopes.is_loaded(orders)
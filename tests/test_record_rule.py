@@ -0,0 +1,131 @@
+import os
+import tempfile
+from data_checks.base.actions.check import CheckAction
+from data_checks.base.exceptions import SkipExecutionException
+from data_checks.classes.data_check import DataCheck
+from data_checks.rules.record_rule import record_rule
+
+CALLS_FILE = os.path.join(tempfile.mkdtemp(), "calls")
+
+
+def log_call(call: str):
+    # Appended to a file to count the calls of the forked rule processes as well
+    with open(CALLS_FILE, "a") as calls:
+        calls.write(call + "\n")
+
+
+def calls() -> list[str]:
+    with open(CALLS_FILE) as calls:
+        return sorted(calls.read().split())
+
+
+def messages(check):
+    log_call("source")
+    return ["hello", "spam", "hi"]
+
+
+class MessagesCheck(DataCheck):
+    @record_rule(messages, message="Message: `{}` may contain spam")
+    def rule_no_spam(self, message):
+        log_call("no_spam")
+        return message != "spam"
+
+    @record_rule(messages)
+    def rule_short(self, message):
+        log_call("short")
+        return len(message) <= 5
+
+    @record_rule(messages)
+    def rule_max_length(self, message, max_length=5):
+        log_call("max_length")
+        return len(message) <= max_length
+
+
+class SkipShortAction(CheckAction):
+    @staticmethod
+    def before(check, context):
+        if context.get_sys("rule") == "rule_short":
+            raise SkipExecutionException("Skipping rule_short")
+
+    @staticmethod
+    def skips(check, context) -> bool:
+        return context.get_sys("rule") == "rule_short"
+
+
+def setup_function():
+    open(CALLS_FILE, "w").close()
+
+
+def test_rules_are_evaluated_in_one_pass():
+    results = {result["rule"]: result for result in MessagesCheck().run_all()}
+    assert {rule: result["status"] for rule, result in results.items()} == {
+        "rule_no_spam": "failure",
+        "rule_short": "success",
+        "rule_max_length": "success",
+    }
+    assert "Message: `spam` may contain spam" in results["rule_no_spam"]["exception"]
+    assert calls() == sorted(["source"] + ["no_spam", "short", "max_length"] * 3)
+
+
+def test_asynchronous_run_evaluates_each_rule_once():
+    MessagesCheck().run_all_async()
+    assert calls() == sorted(["source"] + ["no_spam", "short", "max_length"] * 3)
+
+
+def test_rules_with_params_are_evaluated_on_their_own():
+    results = MessagesCheck(
+        rules_params={"rule_max_length": [{"max_length": 4}, {"max_length": 5}]}
+    ).run_all()
+    assert sorted(result["status"] for result in results) == [
+        "failure",
+        "failure",
+        "success",
+        "success",
+    ]
+    assert calls() == sorted(
+        ["source"] * 3 + ["no_spam", "short"] * 3 + ["max_length"] * 6
+    )
+
+
+def test_skipped_rules_are_not_evaluated():
+    check = MessagesCheck()
+    check.set_actions([SkipShortAction])
+    results = {result["rule"]: result["status"] for result in check.run_all()}
+    assert results["rule_short"] == "skipped"
+    assert calls() == sorted(["source"] + ["no_spam", "max_length"] * 3)
+
+
+def test_skipped_rules_are_not_evaluated_asynchronously():
+    check = MessagesCheck()
+    check.set_actions([SkipShortAction])
+    check.run_all_async()
+    assert calls() == sorted(["source"] + ["no_spam", "max_length"] * 3)
+
+
+# Equal attribute names built separately are distinct string objects
+GREETINGS = "greetings"
+JOINED_GREETINGS = "".join(["greet", "ings"])
+
+
+class GreetingsCheck(DataCheck):
+    @property
+    def greetings(self):
+        log_call("source")
+        return ["hello", "spam"]
+
+    @record_rule(GREETINGS)
+    def rule_no_spam(self, greeting):
+        log_call("no_spam")
+        return greeting != "spam"
+
+    @record_rule(JOINED_GREETINGS)
+    def rule_short(self, greeting):
+        log_call("short")
+        return len(greeting) <= 5
+
+
+def test_rules_on_the_same_attribute_share_the_pass():
+    assert GREETINGS is not JOINED_GREETINGS
+    results = {result["rule"]: result["status"] for result in GreetingsCheck().run_all()}
+    assert results == {"rule_no_spam": "failure", "rule_short": "success"}
+    assert calls() == sorted(["source"] + ["no_spam", "short"] * 2)
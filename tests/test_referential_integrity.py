@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+from data_checks.base.fixture import fixture_scopes
+from data_checks.profiling.sketches import BloomFilter, CountMinSketch, HyperLogLog
+from data_checks.rules.referential_integrity import (
+    build_key_index,
+    key_index,
+    references,
+)
+
+
+@pytest.mark.parametrize("kind", ["hash", "bloom"])
+def test_references_finds_orphans(kind):
+    index = build_key_index(pd.Series(range(1_000)), kind=kind)
+    result = references(pd.Series([1, 5, None, 2_000, 999]), index)
+    assert result["failures"] == 1
+    assert result["sample"] == [(3, 2_000)]
+
+
+@pytest.mark.parametrize("kind", ["hash", "bloom"])
+def test_integral_floats_match_integer_keys_in_mixed_batches(kind):
+    index = build_key_index([1, 2, 3], kind=kind)
+    result = references(pd.Series([1.0, 2.0, 3.5]), index)
+    assert result["failures"] == 1
+    assert result["sample"] == [(2, 3.5)]
+    # Integer parent keys read as floats because of a null
+    index = build_key_index(pd.Series([1, 2, None, 3.5]), kind=kind)
+    assert references(pd.Series([1, 2]), index)["failures"] == 0
+
+
+def test_orphans_are_verified():
+    index = build_key_index(["a", "b"])
+    values = pd.Series(["a", "c", "d", "c"])
+    assert references(values, index)["failures"] == 3
+    assert references(values, index, verify=["c"])["failures"] == 1
+    result = references(values, index, verify=lambda keys: keys == "d")
+    assert result["sample"] == [(1, "c"), (3, "c")]
+
+
+def test_key_index_is_built_once_per_run():
+    builds = []
+
+    def keys():
+        builds.append(1)
+        return [1, 2, 3]
+
+    index = key_index(keys)
+    assert index() is index()
+    fixture_scopes.release("run")
+    index()
+    fixture_scopes.release("run")
+    assert len(builds) == 2
+
+
+def test_bloom_filter_contains_integral_floats_of_mixed_batches():
+    bloom = BloomFilter(100).update([1.0, 2.5])
+    assert bloom.might_contain([1.0]).all()
+    assert bloom.might_contain([1, 2.5, None]).tolist() == [True, True, False]
+
+
+def test_count_min_does_not_undercount_mixed_batches():
+    sketch = CountMinSketch().update([1.0, 1.5]).update([1.0, 2.0])
+    assert sketch.estimate([1, 1.5, 2]).tolist() == [2, 1, 1]
+
+
+def test_hyperloglog_does_not_overcount_mixed_batches():
+    sketch = HyperLogLog()
+    for _ in range(3):
+        sketch.update(np.array([1.0, 2.0, 3.5]))
+        sketch.update(np.array([1.0, 2.0]))
+        sketch.update([1, 2])
+    assert round(sketch.estimate()) == 3
@@ -0,0 +1,124 @@
+import numpy as np
+from data_checks.base.result_matrix import (
+    FAILURE,
+    NOT_RUN,
+    SUCCESS,
+    ResultMatrix,
+)
+from data_checks.classes.data_check import DataCheck
+from data_checks.classes.group_data_suite import GroupDataSuite
+
+
+def check_result(check_type, status, rules):
+    return {
+        "check": check_type,
+        "check_type": check_type,
+        "status": status,
+        "duration": 0.0,
+        "rules": [
+            {
+                "rule": rule,
+                "status": rule_status,
+                "duration": 1.0,
+                "exception": None,
+                "exception_type": None,
+                "fingerprint": None,
+            }
+            for rule, rule_status in rules
+        ],
+    }
+
+
+def test_worst_status_wins_and_durations_add_up():
+    matrix = ResultMatrix.from_group_results(
+        ["a", "b"],
+        {
+            0: [check_result("C", "failure", [("rule_x", "success"), ("rule_x", "failure")])],
+            1: [check_result("C", "success", [("rule_x", "success")])],
+        },
+    )
+    assert matrix.rules == ["C.rule_x"]
+    assert matrix.status[:, 0].tolist() == [FAILURE, SUCCESS]
+    assert matrix.durations[:, 0].tolist() == [2.0, 1.0]
+    assert matrix.failure_counts() == {"C.rule_x": 1}
+    assert matrix.failing_elements("C.rule_x") == ["a"]
+    assert matrix.failing_rules("a") == ["C.rule_x"]
+
+
+def test_check_failing_without_rule_results_fails_its_rules():
+    matrix = ResultMatrix.from_group_results(
+        ["a", "b", "c"],
+        {
+            0: [
+                check_result("C", "failure", []),
+                check_result("D", "success", [("rule_z", "success")]),
+            ],
+            1: [check_result("C", "success", [("rule_x", "success"), ("rule_y", "success")])],
+            2: [check_result("E", "failure", [])],
+        },
+    )
+    assert matrix.rules == ["C.rule_x", "C.rule_y", "D.rule_z", "E.*"]
+    assert matrix.failing_rules("a") == ["C.rule_x", "C.rule_y"]
+    assert matrix.failing_rules("c") == ["E.*"]
+    assert matrix.status[2, :3].tolist() == [NOT_RUN] * 3
+    assert matrix.failure_counts() == {
+        "C.rule_x": 1,
+        "C.rule_y": 1,
+        "D.rule_z": 0,
+        "E.*": 1,
+    }
+
+
+def test_failing_rules_of_elements_sharing_a_key():
+    matrix = ResultMatrix.from_group_results(
+        ["a", "a", "b"],
+        {
+            0: [check_result("C", "failure", [("rule_x", "failure"), ("rule_y", "success")])],
+            1: [check_result("C", "failure", [("rule_x", "success"), ("rule_y", "failure")])],
+            2: [check_result("C", "success", [("rule_x", "success"), ("rule_y", "success")])],
+        },
+    )
+    assert matrix.failing_rules("a") == ["C.rule_x", "C.rule_y"]
+    assert matrix.failing_rules("b") == []
+
+
+def test_save_and_load(tmp_path):
+    matrix = ResultMatrix.from_group_results(
+        ["a"], {0: [check_result("C", "failure", [("rule_x", "failure")])]}
+    )
+    loaded = ResultMatrix.load(matrix.save(str(tmp_path / "matrix.npz")))
+    assert loaded.keys == ["a"]
+    assert loaded.rules == ["C.rule_x"]
+    assert np.array_equal(loaded.status, matrix.status)
+
+
+class ElementCheck(DataCheck):
+    def setup(self):
+        super().setup()
+        if self.element == 2:
+            raise ValueError("Cannot load the element")
+
+    def rule_positive(self):
+        assert self.element > 0
+
+
+class ElementSuite(GroupDataSuite):
+    @classmethod
+    def group_name(cls):
+        return "element"
+
+    @classmethod
+    def group(cls):
+        return [1, 2, -1]
+
+    @classmethod
+    def group_checks(cls):
+        return [ElementCheck]
+
+
+def test_group_suite_records_check_level_failures():
+    suite = ElementSuite()
+    suite.run()
+    matrix = suite.result_matrix
+    assert matrix.keys == ["1", "2", "-1"]
+    assert matrix.failing_elements("ElementCheck.rule_positive") == ["2", "-1"]
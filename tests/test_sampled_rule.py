@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+from data_checks.classes.data_check import DataCheck
+from data_checks.rules.sampled_rule import (
+    sample_chunks,
+    sample_frame,
+    sampled_rule,
+    wilson_interval,
+)
+from data_checks.sources.chunked_source import ChunkedSource
+
+events = pd.DataFrame(
+    {
+        "amount": np.arange(1, 100_001),
+        "country": np.where(np.arange(100_000) % 10 == 0, "fr", "us"),
+    }
+)
+
+
+def test_wilson_interval():
+    lower, upper = wilson_interval(0, 100, 0.95)
+    assert lower == 0.0
+    assert upper == pytest.approx(0.037, abs=1e-3)
+    lower, upper = wilson_interval(50, 100, 0.95)
+    assert lower == pytest.approx(0.404, abs=1e-3)
+    assert upper == pytest.approx(0.596, abs=1e-3)
+    assert wilson_interval(0, 0, 0.95) == (0.0, 1.0)
+
+
+def test_stratified_samples_are_proportional():
+    sample = sample_frame(events, 1_000, strata="country", seed=0)
+    assert sample["country"].value_counts().to_dict() == {"us": 900, "fr": 100}
+    sample, population_size = sample_chunks(
+        ChunkedSource.frame(events, chunksize=7_000), 1_000, strata="country", seed=0
+    )
+    assert population_size == 100_000
+    assert sample["country"].value_counts().to_dict() == {"us": 900, "fr": 100}
+
+
+class AmountsCheck(DataCheck):
+    @sampled_rule(lambda self: events, sample_size=1_000, seed=0)
+    def rule_positive(self, sample, minimum=1):
+        return sample["amount"] < minimum
+
+    @classmethod
+    def check_config(cls):
+        return {"rules_config": {"rule_positive": {"sampling": cls.sampling}}}
+
+    sampling: dict = {}
+
+
+def run(sampling, minimum=1):
+    AmountsCheck.sampling = sampling
+    check = AmountsCheck(rules_params={"rule_positive": {"minimum": minimum}})
+    (result,) = check.run_all()
+    return result
+
+
+def test_sample_without_failures_fails_if_too_small_for_the_rate():
+    # The upper bound of a clean sample of 1,000 rows is about 0.0038
+    assert run({})["status"] == "failure"
+    assert run({"max_failure_rate": 0.01})["status"] == "success"
+    assert run({"sample_size": 10_000})["status"] == "success"
+
+
+def test_failures_above_the_rate_fail():
+    # 5% of the amounts are below 5,001
+    assert run({"max_failure_rate": 0.01}, minimum=5_001)["status"] == "failure"
+    assert run({"max_failure_rate": 0.1}, minimum=5_001)["status"] == "success"
+
+
+def test_validating_all_the_data_is_exact():
+    assert run({"enabled": False, "max_failure_rate": 0.0})["status"] == "success"
+    assert run({"enabled": False}, minimum=2)["status"] == "success"
+    assert run({"enabled": False}, minimum=102)["status"] == "failure"
@@ -0,0 +1,114 @@
+import json
+import numpy as np
+import pandas as pd
+from data_checks.classes.data_check import DataCheck
+from data_checks.profiling.sketches import (
+    CountMinSketch,
+    HyperLogLog,
+    KLLSketch,
+    TopK,
+    sketch_from_dict,
+)
+from data_checks.rules.sketch_assertions import (
+    assert_distinct_between,
+    assert_no_heavy_hitters,
+    assert_quantile_between,
+    assert_stable,
+    assert_uniqueness_ratio,
+)
+
+random = np.random.default_rng(0)
+values = random.integers(0, 50_000, 200_000)
+chunks = np.array_split(values, 4)
+
+
+def merged(new_sketch, chunks):
+    sketch = new_sketch()
+    for chunk in chunks:
+        sketch.merge(new_sketch().update(chunk))
+    return sketch
+
+
+def persisted(sketch):
+    return sketch_from_dict(json.loads(json.dumps(sketch.to_dict())))
+
+
+def test_hyperloglog_estimates_distinct_values():
+    distinct = len(np.unique(values))
+    sketch = merged(HyperLogLog, chunks)
+    assert abs(sketch.estimate() - distinct) / distinct < 0.03
+    assert sketch.count == len(values)
+    assert persisted(sketch).estimate() == sketch.estimate()
+    # Merging is the same as updating with all the values
+    assert sketch.estimate() == HyperLogLog().update(values).estimate()
+    assert HyperLogLog().update([1, 2, 3, None]).count == 3
+
+
+def test_kll_estimates_quantiles():
+    sketch = merged(lambda: KLLSketch(seed=0), chunks)
+    assert sketch.count == len(values)
+    for q in (0.1, 0.5, 0.99):
+        estimate = sketch.quantile(q)
+        assert abs(np.mean(values <= estimate) - q) < 0.02
+    assert abs(sketch.rank(25_000) - np.mean(values <= 25_000)) < 0.02
+    assert persisted(sketch).quantiles([0.1, 0.5]) == sketch.quantiles([0.1, 0.5])
+    assert KLLSketch().quantile(0.5) is None
+
+
+def test_count_min_never_underestimates():
+    sketch = merged(CountMinSketch, chunks)
+    keys, counts = np.unique(values, return_counts=True)
+    estimates = sketch.estimate(keys)
+    assert np.all(estimates >= counts)
+    assert np.mean(estimates - counts) < np.e / sketch.width * len(values)
+    assert np.array_equal(persisted(sketch).estimate(keys), estimates)
+
+
+def test_top_k_finds_heavy_hitters():
+    skewed = np.concatenate([values, np.full(20_000, 7), np.full(10_000, 11)])
+    random.shuffle(skewed)
+    sketch = merged(lambda: TopK(k=5), np.array_split(skewed, 4))
+    top = sketch.top()
+    assert [value for value, _ in top[:2]] == [7, 11]
+    assert top[0][1] >= np.count_nonzero(skewed == 7)
+    assert persisted(sketch).top() == top
+
+
+def test_assertions():
+    sketch = HyperLogLog().update(np.arange(10_000))
+    assert_uniqueness_ratio(sketch, min_ratio=0.97)
+    assert_distinct_between(sketch, min=9_500, max=10_500)
+    assert_quantile_between(KLLSketch().update(np.arange(101)), 0.5, min=45, max=55)
+    assert_no_heavy_hitters(TopK().update(np.arange(1_000)), max_share=0.01)
+    try:
+        assert_uniqueness_ratio(HyperLogLog().update([1] * 100), min_ratio=0.5)
+    except AssertionError as e:
+        assert "uniqueness ratio" in str(e)
+    else:
+        raise AssertionError("A column of duplicates is not unique")
+
+
+ids = []
+
+
+class IdsCheck(DataCheck):
+    def rule_stable_distinct_ids(self):
+        sketch = HyperLogLog().update(pd.Series(ids))
+        assert_stable(self, sketch, lambda ids: ids.estimate(), max_change=0.1)
+
+
+def test_stable_compares_with_the_previous_run():
+    check = IdsCheck()
+
+    def run() -> str:
+        (result,) = check.run_all()
+        return result["status"]
+
+    ids[:] = range(1_000)
+    assert run() == "success"
+    ids[:] = range(1_050)
+    assert run() == "success"
+    ids[:] = range(2_000)
+    assert run() == "failure"
+    # The sketch of the failed run is the new reference
+    assert run() == "success"
@@ -0,0 +1,72 @@
+import subprocess
+import sys
+from hamcrest import greater_than
+from data_checks.base.soft_assertions import SoftAssertions
+from data_checks.classes.data_check import DataCheck
+
+formatted = []
+
+
+def message():
+    formatted.append(True)
+    return "lazy"
+
+
+def test_messages_are_formatted_on_failure_only():
+    soft_assertions = SoftAssertions()
+    assert soft_assertions.expect(True, message)
+    assert formatted == []
+    assert not soft_assertions.expect(False, message)
+    assert not soft_assertions.expect(False, "Value {} is wrong", 3)
+    assert soft_assertions.messages == ["lazy", "Value 3 is wrong"]
+
+
+def test_failures_beyond_the_cap_are_counted():
+    soft_assertions = SoftAssertions(max_failures=2)
+    for value in range(5):
+        soft_assertions.expect_that(value, greater_than(10), "Value {}", value)
+    assert soft_assertions.failures == 5
+    assert len(soft_assertions.messages) == 2
+    assert str(soft_assertions.error()).startswith(
+        "5 soft assertion(s) failed, showing the first 2"
+    )
+    assert SoftAssertions().error() is None
+
+
+class ItemsCheck(DataCheck):
+    @classmethod
+    def check_config(cls):
+        return {"rules_config": {"rule_soft": {"max_soft_failures": 1}}}
+
+    def rule_soft(self):
+        for value in [1, 2, 3]:
+            self.expect(value > 2, "Item {} is too small", value)
+
+    def rule_soft_then_hard(self):
+        self.expect(False, "Item 1 is too small")
+        raise ValueError("Items are unreadable")
+
+
+def test_rules_report_soft_failures():
+    results = {result["rule"]: result for result in ItemsCheck().run_all()}
+    soft = results["rule_soft"]
+    assert soft["status"] == "failure"
+    assert "2 soft assertion(s) failed, showing the first 1" in soft["exception"]
+    assert "Item 2" not in soft["exception"]
+
+    soft_then_hard = results["rule_soft_then_hard"]
+    assert soft_then_hard["status"] == "failure"
+    assert soft_then_hard["exception_type"] == "builtins.ValueError"
+    assert "Items are unreadable" in soft_then_hard["exception"]
+    assert "Item 1 is too small" in soft_then_hard["exception"]
+
+
+def test_checks_do_not_require_hamcrest():
+    # Importing a check with hamcrest missing
+    code = (
+        "import sys; sys.modules['hamcrest'] = None; "
+        "from data_checks.classes.data_check import DataCheck; "
+        "from data_checks.base.soft_assertions import SoftAssertions; "
+        "assert not SoftAssertions().expect(False, 'Fails without hamcrest')"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
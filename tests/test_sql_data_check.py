@@ -0,0 +1,124 @@
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+import pytest
+from sqlalchemy import create_engine, event, text
+from data_checks.classes.sql_data_check import SqlDataCheck
+from data_checks.rules.sql_rules import Freshness, InRange, NotNull, Unique
+
+DIRECTORY = tempfile.mkdtemp()
+DATABASE_URL = f"sqlite:///{os.path.join(DIRECTORY, 'users.db')}"
+QUERIES_FILE = os.path.join(DIRECTORY, "queries")
+engine = create_engine(DATABASE_URL)
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def log_query(connection, cursor, statement, parameters, context, executemany):
+    # Appended to a file to count the queries of the forked rule processes as well
+    with open(QUERIES_FILE, "a") as queries:
+        queries.write(statement.replace("\n", " ") + "\n")
+
+
+def fused_queries() -> int:
+    with open(QUERIES_FILE) as queries:
+        return sum('"0__' in query for query in queries)
+
+
+@pytest.fixture(autouse=True)
+def users():
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE IF EXISTS users"))
+        connection.execute(
+            text("CREATE TABLE users (email TEXT, age INTEGER, created_at TIMESTAMP)")
+        )
+        connection.execute(
+            text(
+                "INSERT INTO users VALUES ('a@x.com', 30, '2023-08-21 10:00:00'), "
+                "('a@x.com', 200, '2023-08-20 10:00:00'), (NULL, 20, NULL)"
+            )
+        )
+    open(QUERIES_FILE, "w").close()
+
+
+class UsersCheck(SqlDataCheck):
+    @classmethod
+    def source(cls):
+        return engine
+
+    @classmethod
+    def sql_rules(cls):
+        return {
+            "users": [
+                NotNull("email"),
+                Unique("email"),
+                InRange("age", min=0, max=150),
+                InRange("age", max=250, name="inrange_age_loose"),
+                Freshness(
+                    "created_at",
+                    max_age=timedelta(days=2),
+                    now=datetime(2023, 8, 22, 10),
+                ),
+            ]
+        }
+
+
+def test_rules_run_in_one_scan():
+    results = {result["rule"]: result for result in UsersCheck().run_all()}
+    assert {rule: result["status"] for rule, result in results.items()} == {
+        "rule_sql_users_notnull_email": "failure",
+        "rule_sql_users_unique_email": "failure",
+        "rule_sql_users_inrange_age": "failure",
+        "rule_sql_users_inrange_age_loose": "success",
+        "rule_sql_users_freshness_created_at": "success",
+    }
+    assert "1 values of age outside of [0, 150]" in results["rule_sql_users_inrange_age"]["exception"]
+    assert fused_queries() == 1
+
+
+def test_asynchronous_run_scans_once():
+    UsersCheck().run_all_async()
+    assert fused_queries() == 1
+
+
+def test_duplicate_rule_names_are_rejected():
+    with pytest.raises(ValueError, match="inrange_age"):
+
+        class DuplicateCheck(SqlDataCheck):
+            @classmethod
+            def sql_rules(cls):
+                return {"users": [InRange("age", min=0), InRange("age", max=10)]}
+
+
+def test_in_range_needs_a_bound():
+    with pytest.raises(ValueError):
+        InRange("age")
+
+
+@pytest.mark.parametrize(
+    "latest, now, fresh",
+    [
+        (datetime(2023, 8, 21, 10), datetime(2023, 8, 22, 10), True),
+        # Naive values are taken as UTC against an aware now, and conversely
+        (
+            datetime(2023, 8, 21, 10),
+            datetime(2023, 8, 23, 11, tzinfo=timezone.utc),
+            False,
+        ),
+        ("2023-08-21 10:00:00+02:00", datetime(2023, 8, 23, 7), True),
+        (
+            datetime(2023, 8, 21, 10, tzinfo=timezone(timedelta(hours=-5))),
+            datetime(2023, 8, 23, 16, tzinfo=timezone.utc),
+            False,
+        ),
+    ],
+)
+def test_freshness_compares_naive_and_aware_timestamps(latest, now, fresh):
+    rule = Freshness("created_at", max_age=timedelta(days=2), now=now)
+    assert (rule.failure_message({"latest": latest}) is None) == fresh
+
+
+def test_freshness_defaults_to_the_current_time_in_the_timezone_of_the_values():
+    rule = Freshness("created_at", max_age=timedelta(hours=1))
+    for latest in (datetime.now(), datetime.now(timezone.utc)):
+        assert rule.failure_message({"latest": latest}) is None
+    assert rule.failure_message({"latest": datetime(2023, 8, 21)}) is not None
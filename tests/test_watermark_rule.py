@@ -0,0 +1,39 @@
+from data_checks.classes.data_check import DataCheck
+from data_checks.rules.watermark_rule import watermark_rule
+
+rows = []
+windows = []
+
+
+class OrdersCheck(DataCheck):
+    @watermark_rule(lambda self: max(rows, default=None), initial=0)
+    def rule_new_orders(self, previous, current):
+        windows.append((previous, current))
+        for row in rows:
+            if previous < row <= current:
+                self.expect(row != 13, "Order {} is invalid", row)
+                assert row != 666, "Order 666 is cursed"
+
+
+def run(check) -> str:
+    (result,) = check.run_all()
+    return result["status"]
+
+
+def test_windows_advance_on_success_only():
+    check = OrdersCheck()
+    windows.clear()
+    rows[:] = [1, 2, 3]
+    assert run(check) == "success"
+    # No new data, the rule is not called
+    assert run(check) == "success"
+    rows.extend([4, 13])
+    assert run(check) == "failure"
+    # The soft failure did not commit the watermark
+    assert run(check) == "failure"
+    rows.remove(13)
+    rows.append(666)
+    assert run(check) == "failure"
+    rows.remove(666)
+    assert run(check) == "success"
+    assert windows == [(0, 3), (3, 13), (3, 13), (3, 666), (3, 4)]